@@ -0,0 +1,82 @@
+# ====== Code Summary ======
+# Benchmark comparing the memory held by queued records: standard `logging.LogRecord` objects built by
+# `logging.Logger.makeRecord` against the `CompactRecord` objects built by the `Logger` level methods.
+# For each record type, it measures with `tracemalloc` the memory allocated by N records kept alive
+# (as in a backlogged asynchronous queue), before and after formatting them, and the build time.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.bench_compact_record
+
+# ====== Imports ======
+# Standard library imports
+import tracemalloc
+import logging
+import time
+import gc
+
+# Internal project imports
+from logger import Formatter, LogLevels
+from logger.record import CompactRecord
+
+# ====== Benchmark Settings ======
+RECORDS = 100_000
+PATHNAME = "/srv/app/services/request_handler.py"
+MSG = "Processing request %d for %s"
+
+STDLIB_LOGGER = logging.getLogger("BenchCompactRecord")
+
+
+def make_stdlib_record(index: int) -> logging.LogRecord:
+    return STDLIB_LOGGER.makeRecord(
+        "Bench", LogLevels.INFO, PATHNAME, 128, MSG, (index, "user"), None, "handle"
+    )
+
+
+def make_compact_record(index: int) -> CompactRecord:
+    return CompactRecord("Bench", LogLevels.INFO, PATHNAME, 128, "handle", MSG, (index, "user"), time.time())
+
+
+def measure(factory) -> tuple[float, float, float]:
+    """
+    Returns the memory in bytes per record before and after formatting, and the build time in µs per record.
+    """
+    formatter = Formatter(
+        identifier="Bench", identifier_max_width=7, filename_lineno_max_width=15, level_max_width=10,
+    )
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = [factory(index) for index in range(RECORDS)]
+    build_time = time.perf_counter() - start
+    built, _ = tracemalloc.get_traced_memory()
+
+    for record in records:
+        formatter.format(record)
+    formatted, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The list itself is the same for both record types
+    return built / RECORDS, formatted / RECORDS, build_time / RECORDS * 1e6
+
+
+def main():
+    results = {
+        "LogRecord": measure(make_stdlib_record),
+        "CompactRecord": measure(make_compact_record),
+    }
+    for name, (built, formatted, build_time) in results.items():
+        print(
+            f"{name:>13}: {built:6.0f} B/record held, {formatted:6.0f} B/record after formatting, "
+            f"built in {build_time:.2f} µs (under tracemalloc)"
+        )
+
+    stdlib_built, stdlib_formatted, _ = results["LogRecord"]
+    compact_built, compact_formatted, _ = results["CompactRecord"]
+    print(
+        f"Memory saved: {1 - compact_built / stdlib_built:.0%} per held record, "
+        f"{1 - compact_formatted / stdlib_formatted:.0%} after formatting"
+    )
+
+
+if __name__ == "__main__":
+    main()
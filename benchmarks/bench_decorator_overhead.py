@@ -0,0 +1,84 @@
+# ====== Code Summary ======
+# Micro-benchmark measuring the overhead added by the `@log` decorator to a trivial function.
+# - "before": legacy path, the logger identifier is resolved by building a new `Logger` on every call.
+# - "after": current path, the logger is resolved once and cached by the decorator.
+# The decorated calls are logged at DEBUG while the logger only emits INFO, so that the measure
+# covers the decorator itself rather than the writing of the log lines (except for the last row).
+#
+# Usage (from the repository root):
+#     python -m benchmarks.bench_decorator_overhead
+
+# ====== Imports ======
+# Standard library imports
+import tempfile
+import timeit
+
+# Internal project imports
+from logger import Logger, LogLevels, log
+from logger.tools import get_function_metadata
+
+# ====== Benchmark Settings ======
+ITERATIONS = 20_000
+LEGACY_ITERATIONS = 500  # Each legacy call builds a Logger (config, directory checks, disk monitor)
+REPEAT = 5
+
+
+class Service:
+    def __init__(self, logger: Logger):
+        self.logger = logger
+
+    @log(lambda self: self.logger)
+    def handle(self, value: int) -> int:
+        return value + 1
+
+
+def main():
+    path = tempfile.mkdtemp()
+    logger = Logger(
+        identifier="Bench",
+        path=path,
+        print_log=False,
+        file_log_level=LogLevels.INFO,
+        files_monitoring=False,
+    )
+
+    def add(value: int) -> int:
+        return value + 1
+
+    def legacy_decorated_add(value: int) -> int:
+        # Reproduces the previous wrapper: a Logger is built for the identifier on every call
+        logger_instance = Logger(
+            identifier="Bench", path=path, follow_logger_manager_rules=True, files_monitoring=False
+        )
+        logger_instance.log(msg=f"{get_function_metadata(add, (value,), {})} called", level=LogLevels.DEBUG)
+        return add(value)
+
+    enabled_logger = Logger(
+        identifier="BenchEnabled",
+        path=path,
+        print_log=False,
+        files_monitoring=False,
+    )
+
+    decorated_by_identifier = log("Bench")(add)
+    decorated_enabled = log(enabled_logger)(add)
+    decorated_by_instance = log(logger)(add)
+    service = Service(logger)
+
+    results = {
+        "undecorated": (lambda: add(1), ITERATIONS),
+        "before (identifier, Logger per call)": (lambda: legacy_decorated_add(1), LEGACY_ITERATIONS),
+        "after (identifier, resolved once)": (lambda: decorated_by_identifier(1), ITERATIONS),
+        "after (Logger instance)": (lambda: decorated_by_instance(1), ITERATIONS),
+        "after (callable, cached per instance)": (lambda: service.handle(1), ITERATIONS),
+        "after (DEBUG enabled, line written)": (lambda: decorated_enabled(1), ITERATIONS),
+    }
+
+    print(f"Decorated call cost (best of {REPEAT}):")
+    for name, (call, iterations) in results.items():
+        elapsed = min(timeit.repeat(call, number=iterations, repeat=REPEAT))
+        print(f"  {name:<38} {elapsed / iterations * 1e6:8.2f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
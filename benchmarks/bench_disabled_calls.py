@@ -0,0 +1,59 @@
+# ====== Code Summary ======
+# Micro-benchmark measuring the cost of a DEBUG call when DEBUG is filtered out by every handler.
+# - "before": legacy path, the caller builds an f-string and the record is created then rejected by the handlers.
+# - "after": current path, `isEnabledFor` rejects the call before any record or message is built.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.bench_disabled_calls
+
+# ====== Imports ======
+# Standard library imports
+import tempfile
+import logging
+import timeit
+
+# Internal project imports
+from logger import Logger, LogLevels
+
+# ====== Benchmark Settings ======
+ITERATIONS = 200_000
+REPEAT = 5
+
+
+def main():
+    logger = Logger(
+        identifier="Bench",
+        path=tempfile.mkdtemp(),
+        print_log=False,
+        file_log_level=LogLevels.INFO,
+        files_monitoring=False,
+    )
+    payload = {"user": 42, "items": list(range(10))}
+
+    def legacy_call():
+        # Reproduces the previous behaviour: logger level forced to DEBUG, message always built
+        logging.Logger.debug(logger.logger, f"Payload received: {payload}", stacklevel=2)
+
+    def lazy_args_call():
+        logger.debug("Payload received: %s", payload)
+
+    def lazy_callable_call():
+        logger.debug(lambda: f"Payload received: {payload}")
+
+    results = {}
+
+    # The legacy path needs the logger itself to accept DEBUG records
+    logger.logger.setLevel(LogLevels.DEBUG)
+    results["before (f-string, record built)"] = min(timeit.repeat(legacy_call, number=ITERATIONS, repeat=REPEAT))
+    logger.logger.setLevel(LogLevels.INFO)
+
+    results["after (%-style args)"] = min(timeit.repeat(lazy_args_call, number=ITERATIONS, repeat=REPEAT))
+    results["after (callable)"] = min(timeit.repeat(lazy_callable_call, number=ITERATIONS, repeat=REPEAT))
+
+    print(f"Disabled DEBUG call cost ({ITERATIONS} calls, best of {REPEAT}):")
+    for name, elapsed in results.items():
+        print(f"  {name:<34} {elapsed / ITERATIONS * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ====== Code Summary ======
+# Benchmark comparing the template-based `Formatter` with the `CompiledFormatter`.
+# Before timing, it checks that both formatters produce byte-for-byte identical output
+# for every log level and color theme, then reports the records/second of each one.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.bench_formatter
+
+# ====== Imports ======
+# Standard library imports
+import logging
+import timeit
+
+# Internal project imports
+from logger import Formatter, CompiledFormatter, LogLevels
+from logger.colors import ClassicColors, DarkModeColors, NeonColors, PastelColors, CyberpunkColors
+
+# ====== Benchmark Settings ======
+ITERATIONS = 100_000
+REPEAT = 5
+THEMES = [None, ClassicColors, DarkModeColors, NeonColors, PastelColors, CyberpunkColors]
+
+
+def make_record(level: LogLevels, created: float = 1_700_000_000.123456):
+    """Builds a record similar to the ones emitted by `Logger`, at a fixed timestamp."""
+    record = logging.LogRecord(
+        name="Bench", level=level, pathname="/srv/app/services/request_handler.py", lineno=128,
+        msg="Processing request %d for %s", args=(42, "user"), exc_info=None, func="handle",
+    )
+    record.created, record.msecs = created, (created - int(created)) * 1000
+    return record
+
+
+def make_formatter(formatter_class: type[Formatter], colors) -> Formatter:
+    return formatter_class(
+        identifier="Bench",
+        identifier_max_width=7,
+        filename_lineno_max_width=15,
+        level_max_width=10,
+        colors=colors,
+    )
+
+
+def check_identical_output() -> None:
+    """Asserts that both formatters render every level and theme identically."""
+    for colors in THEMES:
+        reference = make_formatter(Formatter, colors)
+        compiled = make_formatter(CompiledFormatter, colors)
+        for level in LogLevels:
+            if level is LogLevels.NOTSET:
+                continue
+            expected = reference.format(make_record(level))
+            obtained = compiled.format(make_record(level))
+            assert expected.encode() == obtained.encode(), (expected, obtained)
+
+
+def bench(formatter_class: type[Formatter], colors) -> float:
+    """Returns the number of records formatted per second."""
+    formatter = make_formatter(formatter_class, colors)
+    records = [make_record(LogLevels.INFO) for _ in range(ITERATIONS)]
+
+    def run():
+        for record in records:
+            # Restore the unrendered message so that every run formats from scratch
+            record.msg, record.args, record.filename = "Processing request %d for %s", (42, "user"), "request_handler.py"
+            formatter.format(record)
+
+    return ITERATIONS / min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+
+def main():
+    check_identical_output()
+    print("Output check: Formatter and CompiledFormatter are byte-for-byte identical.")
+
+    for colors in (None, ClassicColors):
+        theme = colors.__name__ if colors else "no colors"
+        classic_rate = bench(Formatter, colors)
+        compiled_rate = bench(CompiledFormatter, colors)
+        print(
+            f"[{theme}] Formatter: {classic_rate:,.0f} rec/s | "
+            f"CompiledFormatter: {compiled_rate:,.0f} rec/s | "
+            f"gain: x{compiled_rate / classic_rate:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# ====== Code Summary ======
+# Benchmark of the log files statistics of `DiskMonitor.get_log_files_info` over a synthetic log directory
+# (several gigabytes by default). It compares:
+# - the former text-mode counting (`sum(1 for _ in f)`, one file after the other),
+# - the binary `readinto` counting with a single thread, then with the thread pool,
+# - the size-only listing used by `clean_logs` (`count_lines=False`),
+# - a second run served by the sidecar index.
+# The page cache is not dropped between runs, so the timings measure the CPU cost of counting.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.bench_line_counting [size in GB] [number of files]
+
+# ====== Imports ======
+# Standard library imports
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# Internal project imports
+from logger.log_index import LogFilesIndex
+from logger.logger_configs import MonitorConfig
+from logger.monitoring import DiskMonitor
+
+# ====== Benchmark Settings ======
+DEFAULT_SIZE_GB = 2.0
+DEFAULT_FILES = 16
+LINE = b"12:00:00.123456 -> [ Bench ] [ handler.py:128]    INFO    | Processing request 4242 for user\n"
+
+
+class SilentLogger:
+    """Stands for the `Logger` of the monitor, which is not needed here."""
+
+    def info(self, msg, *args):
+        pass
+
+    warning = error = info
+
+
+def generate_logs(directory: str, size_gb: float, files: int) -> int:
+    """Writes the synthetic log files and returns the number of lines written."""
+    chunk = LINE * (8 * 1024 * 1024 // len(LINE))
+    file_size = int(size_gb * 1024 ** 3 / files)
+    lines = 0
+    for index in range(files):
+        with open(os.path.join(directory, f"2025-01-{index + 1:02d}.log"), "wb") as log_file:
+            written = 0
+            while written < file_size:
+                log_file.write(chunk)
+                written += len(chunk)
+                lines += chunk.count(b"\n")
+    return lines
+
+
+def count_text_lines(directory: str) -> int:
+    """Former counting: text mode, one line object per line, one file after the other."""
+    total = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if file.endswith(".log"):
+                with open(os.path.join(root, file), "r") as f:
+                    total += sum(1 for _ in f)
+    return total
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    size_gb = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE_GB
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_FILES
+    directory = tempfile.mkdtemp(prefix="logger-bench-")
+    try:
+        expected = generate_logs(directory, size_gb, files)
+        print(f"{files} files, {size_gb:g} GB, {expected:,} lines in {directory}")
+
+        def monitor(max_workers: int, persistent: bool = False) -> DiskMonitor:
+            disk_monitor = DiskMonitor(SilentLogger(), directory, MonitorConfig(log_files_index=persistent))
+            disk_monitor.files_index = LogFilesIndex(directory, persistent=persistent, max_workers=max_workers)
+            return disk_monitor
+
+        def total_lines(summary) -> int:
+            return sum(log_file.line_count for log_file in summary.files)
+
+        runs = [
+            ("text mode, sequential", lambda: count_text_lines(directory)),
+            ("binary readinto, 1 thread", lambda: total_lines(monitor(1).get_log_files_info())),
+            ("binary readinto, thread pool", lambda: total_lines(monitor(8).get_log_files_info())),
+        ]
+        for name, run in runs:
+            duration, lines = timed(run)
+            assert lines == expected, (name, lines, expected)
+            print(f"{name:>30}: {duration:7.3f}s ({size_gb / duration:5.2f} GB/s)")
+
+        duration, _ = timed(lambda: monitor(8).get_log_files_info(count_lines=False))
+        print(f"{'sizes only (count_lines=False)':>30}: {duration:7.3f}s")
+
+        monitor(8, persistent=True).get_log_files_info()  # Builds the index
+        duration, summary = timed(lambda: monitor(8, persistent=True).get_log_files_info())
+        assert total_lines(summary) == expected
+        print(f"{'indexed, unchanged files':>30}: {duration:7.3f}s")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# ====== Code Summary ======
+# Reproducible driver of the logging pipeline with the per-stage latency instrumentation enabled.
+# For every combination of thread count and message size, a fresh `Logger` (colored console output sent
+# to /dev/null, plus a log file) is driven by the threads, then the breakdown of the log calls (caller
+# capture, record creation, dispatch, formatting, timestamp, message, handler write) is printed through
+# `LoggerManager.print_latency_report`.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.bench_pipeline_latency [thread counts] [message sizes] [records per thread] [mode]
+# e.g. `python -m benchmarks.bench_pipeline_latency 1,4,16 64,1024 20000 async`, where the mode is
+# one of "sync" (default), "async" and "compiled".
+
+# ====== Imports ======
+# Standard library imports
+import contextlib
+import threading
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# Internal project imports
+from logger import Logger, LoggerManager, LogLevels
+
+# ====== Benchmark Settings ======
+DEFAULT_THREADS = "1,4"
+DEFAULT_MESSAGE_SIZES = "64,1024"
+DEFAULT_RECORDS_PER_THREAD = 10_000
+MODES = {
+    "sync": {},
+    "async": {"async_logging": True, "async_queue_size": 100_000},
+    "compiled": {"compiled_formatter": True},
+}
+
+
+def parse_list(argument: str) -> list[int]:
+    return [int(value) for value in argument.split(",") if value]
+
+
+def create_logger(identifier: str, directory: str, mode: str) -> Logger:
+    """Creates an instrumented logger whose console handler writes to /dev/null."""
+    devnull = open(os.devnull, "w")  # Kept open: the console handler takes the current `sys.stdout`
+    with contextlib.redirect_stdout(devnull):
+        return Logger(
+            identifier=identifier,
+            path=directory,
+            print_log_level=LogLevels.INFO,
+            file_log_level=LogLevels.INFO,
+            files_monitoring=False,
+            latency_instrumentation=True,
+            **MODES[mode],
+        )
+
+
+def run(logger: Logger, threads: int, message_size: int, records: int) -> float:
+    """Logs `records` messages of `message_size` characters from each thread, returns the duration."""
+    payload = "x" * message_size
+    start_event = threading.Event()
+
+    def worker(index: int):
+        start_event.wait()
+        for sequence in range(records):
+            logger.info("worker %d record %d %s", index, sequence, payload)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    start = time.perf_counter()
+    start_event.set()
+    for worker_thread in workers:
+        worker_thread.join()
+    logger.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    thread_counts = parse_list(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_THREADS)
+    message_sizes = parse_list(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_MESSAGE_SIZES)
+    records = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_RECORDS_PER_THREAD
+    mode = sys.argv[4] if len(sys.argv) > 4 else "sync"
+
+    directory = tempfile.mkdtemp(prefix="logger-bench-")
+    try:
+        for threads in thread_counts:
+            for message_size in message_sizes:
+                identifier = f"Bench-{mode}-t{threads}-m{message_size}"
+                logger = create_logger(identifier, directory, mode)
+                duration = run(logger, threads, message_size, records)
+                total = threads * records
+                print(
+                    f"{identifier}: {total:,} records in {duration:.3f}s "
+                    f"({total / duration:,.0f} records/s)"
+                )
+        print()
+        LoggerManager.print_latency_report()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 # ====== Internal Project Imports ======
 from logger.logger_manager import LoggerManager
-from logger.logger_configs import LoggerConfig
+from logger.logger_configs import LoggerConfig, BackpressurePolicy, FsyncPolicy, CompressionFormat
 
 from logger.logger import Logger
+from logger.collector import LogCollector
+from logger.profiler import SamplingProfiler
+from logger.metrics import MetricsExporter, render_prometheus
 from logger.log_levels import LogLevels
-from logger.formatter import Formatter
+from logger.formatter import Formatter, CompiledFormatter
 
 # ====== Color Theme Imports ======
 import logger.colors as logger_colors
@@ -18,6 +21,8 @@ from logger.colors import (
 
 # ====== Decorator Imports ======
 from logger.decorators import time_tracker, log
+from logger.sampling import Sampler, FixedRateSampler, ProbabilisticSampler, AdaptiveSampler
+from logger.tracing import ChromeTraceExporter, set_trace_exporter, get_current_span
 
 # ====== Logger Analyser ======
 from logger.analyser import LogAnalyser
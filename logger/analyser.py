@@ -2,7 +2,8 @@
 # This script defines a `LogAnalyser` class that reads execution logs from a specified file,
 # extracts function execution times using regular expressions, and plots them using Matplotlib.
 # The script supports filtering execution times for specific function names and reports
-# average execution times.
+# average execution times. Lines emitted by a sampled decorator carry their sampling weight
+# (`[sample weight=N]`), which is used to scale the call counts and averages back up.
 
 # ====== Imports ======
 # Standard library imports
@@ -11,6 +12,24 @@ import re
 # Third-party library imports
 import matplotlib.pyplot as plt
 
+# ====== Constants ======
+# Sampling weight appended by the decorators to the lines of sampled calls
+SAMPLE_WEIGHT_PATTERN = re.compile(r"\[sample weight=([\d.e+]+)\]")
+
+
+def get_sample_weight(line: str) -> float:
+    """
+    Returns the number of calls a log line stands for (1 for lines of unsampled calls).
+
+    Args:
+        line (str): The log line.
+
+    Returns:
+        float: The sampling weight of the line.
+    """
+    match = SAMPLE_WEIGHT_PATTERN.search(line)
+    return float(match.group(1)) if match else 1.0
+
 
 class LogAnalyser:
     """
@@ -29,6 +48,32 @@ class LogAnalyser:
         """
         self.log_file_path = log_file_path
 
+    def get_call_counts(self, func_names: str | list[str] | None = None) -> dict[str, float]:
+        """
+        Estimates the number of calls of the functions decorated with `@log`, scaling the lines of
+        sampled calls by their sampling weight.
+
+        Args:
+            func_names (str | list[str] | None, optional): Function name(s) to filter (regular expressions).
+                If None, all functions are counted.
+
+        Returns:
+            dict[str, float]: Estimated number of calls, keyed by function name.
+        """
+        if isinstance(func_names, str):
+            func_names = [func_names]
+        elif func_names is None:
+            func_names = [".*"]  # Match all functions
+
+        pattern = re.compile(r"\[\S+\] ([\w\.]+)\(.*?\) called")
+        counts = {}
+        with open(self.log_file_path, "r") as log_file:
+            for line in log_file:
+                match = pattern.search(line)
+                if match and any(re.fullmatch(fn, match.group(1)) for fn in func_names):
+                    counts[match.group(1)] = counts.get(match.group(1), 0.0) + get_sample_weight(line)
+        return counts
+
     def analyse_time_tracker(self, func_names: str | list[str] | None = None):
         """
         Analyzes execution times for specified functions and generates a plot.
@@ -67,10 +112,7 @@ class LogAnalyser:
                 if match:
                     function_name, execution_time = match.group(1), match.group(2)
                     if any(re.fullmatch(fn, function_name) for fn in func_names):
-                        if function_name not in times:
-                            times[function_name] = [execution_time]
-                        else:
-                            times[function_name].append(execution_time)
+                        times.setdefault(function_name, []).append((execution_time, get_sample_weight(line)))
 
             if not times:
                 print("No matching execution times found in the log file.")
@@ -79,12 +121,14 @@ class LogAnalyser:
             # Plot the execution times
             plt.figure(figsize=(10, 6))
 
-            for func_name, time_list in times.items():
-                time_list = [float(time) * 1000 for time in time_list]  # Convert seconds to milliseconds
-                average_time = sum(time_list) / len(time_list)
+            for func_name, samples in times.items():
+                time_list = [float(time) * 1000 for time, _ in samples]  # Convert seconds to milliseconds
+                weights = [weight for _, weight in samples]
+                call_count = sum(weights)  # Estimated number of calls, sampled lines included
+                average_time = sum(time * weight for time, weight in zip(time_list, weights)) / call_count
                 plt.plot(
                     time_list,
-                    label=f"{func_name} (Avg: {average_time:.6f} ms)",
+                    label=f"{func_name} (Avg: {average_time:.6f} ms, Calls: {call_count:.0f})",
                     marker="o",
                 )
 
@@ -0,0 +1,172 @@
+# ====== Code Summary ======
+# This module provides a `LogCollector` run by a single aggregator process. Worker processes configured
+# with a `collector_address` send it batches of already formatted log lines (see `CollectorHandler`),
+# which it writes to the file handler of its own logger. The aggregator is therefore the only process
+# writing the log file and running the disk monitoring, and lines from different workers never interleave.
+# With an authkey (`collector_authkey`), only the processes sharing the secret can connect and write lines.
+
+# ====== Imports ======
+# Standard library imports
+from multiprocessing.connection import Listener, Client, Connection
+from multiprocessing import AuthenticationError
+from typing import Optional
+import threading
+import logging
+import stat
+import os
+
+# Internal project imports
+from logger.handlers.collector_handler import BATCH_URGENT, write_formatted_lines
+
+
+# ====== Log Collector ======
+class LogCollector:
+    """
+    Listens on a local address and writes the batches received from worker processes
+    to the log file of an owner logger.
+    """
+
+    def __init__(self, logger, address: str, poll_interval: float = 0.5, authkey: Optional[bytes] = None):
+        """
+        Initializes the collector. The listening socket is only opened by `start`.
+
+        Args:
+            logger (Logger): The logger owning the log file, which must write to a file.
+            address (str): Address to listen on (Unix socket path or Windows named pipe).
+            poll_interval (float, optional): Time in seconds between two checks of the stop event
+                by the connection threads. Defaults to 0.5.
+            authkey (bytes, optional): Secret the workers must share to connect. Defaults to the
+                `collector_authkey` of the logger configuration (None: no authentication).
+
+        Raises:
+            ValueError: If the logger does not write to a file.
+        """
+        self.logger = logger
+        self.address = address
+        self.poll_interval = poll_interval
+        if authkey is None and logger.config.collector_config.collector_authkey is not None:
+            authkey = logger.config.collector_config.collector_authkey.encode("utf-8")
+        self.authkey = authkey
+        self.file_handler = self._get_file_handler(logger)
+
+        self._listener = None
+        self._accept_thread = None
+        self._connection_threads: list[threading.Thread] = []
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def _get_file_handler(logger) -> logging.FileHandler:
+        """Returns the file handler of the owner logger."""
+        for handler in logger._get_output_handlers():
+            if isinstance(handler, logging.FileHandler):
+                return handler
+        raise ValueError(f"Logger '{logger.config.identifier}' does not write to a file")
+
+    # ====== Lifecycle Methods ======
+    def start(self) -> "LogCollector":
+        """
+        Opens the listening socket and starts accepting workers.
+
+        Returns:
+            LogCollector: The collector itself, for chaining.
+
+        Raises:
+            RuntimeError: If another collector is already listening on the address, or if the address
+                is an existing file which is not a socket.
+        """
+        if not self.address.startswith("\\\\") and os.path.exists(self.address):
+            self._remove_stale_socket()
+
+        self._listener = Listener(self.address, authkey=self.authkey)
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="logger-collector", daemon=True)
+        self._accept_thread.start()
+        return self
+
+    def _remove_stale_socket(self) -> None:
+        """
+        Removes the socket file left by a collector that did not exit cleanly, which would make the bind fail.
+        The file is only removed if it is a socket and nothing accepts connections on it anymore.
+
+        Raises:
+            RuntimeError: If the address is not a socket, or if a collector is still listening on it.
+        """
+        # Connecting to a regular file is refused too: it must never be taken for a stale socket
+        if not stat.S_ISSOCK(os.lstat(self.address).st_mode):
+            raise RuntimeError(f"The log collector address '{self.address}' exists and is not a socket")
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except ConnectionRefusedError:
+            os.remove(self.address)  # Nobody listens on it anymore
+            return
+        except AuthenticationError:
+            pass  # A live collector, with another authkey
+        raise RuntimeError(f"A log collector is already listening on '{self.address}'")
+
+    def stop(self) -> None:
+        """Stops accepting workers, waits for the connection threads and flushes the log file."""
+        if self._listener is None:
+            return
+        self._stop_event.set()
+
+        # Wake up the accept loop, blocked until a new worker connects
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, AuthenticationError):
+            pass
+        self._accept_thread.join()
+        self._listener.close()
+        self._listener = None
+
+        for thread in self._connection_threads:
+            thread.join()
+        self.file_handler.flush()
+
+    def __enter__(self) -> "LogCollector":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    # ====== Worker Methods ======
+    def _accept_loop(self) -> None:
+        """Background loop accepting worker connections, each one read by its own thread."""
+        while not self._stop_event.is_set():
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                # Includes the processes which do not know the authkey: they are refused
+                if self._stop_event.is_set():
+                    return
+                continue
+
+            if self._stop_event.is_set():
+                connection.close()
+                return
+
+            thread = threading.Thread(
+                target=self._read_loop, args=(connection,), name="logger-collector-connection", daemon=True
+            )
+            self._connection_threads = [t for t in self._connection_threads if t.is_alive()] + [thread]
+            thread.start()
+
+    def _read_loop(self, connection: Connection) -> None:
+        """
+        Writes the batches received from one worker until it disconnects or the collector stops.
+
+        Args:
+            connection (Connection): The connection to the worker.
+        """
+        with connection:
+            while True:
+                try:
+                    if not connection.poll(self.poll_interval):
+                        if self._stop_event.is_set():
+                            return
+                        continue
+                    message = connection.recv_bytes()
+                except (OSError, EOFError):
+                    return
+
+                write_formatted_lines(
+                    self.file_handler, message[1:], urgent=message[:1] == BATCH_URGENT
+                )
@@ -1,72 +1,384 @@
 # ====== Code Summary ======
 # This module provides logging and time-tracking decorators to enhance function/method monitoring.
+# Decorators only log at or above the `decorator_log_level` of their logger. The description of the
+# function is computed once, when it is decorated, and the call is only rendered if a handler emits it.
+# In aggregating mode, `time_tracker` logs periodic summaries instead of one line per call.
+#
+# Coroutine functions, async generators and generators are logged and timed when they actually run
+# (not when they are created), with their running and suspended times. `time_tracker` can also time
+# a code block with `with time_tracker(...)` or `async with time_tracker(...)`.
+#
+# A `Sampler` may limit the number of logged calls of hot functions. It is asked first, so that skipped
+# calls never build their message, and emitted lines record their sampling weight.
+#
+# With `trace=True`, nested `time_tracker` calls are traced as spans (see `logger.tracing`): each line
+# records its span id, parent id, depth, inclusive and exclusive times.
 
 # ====== Imports ======
 # Standard library imports
-from typing import Callable
+from typing import Callable, Optional
 from functools import wraps
+import contextvars
+import inspect
 import time
+import sys
+import os
 
 # Internal project imports
 from logger.logger import Logger
 from logger.log_levels import LogLevels
-from logger.tools import get_function_metadata, get_logger_from_decorator_param
+from logger.tools import FunctionMetadata, FunctionCallMessage, DecoratorLoggerResolver
+from logger.timing_stats import FunctionTimingStats, get_timing_aggregator
+from logger.execution_timing import ExecutionTiming, StepTimedAwaitable, time_generator
+from logger.sampling import Sampler, format_sample_weight
+from logger.tracing import Span, start_span, finish_span
 
+# ====== Type Hints ======
+# Called when the decorated function starts running, returns the callback receiving its timing (if timed)
+OnCall = Callable[[tuple, dict], Optional[Callable[[ExecutionTiming], None]]]
 
-# ====== Decorators ======
-def time_tracker(param_logger: Logger | str | Callable = None):
+# ====== Context Variables ======
+# Code blocks timed in the current context, innermost last: (tracker, on_finish callback, timing).
+# A single variable is shared by every tracker, since context variables are never garbage collected.
+_block_starts: contextvars.ContextVar[tuple] = contextvars.ContextVar("time_tracker_block_starts", default=())
+
+
+# ====== Functions ======
+def _wrap_execution(func: Callable, on_call: OnCall) -> Callable:
     """
-    Decorator to measure and log the execution time of a function/method.
+    Wraps a function, coroutine function, async generator function or generator function so that
+    `on_call` is called when its body actually starts running, and its timing is reported at the end.
 
     Args:
-        param_logger (Logger | str | Callable, optional): Logger instance, identifier, or callable returning a logger.
+        func (Callable): The function to wrap.
+        on_call (OnCall): Called with the call arguments. Returns the callback receiving the timing,
+            or None if the execution must not be timed.
 
     Returns:
-        Callable: The wrapped function.
+        Callable: The wrapped function, of the same kind as `func`.
     """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            on_finish = on_call(args, kwargs)
+            if on_finish is None:
+                return await func(*args, **kwargs)
 
-    def decorator(func: Callable):
+            timing = ExecutionTiming(steps_tracked=True)
+            try:
+                return await StepTimedAwaitable(func(*args, **kwargs), timing)
+            finally:
+                timing.stop()
+                on_finish(timing)
+
+    elif inspect.isasyncgenfunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            on_finish = on_call(args, kwargs)
+            timing = None if on_finish is None else ExecutionTiming(steps_tracked=True)
+            generator = func(*args, **kwargs)
+            try:
+                # Async generators cannot `yield from`: items, sent values and exceptions are forwarded
+                value, error = None, None
+                while True:
+                    step = generator.asend(value) if error is None else generator.athrow(error)
+                    error = None
+                    try:
+                        item = await (step if timing is None else StepTimedAwaitable(step, timing))
+                    except StopAsyncIteration:
+                        return
+                    try:
+                        value = yield item
+                    except GeneratorExit:
+                        raise
+                    except BaseException as exception:
+                        value, error = None, exception
+            finally:
+                try:
+                    await generator.aclose()
+                finally:
+                    if on_finish is not None:
+                        timing.stop()
+                        on_finish(timing)
+
+    elif inspect.isgeneratorfunction(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger_instance = get_logger_from_decorator_param(param_logger, args)
-            if logger_instance is None:
-                raise ValueError("[time_tracker] A logger must be specified via param_logger.")
+            on_finish = on_call(args, kwargs)
+            if on_finish is None:
+                return (yield from func(*args, **kwargs))
 
-            start_time = time.perf_counter()
+            timing = ExecutionTiming(steps_tracked=True)
+            try:
+                return (yield from time_generator(func(*args, **kwargs), timing))
+            finally:
+                timing.stop()
+                on_finish(timing)
+
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            on_finish = on_call(args, kwargs)
+            if on_finish is None:
+                return func(*args, **kwargs)
+
+            timing = ExecutionTiming()
             try:
                 return func(*args, **kwargs)
             finally:
-                elapsed_time = time.perf_counter() - start_time
-                log_message = f"{get_function_metadata(func, args, kwargs)} executed in {elapsed_time:.6f}s"
-                logger_instance.debug(log_message)
+                timing.stop()
+                on_finish(timing)
 
-        return wrapper
+    return wrapper
 
-    return decorator
 
+# ====== Time Tracker ======
+class TimeTracker:
+    """
+    Decorator and (async) context manager measuring and logging execution times, returned by `time_tracker`.
+    """
+
+    def __init__(
+            self,
+            param_logger: Logger | str | Callable = None,
+            aggregate: bool = False,
+            summary_interval: float = 60.0,
+            name: Optional[str] = None,
+            label: str = "code block",
+            sampler: Optional[Sampler] = None,
+            trace: bool = False,
+    ):
+        """
+        Args:
+            param_logger (Logger | str | Callable, optional): Logger instance, identifier, or callable returning
+                a logger. Code blocks require a logger instance or an identifier.
+            aggregate (bool, optional): Log periodic summaries instead of one line per call. Defaults to False.
+            summary_interval (float, optional): Time in seconds between two summaries. Defaults to 60.0.
+            name (str, optional): Name of the timed code block. Defaults to `label`.
+            label (str, optional): Default name of the timed code block (its location).
+            sampler (Sampler, optional): Limits the number of logged calls. Each decorated function (and the
+                code block) uses its own copy. Not used in aggregating mode, which records every call.
+            trace (bool, optional): Trace the timed calls as nested spans. Defaults to False.
+
+        Raises:
+            ValueError: If the summary interval is not positive in aggregating mode.
+        """
+        if aggregate and not summary_interval > 0:
+            raise ValueError(f"The summary interval must be positive, got {summary_interval}")
+        self.param_logger = param_logger
+        self.sampler = None if aggregate else sampler
+        self.aggregate = aggregate
+        self.summary_interval = summary_interval
+        self.trace = trace
+        self.name = f"[{name or label}]"
+
+        self._resolve_logger = DecoratorLoggerResolver(param_logger)
+        self._block_stats: Optional[FunctionTimingStats] = None
+        self._block_sampler = None if self.sampler is None else self.sampler.spawn()
+
+    # ====== Decorator Methods ======
+    @staticmethod
+    def _get_on_finish(
+            logger_instance: Logger,
+            stats: Optional[FunctionTimingStats],
+            describe: Callable[[ExecutionTiming], object],
+    ) -> Callable[[ExecutionTiming], None]:
+        """
+        Returns the callback reporting a timing.
+
+        Args:
+            logger_instance (Logger): The logger of the decorator.
+            stats (FunctionTimingStats | None): The statistics receiving the timing in aggregating mode.
+            describe (Callable[[ExecutionTiming], object]): Builds the log message of a timing otherwise.
+
+        Returns:
+            Callable[[ExecutionTiming], None]: The callback logging or aggregating a timing.
+        """
+        if stats is not None:
+            if stats.logger is None:
+                # The summaries are logged through the first resolved logger
+                stats.logger = logger_instance
+                get_timing_aggregator().register(stats)
+            return lambda timing: stats.record(timing.elapsed)
+        return lambda timing: logger_instance.debug(describe(timing))
 
-def log(param_logger: Logger | str | Callable = None, log_level: LogLevels = LogLevels.DEBUG):
+    @staticmethod
+    def _finish_with_span(
+            on_finish: Callable[[ExecutionTiming], None], span: Optional[Span]
+    ) -> Callable[[ExecutionTiming], None]:
+        """Returns a callback finishing a span (if any) before reporting a timing."""
+        if span is None:
+            return on_finish
+
+        def finish(timing: ExecutionTiming) -> None:
+            finish_span(span)
+            on_finish(timing)
+
+        return finish
+
+    def __call__(self, func: Callable) -> Callable:
+        metadata = FunctionMetadata(func)
+        stats = FunctionTimingStats(metadata.prefix, self.summary_interval) if self.aggregate else None
+        sampler = None if self.sampler is None else self.sampler.spawn()
+        # Generators share the context of their consumer: their span must not become the current one
+        activate_span = not (inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func))
+
+        def on_call(args: tuple, kwargs: dict):
+            logger_instance = self._resolve_logger(args)
+            if logger_instance is None:
+                raise ValueError("[time_tracker] A logger must be specified via param_logger.")
+            if not logger_instance.is_decorator_log_enabled(LogLevels.DEBUG):
+                return None
+            weight = 1 if sampler is None else sampler.sample()
+            if not weight:
+                return None
+
+            span = start_span(metadata.prefix, activate_span) if self.trace else None
+            return self._finish_with_span(self._get_on_finish(
+                logger_instance, stats,
+                lambda timing: FunctionCallMessage(
+                    metadata, args, kwargs,
+                    timing.describe() + ("" if span is None else span.describe()) + format_sample_weight(weight)
+                )
+            ), span)
+
+        return _wrap_execution(func, on_call)
+
+    # ====== Context Manager Methods ======
+    def _start_block(self) -> None:
+        """Starts timing a code block, unless its log would be filtered out."""
+        if not isinstance(self.param_logger, (Logger, str)):
+            raise ValueError("[time_tracker] A logger instance or identifier is required to time a code block.")
+
+        logger_instance = self._resolve_logger(())
+        on_finish = None
+        if logger_instance.is_decorator_log_enabled(LogLevels.DEBUG):
+            weight = 1 if self._block_sampler is None else self._block_sampler.sample()
+            if self.aggregate and self._block_stats is None:
+                self._block_stats = FunctionTimingStats(self.name, self.summary_interval)
+            if weight:
+                span = start_span(self.name) if self.trace else None
+                on_finish = self._finish_with_span(self._get_on_finish(
+                    logger_instance, self._block_stats,
+                    lambda timing: (
+                        self.name + timing.describe() + ("" if span is None else span.describe())
+                        + format_sample_weight(weight)
+                    )
+                ), span)
+
+        # Blocks may be nested or entered concurrently by several threads or tasks
+        _block_starts.set(_block_starts.get() + ((self, on_finish, ExecutionTiming()),))
+
+    def _end_block(self) -> None:
+        """Stops timing the innermost code block of this tracker entered in the current context and reports it."""
+        starts = _block_starts.get()
+        index = next(index for index in range(len(starts) - 1, -1, -1) if starts[index][0] is self)
+        _, on_finish, timing = starts[index]
+        _block_starts.set(starts[:index] + starts[index + 1:])
+        if on_finish is not None:
+            timing.stop()
+            on_finish(timing)
+
+    def __enter__(self) -> "TimeTracker":
+        self._start_block()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._end_block()
+
+    async def __aenter__(self) -> "TimeTracker":
+        self._start_block()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self._end_block()
+
+
+# ====== Decorators ======
+def time_tracker(
+        param_logger: Logger | str | Callable = None,
+        aggregate: bool = False,
+        summary_interval: float = 60.0,
+        name: Optional[str] = None,
+        sampler: Optional[Sampler] = None,
+        trace: bool = False,
+) -> TimeTracker:
+    """
+    Decorator to measure and log the execution time of a function/method. Coroutine functions, async
+    generators and generators are timed from their first to their last step, with their running and
+    suspended times. It can also time a code block: `with time_tracker(logger, name="load"):`
+    (or `async with`), in which case only the total time is reported.
+
+    Args:
+        param_logger (Logger | str | Callable, optional): Logger instance, identifier, or callable returning a logger.
+        aggregate (bool, optional): Instead of one line per call, keep the execution times in memory and
+            log a summary (count, min, mean, max, p50, p90, p99, p999) every `summary_interval` seconds
+            and at exit. Defaults to False.
+        summary_interval (float, optional): Time in seconds between two summaries in aggregating mode.
+            Defaults to 60.0.
+        name (str, optional): Name of the timed code block. Defaults to its file and line.
+        sampler (Sampler, optional): Limits the number of logged calls (e.g. `FixedRateSampler(100)`).
+            Not used in aggregating mode. Defaults to None (every call is logged).
+        trace (bool, optional): Trace the timed calls as nested spans, across threads and asyncio tasks.
+            Each line records its span id, parent id, depth, inclusive and exclusive times, and finished
+            spans are sent to the exporter set with `set_trace_exporter`. Defaults to False.
+
+    Returns:
+        TimeTracker: The decorator, also usable as a context manager.
+
+    Raises:
+        ValueError: If the summary interval is not positive in aggregating mode.
+    """
+    caller = sys._getframe(1)
+    return TimeTracker(
+        param_logger,
+        aggregate=aggregate,
+        summary_interval=summary_interval,
+        name=name,
+        label=f"{os.path.basename(caller.f_code.co_filename)}:{caller.f_lineno}",
+        sampler=sampler,
+        trace=trace,
+    )
+
+
+def log(
+        param_logger: Logger | str | Callable = None,
+        log_level: LogLevels = LogLevels.DEBUG,
+        sampler: Optional[Sampler] = None,
+):
     """
-    Decorator to log function/method calls at a specified log level.
+    Decorator to log function/method calls at a specified log level. Coroutine functions, async generators
+    and generators are logged when they start running.
 
     Args:
         param_logger (Logger | str | Callable, optional): Logger instance, identifier, or callable returning a logger.
         log_level (LogLevels, optional): Logging level. Defaults to LogLevels.DEBUG.
+        sampler (Sampler, optional): Limits the number of logged calls (e.g. `AdaptiveSampler(100)`).
+            Each decorated function uses its own copy. Defaults to None (every call is logged).
 
     Returns:
         Callable: The wrapped function.
     """
 
     def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            logger_instance = get_logger_from_decorator_param(param_logger, args)
+        resolve_logger = DecoratorLoggerResolver(param_logger)
+        metadata = FunctionMetadata(func)
+        function_sampler = None if sampler is None else sampler.spawn()
+
+        def on_call(args: tuple, kwargs: dict) -> None:
+            logger_instance = resolve_logger(args)
             if logger_instance is None:
                 raise ValueError("[log] A logger must be specified via param_logger.")
 
-            logger_instance.log(msg=f"{get_function_metadata(func, args, kwargs)} called", level=log_level)
-            return func(*args, **kwargs)
+            if logger_instance.is_decorator_log_enabled(log_level):
+                weight = 1 if function_sampler is None else function_sampler.sample()
+                if weight:
+                    logger_instance.log(
+                        msg=FunctionCallMessage(metadata, args, kwargs, " called" + format_sample_weight(weight)),
+                        level=log_level,
+                    )
+            return None
 
-        return wrapper
+        return _wrap_execution(func, on_call)
 
     return decorator
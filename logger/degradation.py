@@ -0,0 +1,168 @@
+# ====== Code Summary ======
+# This module provides a `DiskPressureGuard` degrading the logging pipeline of a `Logger` on its own when the
+# disk fills up, and restoring it once space is recovered:
+# - above the alert threshold (`disk_alert_threshold_percent`), the file level is raised
+#   (`degraded_file_log_level`), the file output continues in a gzip stream (`YYYY-MM-DD.log.gz`)
+#   and an incremental log cleanup is started in the background,
+# - below the restore threshold (`disk_restore_threshold_percent`), the original file handlers
+#   and levels are put back.
+# The gap between both thresholds keeps the pipeline from switching back and forth. The disk usage is
+# cached: `poll` is called for every record but only compares a timestamp, the `shutil.disk_usage` call
+# happens at most once per check interval.
+
+# ====== Imports ======
+# Standard library imports
+from typing import Optional
+import threading
+import logging
+import shutil
+import time
+
+# Internal project imports
+from logger.handlers import CompressedFileHandler
+
+# Used to avoid circular imports and keep type hints
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logger.logger import Logger
+
+
+# ====== Disk Pressure Guard ======
+class DiskPressureGuard:
+    """
+    Switches the file output of a logger between its normal and degraded modes, based on a cached disk usage.
+    """
+
+    def __init__(
+            self,
+            logger: "Logger",
+            high_watermark: float,
+            low_watermark: float,
+            degraded_level: int,
+            compress: bool = True,
+            check_interval: float = 5.0,
+    ):
+        """
+        Args:
+            logger (Logger): The logger to degrade.
+            high_watermark (float): Disk usage ratio entering the degraded mode.
+            low_watermark (float): Disk usage ratio leaving the degraded mode.
+            degraded_level (int): Minimum level of the file records in degraded mode.
+            compress (bool, optional): Continue the file output in a gzip stream in degraded mode. Defaults to True.
+            check_interval (float, optional): Minimum time in seconds between two disk usage checks. Defaults to 5.0.
+        """
+        self.logger = logger
+        self.high_watermark = high_watermark
+        self.low_watermark = min(low_watermark, high_watermark)
+        self.degraded_level = degraded_level
+        self.compress = compress
+        self.check_interval = check_interval
+        self.degraded = False
+        self.usage_ratio: Optional[float] = None  # Last measured disk usage
+
+        self._next_check = 0.0
+        self._check_lock = threading.Lock()
+        self._restore_thread: Optional[threading.Thread] = None
+        # Original file handlers and levels, replaced while degraded: (original, replacement, original level)
+        self._replaced: list[tuple[logging.Handler, logging.Handler, int]] = []
+
+    # ====== Check Methods ======
+    def poll(self) -> None:
+        """Checks the disk usage if the check interval has elapsed. Cheap enough to be called for every record."""
+        if time.monotonic() < self._next_check:
+            return
+        # A single thread checks, the others carry on with the current mode
+        if not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() >= self._next_check:
+                self._next_check = time.monotonic() + self.check_interval
+                self.check()
+        finally:
+            self._check_lock.release()
+
+    def check(self) -> None:
+        """Measures the disk usage and switches mode if a watermark is crossed."""
+        try:
+            total, used, _ = shutil.disk_usage(self.logger.config.path)
+        except OSError:
+            return  # The log directory is unavailable: keep the current mode until the next check
+        self.usage_ratio = used / total
+
+        if not self.degraded and self.usage_ratio >= self.high_watermark:
+            self.degrade()
+        elif self.degraded and self.usage_ratio < self.low_watermark:
+            self.restore()
+
+    def _restore_loop(self) -> None:
+        """Background loop checking the disk usage every check interval while degraded."""
+        while self.degraded:
+            time.sleep(self.check_interval)
+            with self._check_lock:
+                if self.degraded:
+                    self._next_check = time.monotonic() + self.check_interval
+                    self.check()
+
+    # ====== Mode Methods ======
+    def degrade(self) -> None:
+        """Raises the file level, compresses the file output and starts an incremental cleanup."""
+        self.degraded = True
+        compressed_path = None
+        for handler in self.logger.get_file_handlers():
+            original_level = handler.level
+            replacement = handler
+            if self.compress and not isinstance(handler, CompressedFileHandler):
+                compressed_path = self.logger.config.full_path + ".gz"
+                replacement = CompressedFileHandler(compressed_path)
+                replacement.setFormatter(handler.formatter)
+                handler.flush()
+                self.logger.replace_output_handler(handler, replacement)
+            replacement.setLevel(max(original_level, self.degraded_level))
+            self._replaced.append((handler, replacement, original_level))
+        self.logger.refresh_levels()
+
+        self.logger.warning(
+            f"[disk pressure] Disk usage at {self.usage_ratio * 100:.1f}% "
+            f"(threshold {self.high_watermark * 100:.0f}%): file level raised to "
+            f"{logging.getLevelName(self.degraded_level)}"
+            + (f", file output compressed to {compressed_path}" if compressed_path else "")
+            + "."
+        )
+
+        # Fewer records reach the guard once degraded: the way back is watched by a thread of its own,
+        # the one of a previous degradation keeps going if it has not exited yet
+        if self._restore_thread is None or not self._restore_thread.is_alive():
+            self._restore_thread = threading.Thread(
+                target=self._restore_loop, name="logger-disk-pressure", daemon=True
+            )
+            self._restore_thread.start()
+
+        disk_monitor = getattr(self.logger, "disk_monitor", None)
+        if disk_monitor is not None:
+            threading.Thread(
+                target=disk_monitor.clean_logs,
+                kwargs={"max_deletions": disk_monitor.max_deletions_per_check, "verbose": False},
+                name="logger-pressure-cleanup",
+                daemon=True,
+            ).start()
+
+    def restore(self) -> None:
+        """
+        Puts the original file handlers and levels back. Each replacement handler is swapped out before
+        being closed, under its lock, so that a record being written to it by another thread completes first.
+        """
+        self.degraded = False
+        replaced, self._replaced = self._replaced, []
+        for handler, replacement, original_level in replaced:
+            handler.setLevel(original_level)
+            if replacement is not handler:
+                self.logger.replace_output_handler(replacement, handler)
+                with replacement.lock:
+                    replacement.close()
+        self.logger.refresh_levels()
+
+        self.logger.info(
+            f"[disk pressure] Disk usage back to {self.usage_ratio * 100:.1f}% "
+            f"(below {self.low_watermark * 100:.0f}%): file logging restored."
+        )
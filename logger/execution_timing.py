@@ -0,0 +1,131 @@
+# ====== Code Summary ======
+# This module measures the real execution of coroutines, async generators and generators, which only
+# start running after the decorated function returned them. Each step (from a resume to the next
+# suspension) is timed, so that the total duration is split into:
+# - running: time spent executing the body,
+# - suspended: time spent waiting (awaited I/O for coroutines, the consumer for generators).
+# - `ExecutionTiming`: Durations of one execution.
+# - `StepTimedAwaitable`: Awaitable driving another awaitable step by step.
+# - `time_generator`: Generator forwarding every item, sent value and exception of another generator.
+
+# ====== Imports ======
+# Standard library imports
+from typing import Any, Awaitable, Generator
+import time
+
+
+# ====== Execution Timing ======
+class ExecutionTiming:
+    """
+    Durations of one execution. `running` is only tracked for coroutines and generators.
+    """
+    __slots__ = ("start", "end", "running", "steps_tracked")
+
+    def __init__(self, steps_tracked: bool = False):
+        """
+        Args:
+            steps_tracked (bool, optional): Whether the running time is measured step by step. Defaults to False.
+        """
+        self.start = time.perf_counter()
+        self.end = None
+        self.running = 0.0
+        self.steps_tracked = steps_tracked
+
+    def stop(self) -> None:
+        """Marks the end of the execution."""
+        self.end = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Total duration of the execution, in seconds."""
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def suspended(self) -> float:
+        """Time spent suspended between two steps, in seconds."""
+        return max(0.0, self.elapsed - self.running)
+
+    def describe(self) -> str:
+        """Returns the description of the durations appended to the log message."""
+        if not self.steps_tracked:
+            return f" executed in {self.elapsed:.6f}s"
+        return (
+            f" executed in {self.elapsed:.6f}s "
+            f"(running {self.running:.6f}s, suspended {self.suspended:.6f}s)"
+        )
+
+
+class StepTimedAwaitable:
+    """
+    Awaitable forwarding another awaitable, and adding the duration of each of its steps to a timing.
+    """
+    __slots__ = ("awaitable", "timing")
+
+    def __init__(self, awaitable: Awaitable, timing: ExecutionTiming):
+        """
+        Args:
+            awaitable (Awaitable): The awaitable to drive (coroutine, `asend`/`athrow` of an async generator...).
+            timing (ExecutionTiming): The timing receiving the running time.
+        """
+        self.awaitable = awaitable
+        self.timing = timing
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self.awaitable.__await__()
+        value, error = None, None
+        while True:
+            step_start = time.perf_counter()
+            try:
+                if error is None:
+                    yielded = iterator.send(value)
+                else:
+                    yielded = iterator.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.timing.running += time.perf_counter() - step_start
+                error = None
+
+            try:
+                value = yield yielded
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as exception:  # Cancellation and errors are forwarded to the awaitable
+                value, error = None, exception
+
+
+# ====== Generators ======
+def time_generator(generator: Generator, timing: ExecutionTiming) -> Generator:
+    """
+    Forwards the items, sent values and exceptions of a generator, adding the duration of each step to a timing.
+
+    Args:
+        generator (Generator): The generator to forward.
+        timing (ExecutionTiming): The timing receiving the running time.
+
+    Returns:
+        Generator: A generator behaving as the original one, returning its return value.
+    """
+    value, error = None, None
+    while True:
+        step_start = time.perf_counter()
+        try:
+            if error is None:
+                item = generator.send(value)
+            else:
+                item = generator.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            timing.running += time.perf_counter() - step_start
+            error = None
+
+        try:
+            value = yield item
+        except GeneratorExit:
+            generator.close()
+            raise
+        except BaseException as exception:
+            value, error = None, exception
+
@@ -6,13 +6,16 @@
 
 # ====== Imports ======
 # Standard library imports
+from typing import Callable, Optional
 import logging
 import datetime
+import time
 
 # Internal project imports
-from logger.tools import center_and_limit
+from logger.tools import center_and_limit, BoundedCache
 from logger.log_levels import LogLevels
 from logger.colors import BaseColors
+from logger.metrics import HandlerMetrics
 
 
 # ====== Class Part ======
@@ -20,8 +23,35 @@ class TimeFormatter(logging.Formatter):
     """
     Intermediate class that properly handles %f to display milliseconds with 3 digits.
     Retains the '.' as a separator.
+
+    Rendered timestamps are cached per second: while `int(record.created)` does not change,
+    only the sub-second part is rendered again. The cache is a single tuple replaced
+    atomically, so concurrent handlers never read a half-updated entry.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, date_format, rendered segments) of the last rendered second
+        self._time_cache: tuple[int | None, str | None, tuple[str, ...]] = (None, None, ())
+
+    def _render_second(self, second: int, date_format: str | None) -> tuple[str, ...]:
+        """
+        Renders everything in the timestamp that only depends on the second.
+
+        Args:
+            second (int): Timestamp truncated to the second.
+            date_format (str, optional): The date format string.
+
+        Returns:
+            tuple[str, ...]: For formats containing %f, the rendered text around each %f.
+                Otherwise, a single element holding the rendered second.
+        """
+        if date_format and "%f" in date_format:
+            t = datetime.datetime.fromtimestamp(second)
+            return tuple(t.strftime(segment) for segment in date_format.split("%f"))
+
+        return (time.strftime(date_format or self.default_time_format, self.converter(second)),)
+
     def formatTime(self, record: logging.LogRecord, date_format: str = None) -> str:
         """
         Formats the timestamp of a log record.
@@ -33,13 +63,33 @@ class TimeFormatter(logging.Formatter):
         Returns:
             str: Formatted timestamp.
         """
-        t = datetime.datetime.fromtimestamp(record.created)
+        created = record.created
+        second = int(created)
 
         if date_format and "%f" in date_format:
-            # Convert microseconds to milliseconds (3 digits)
-            return t.strftime(date_format).replace("%f", f"{record.msecs:03.0f}")
-
-        return super().formatTime(record, date_format)
+            if "%%" in date_format:
+                # Escaped percent signs make splitting on %f ambiguous, render without cache
+                t = datetime.datetime.fromtimestamp(created)
+                return t.strftime(date_format).replace("%f", f"{record.msecs:03.0f}")
+
+            # Same rounding as `datetime.fromtimestamp`, which may carry over to the next second
+            microseconds = round((created - second) * 1e6)
+            if microseconds >= 1_000_000:
+                second += 1
+                microseconds -= 1_000_000
+        else:
+            microseconds = None
+
+        cached_second, cached_format, segments = self._time_cache
+        if cached_second != second or cached_format != date_format:
+            segments = self._render_second(second, date_format)
+            self._time_cache = (second, date_format, segments)
+
+        if microseconds is not None:
+            return f"{microseconds:06d}".join(segments)
+        if date_format:
+            return segments[0]
+        return self.default_msec_format % (segments[0], record.msecs)
 
 
 class Formatter(TimeFormatter):
@@ -57,6 +107,7 @@ class Formatter(TimeFormatter):
             filename_lineno_max_width: int,
             level_max_width: int,
             colors: type[BaseColors] = None,
+            filename_cache_size: int = 1024,
     ):
         """
         Initializes the Formatter with specified settings.
@@ -67,6 +118,8 @@ class Formatter(TimeFormatter):
             filename_lineno_max_width (int): Max width for filename + line number.
             level_max_width (int): Max width for log level.
             colors (BaseColors, optional): Color settings. Defaults to None.
+            filename_cache_size (int, optional): Number of call sites whose truncated filename is cached.
+                Defaults to 1024.
         """
         self.identifier = identifier
         self.truncated_identifier = center_and_limit(identifier, identifier_max_width)
@@ -75,6 +128,10 @@ class Formatter(TimeFormatter):
         self.colors = colors
         self.evaluated_log_level = self._evaluate_log_level()
         self.date_format = "%H:%M:%S.%f"
+        # Truncated filenames, keyed by call site (source path and line number)
+        self.filename_cache = BoundedCache(filename_cache_size)
+        # Counters of the handler using this formatter, if the pipeline metrics are enabled
+        self.metrics: Optional[HandlerMetrics] = None
 
         # Create custom format for the logger
         fmt = self._get_fmt()
@@ -149,43 +206,189 @@ class Formatter(TimeFormatter):
         """
         return self.evaluated_log_level.get(level, f"ERROR UNKNOWN LOG LEVEL [{level}]")
 
-    def _get_dynamic_message(self, message: str) -> str:
+    def _get_dynamic_filename(self, filename: str, lineno: str) -> str:
         """
-        Applies color formatting to the log message if enabled.
+        Truncates filename if necessary to fit within max width constraints.
 
         Args:
-            message (str): Log message.
+            filename (str): Filename of the log origin.
+            lineno (str): Line number as a string.
 
         Returns:
-            str: Formatted message.
+            str: Adjusted filename.
         """
-        return f"{self.colors.MESSAGE}{message}{self.colors.RESET_ALL}" if self.colors else message
+        width_limit = self.filename_lineno_max_width - len(lineno)
+        return center_and_limit(text=filename, width=width_limit)
 
-    def _get_dynamic_filename(self, filename: str, lineno: str) -> str:
+    def _get_cached_filename(self, record: logging.LogRecord, lineno: str) -> str:
         """
-        Truncates filename if necessary to fit within max width constraints.
+        Returns the truncated filename of the record call site, computing it only once per call site.
 
         Args:
-            filename (str): Filename of the log origin.
+            record (logging.LogRecord): The log record.
             lineno (str): Line number as a string.
 
         Returns:
             str: Adjusted filename.
         """
-        width_limit = self.filename_lineno_max_width - len(lineno)
-        return center_and_limit(text=filename, width=width_limit)
+        key = (record.pathname, record.lineno)
+        filename = self.filename_cache.get(key)
+        if filename is None:
+            filename = self._get_dynamic_filename(record.filename, lineno)
+            self.filename_cache.set(key, filename)
+        return filename
+
+    @staticmethod
+    def _render_message(record: logging.LogRecord) -> str:
+        """
+        Renders the message of a record, evaluating lazy messages and applying %-style arguments.
+        The rendered message is stored back on the record so that it is only computed once,
+        even when several handlers format the same record.
+
+        Args:
+            record (logging.LogRecord): The log record whose message is rendered.
+
+        Returns:
+            str: The rendered message.
+        """
+        msg = record.msg
+        if callable(msg):
+            msg = msg()
+        message = str(msg)
+        if record.args:
+            message = message % record.args
+
+        record.msg, record.args = message, None
+        return message
+
+    def _append_exception_info(self, record: logging.LogRecord, formatted: str) -> str:
+        """
+        Appends exception and stack information to a formatted record, the same way as the standard formatter.
+
+        Args:
+            record (logging.LogRecord): The log record being formatted.
+            formatted (str): The formatted log line.
+
+        Returns:
+            str: The formatted log line, followed by the traceback and stack if any.
+        """
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if formatted[-1:] != "\n":
+                formatted += "\n"
+            formatted += record.exc_text
+        if record.stack_info:
+            if formatted[-1:] != "\n":
+                formatted += "\n"
+            formatted += self.formatStack(record.stack_info)
+        return formatted
 
     def format(self, record: logging.LogRecord) -> str:
         """
         Formats a logging record using the custom formatter.
 
+        Args:
+            record (logging.LogRecord | CompactRecord): The log record to format.
+
+        Returns:
+            str: The formatted log message.
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter_ns()
+
+        # The fields are rendered into the template directly instead of being set on the record,
+        # which keeps the record unchanged and works for records without `__dict__` (`CompactRecord`)
+        lineno = str(record.lineno)
+        formatted = self._fmt % {
+            "asctime": self.formatTime(record, self.datefmt),
+            "filename": self._get_cached_filename(record, lineno),
+            "lineno": lineno,
+            "custom_levelname": self._get_dynamic_levelname(record.levelname),
+            "message": self._render_message(record),
+        }
+        formatted = self._append_exception_info(record, formatted)
+
+        if metrics is not None:
+            metrics.add(len(formatted), time.perf_counter_ns() - start)
+        return formatted
+
+
+class CompiledFormatter(Formatter):
+    """
+    Formatter producing exactly the same output as `Formatter`, without going through the
+    `%(...)s` template. The layout is compiled once into a render function where the
+    identifier, level and color segments are already padded and concatenated, so that
+    formatting a record only joins a handful of strings.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._render = self._compile()
+
+    def _compile(self) -> Callable[[str, str, str, str, str], str]:
+        """
+        Builds the specialized render function for the current identifier, widths and colors.
+
+        Returns:
+            Callable[[str, str, str, str, str], str]: Function rendering
+                (asctime, filename, lineno, levelname, message) into a log line.
+        """
+        colors = self.colors
+        if colors:
+            date_start = colors.DATE
+            filename_start = (
+                f"{colors.RESET_ALL} -> [{self._get_identifier()}] [{colors.FILENAME}"
+            )
+            lineno_start = f"{colors.RESET_ALL}:{colors.LINENO}"
+            level_start = f"{colors.RESET_ALL}] "
+        else:
+            date_start = ""
+            filename_start = f" -> [{self._get_identifier()}] ["
+            lineno_start = ":"
+            level_start = "] "
+
+        # Level segments are fully precomputed: "<colored padded level> | "
+        level_segments = {
+            level_name: f"{level_start}{evaluated_level} | "
+            for level_name, evaluated_level in self.evaluated_log_level.items()
+        }
+        get_dynamic_levelname = self._get_dynamic_levelname
+
+        def render(asctime: str, filename: str, lineno: str, levelname: str, message: str) -> str:
+            level_segment = level_segments.get(levelname)
+            if level_segment is None:
+                level_segment = f"{level_start}{get_dynamic_levelname(levelname)} | "
+            return f"{date_start}{asctime}{filename_start}{filename}{lineno_start}{lineno}{level_segment}{message}"
+
+        return render
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a logging record with the compiled render function.
+
         Args:
             record (logging.LogRecord): The log record to format.
 
         Returns:
             str: The formatted log message.
         """
-        record.filename = self._get_dynamic_filename(record.filename, str(record.lineno))
-        record.custom_levelname = self._get_dynamic_levelname(record.levelname)
-        record.message = self._get_dynamic_message(record.msg)
-        return super().format(record)
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter_ns()
+
+        lineno = str(record.lineno)
+        formatted = self._render(
+            self.formatTime(record, self.datefmt),
+            self._get_cached_filename(record, lineno),
+            lineno,
+            record.levelname,
+            self._render_message(record),
+        )
+        if record.exc_info or record.exc_text or record.stack_info:
+            formatted = self._append_exception_info(record, formatted)
+
+        if metrics is not None:
+            metrics.add(len(formatted), time.perf_counter_ns() - start)
+        return formatted
@@ -0,0 +1,15 @@
+# ====== Code Summary ======
+# This package gathers the custom logging handlers used by the `Logger` class.
+# - `AsyncQueueHandler`: Bounded queue drained by a background writer thread.
+# - `BufferedFileHandler`: Batched file sink flushing by size, interval or severity.
+# - `RotatingFileHandler`: Buffered file sink rotating at midnight and/or by size.
+# - `SegmentCompressor`: Background worker compressing rotated segments.
+# - `CollectorHandler`: Batched sender of the file logs of a worker process to a collector process.
+# - `CompressedFileHandler`: Gzip file sink used when the disk is under pressure.
+
+from logger.handlers.queue_handler import AsyncQueueHandler
+from logger.handlers.file_handler import BufferedFileHandler
+from logger.handlers.rotating_handler import RotatingFileHandler
+from logger.handlers.compression import SegmentCompressor
+from logger.handlers.collector_handler import CollectorHandler
+from logger.handlers.compressed_handler import CompressedFileHandler
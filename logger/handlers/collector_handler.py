@@ -0,0 +1,225 @@
+# ====== Code Summary ======
+# This module provides a `CollectorHandler` used by worker processes to send their file logs to a single
+# collector process (see `logger.collector.LogCollector`), which owns the log file and its monitoring.
+# Records are formatted in the worker and appended to a pending batch; a background sender thread sends
+# the batch over a local connection (Unix socket or Windows named pipe) when:
+# - the batch reaches its size,
+# - the flush interval elapses,
+# - an ERROR, CRITICAL or FATAL record is emitted (sent at once).
+# Connecting and sending never happen on the logging threads, so a slow or dead collector cannot stall them:
+# once `max_pending` records are waiting, new records are dropped and counted. If the collector is
+# unreachable, the batches are written to a local file handler instead, and the connection is retried
+# every reconnect interval.
+
+# ====== Imports ======
+# Standard library imports
+from multiprocessing.connection import Client, Connection
+from multiprocessing import AuthenticationError
+from typing import Callable, Optional
+import threading
+import logging
+import time
+
+# Internal project imports
+from logger.log_levels import LogLevels
+from logger.handlers.file_handler import BufferedFileHandler
+
+# ====== Constants ======
+# First byte of each message, telling the collector whether the batch must be written immediately
+BATCH_NORMAL = b"\x00"
+BATCH_URGENT = b"\x01"
+
+
+# ====== Functions ======
+def write_formatted_lines(handler: logging.FileHandler, data: bytes, urgent: bool = False) -> None:
+    """
+    Writes already formatted and encoded lines to a file handler, bypassing its formatter.
+
+    Args:
+        handler (logging.FileHandler): A buffered or plain file handler.
+        data (bytes): The encoded lines, each one ending with a line terminator.
+        urgent (bool, optional): Write immediately, as for an ERROR record. Defaults to False.
+    """
+    if isinstance(handler, BufferedFileHandler):
+        handler.write_lines([data], urgent)
+        return
+
+    with handler.lock:
+        if handler.stream is None:
+            handler.stream = handler._open()
+        handler.stream.write(data.decode(handler.encoding or "utf-8", handler.errors or "strict"))
+        handler.stream.flush()
+
+
+# ====== Collector Handler ======
+class CollectorHandler(logging.Handler):
+    """
+    Handler sending batches of formatted records to a collector process,
+    falling back to a local file handler while the collector is unreachable.
+    """
+
+    def __init__(
+            self,
+            address: str,
+            fallback_factory: Callable[[], logging.FileHandler],
+            batch_size: int = 256,
+            flush_interval: float = 0.5,
+            reconnect_interval: float = 5.0,
+            encoding: str = "utf-8",
+            authkey: Optional[bytes] = None,
+            max_pending: int = 10000,
+    ):
+        """
+        Initializes the handler and starts the background sender, which connects to the collector.
+
+        Args:
+            address (str): Address of the collector (Unix socket path or Windows named pipe).
+            fallback_factory (Callable[[], logging.FileHandler]): Creates the local file handler used
+                while the collector is unreachable. Only called when first needed.
+            batch_size (int, optional): Number of buffered records triggering a send. Defaults to 256.
+            flush_interval (float, optional): Maximum time in seconds a record stays in the batch.
+                0 only sends full batches, errors and explicit flushes. Defaults to 0.5.
+            reconnect_interval (float, optional): Minimum time in seconds between two connection attempts.
+                Defaults to 5.0.
+            encoding (str, optional): Encoding of the sent lines. Defaults to "utf-8".
+            authkey (bytes, optional): Secret shared with the collector. Defaults to None (no authentication).
+            max_pending (int, optional): Number of records waiting to be sent beyond which new records
+                are dropped. Defaults to 10000.
+        """
+        super().__init__()
+        self.address = address
+        self.fallback_factory = fallback_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.reconnect_interval = reconnect_interval
+        self.encoding = encoding
+        self.authkey = authkey
+        self.terminator = "\n"
+
+        self.max_pending = max_pending
+        self.flushes = 0  # Batches sent to the collector or written locally
+        self.dropped_records = 0  # Records dropped while `max_pending` records were waiting
+
+        self._batch: list[bytes] = []  # Guarded by the handler lock
+        self._urgent = False
+        self._send_lock = threading.Lock()  # Serializes the sends, held without the handler lock
+        self._connection: Optional[Connection] = None
+        self._fallback: Optional[logging.FileHandler] = None
+        self._last_attempt = float("-inf")
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._sender = threading.Thread(target=self._send_loop, name="logger-collector-sender", daemon=True)
+        self._sender.start()
+
+    # ====== Connection Methods ======
+    @property
+    def connected(self) -> bool:
+        """Whether the records are currently sent to the collector."""
+        return self._connection is not None
+
+    def _connect(self) -> None:
+        """Tries to connect to the collector, at most once per reconnect interval."""
+        now = time.monotonic()
+        if now - self._last_attempt < self.reconnect_interval:
+            return
+        self._last_attempt = now
+        try:
+            self._connection = Client(self.address, authkey=self.authkey)
+        except (OSError, EOFError, AuthenticationError):
+            self._connection = None
+
+    def _disconnect(self) -> None:
+        """Closes the connection to the collector."""
+        connection, self._connection = self._connection, None
+        try:
+            connection.close()
+        except OSError:
+            pass
+
+    def _get_fallback(self) -> logging.FileHandler:
+        """Returns the local file handler, creating it on first use."""
+        if self._fallback is None:
+            self._fallback = self.fallback_factory()
+        return self._fallback
+
+    def _send_pending(self) -> None:
+        """
+        Sends the pending batch to the collector, or writes it locally if the collector is unreachable.
+        The handler lock is only held to take the batch, never while connecting or sending.
+        """
+        with self._send_lock:
+            with self.lock:
+                if not self._batch:
+                    return
+                batch, self._batch = self._batch, []
+                urgent, self._urgent = self._urgent, False
+            data = b"".join(batch)
+            self.flushes += 1
+
+            if self._connection is None:
+                self._connect()
+            if self._connection is not None:
+                try:
+                    self._connection.send_bytes((BATCH_URGENT if urgent else BATCH_NORMAL) + data)
+                    return
+                except (OSError, EOFError):
+                    # The collector went away: the batch may be partially lost on its side, keep it locally
+                    self._disconnect()
+
+            write_formatted_lines(self._get_fallback(), data, urgent)
+
+    def _send_loop(self) -> None:
+        """Background loop sending the pending batch when woken up, and every flush interval."""
+        with self._send_lock:
+            self._connect()
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.flush_interval or None)
+            self._wake_event.clear()
+            try:
+                self._send_pending()
+            except Exception:
+                pass  # Written locally or retried with the next batch, the sender must survive
+
+    # ====== Handler Methods ======
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Formats and batches a record, waking up the sender if the batch is full or if the record is an error.
+        The record is dropped if too many records are already waiting to be sent.
+
+        Args:
+            record (logging.LogRecord): The record to send.
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            with self.lock:
+                if len(self._batch) >= self.max_pending:
+                    self.dropped_records += 1
+                    return
+                self._batch.append(data)
+                if record.levelno >= LogLevels.ERROR:
+                    self._urgent = True
+                    self._wake_event.set()
+                elif len(self._batch) >= self.batch_size:
+                    self._wake_event.set()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Sends the pending records, waiting for the send to complete."""
+        self._send_pending()
+
+    def close(self) -> None:
+        """Stops the sender, sends the remaining records and closes the connection."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._sender is not threading.current_thread():
+            self._sender.join()
+
+        self._send_pending()
+        with self._send_lock:
+            if self._connection is not None:
+                self._disconnect()
+            if self._fallback is not None:
+                self._fallback.close()
+        super().close()
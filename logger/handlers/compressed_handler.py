@@ -0,0 +1,61 @@
+# ====== Code Summary ======
+# This module provides a `CompressedFileHandler` writing log lines through a gzip stream, used when the disk
+# is under pressure (`YYYY-MM-DD.log` is then continued as `YYYY-MM-DD.log.gz`). The stream is only flushed
+# for ERROR, CRITICAL and FATAL records and on explicit flushes, as every flush ends a compressed block.
+# Each opening appends a new gzip member, which gzip readers concatenate transparently.
+
+# ====== Imports ======
+# Standard library imports
+import logging
+import gzip
+
+# Internal project imports
+from logger.log_levels import LogLevels
+
+
+# ====== Compressed File Handler ======
+class CompressedFileHandler(logging.FileHandler):
+    """
+    File handler compressing the log lines on the fly with gzip.
+    """
+
+    def __init__(self, filename: str, compresslevel: int = 6, encoding: str = "utf-8"):
+        """
+        Args:
+            filename (str): Path of the compressed log file (e.g. "logs/2025-01-01.log.gz").
+            compresslevel (int, optional): Gzip compression level, from 1 (fastest) to 9. Defaults to 6.
+            encoding (str, optional): Encoding of the log lines. Defaults to "utf-8".
+        """
+        self.compresslevel = compresslevel
+        self.flushes = 0  # Flushes of the compressed stream
+        super().__init__(filename, mode="a", encoding=encoding, delay=True)
+
+    def _open(self):
+        return gzip.open(self.baseFilename, "at", compresslevel=self.compresslevel, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Compresses a record, flushing the stream for ERROR, CRITICAL and FATAL records.
+        A closed handler is not reopened: a record racing its replacement is dropped instead of
+        starting a gzip member which would never be closed.
+
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        try:
+            if self.stream is None:
+                if self._closed:
+                    return
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= LogLevels.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flushes the compressed stream, ending the current compressed block."""
+        with self.lock:
+            if self.stream is not None:
+                self.stream.flush()
+                self.flushes += 1
@@ -0,0 +1,118 @@
+# ====== Code Summary ======
+# This module compresses rotated log segments in a background thread, using the standard library
+# `gzip` or `lzma` modules. A segment `YYYY-MM-DD.N.log` becomes `YYYY-MM-DD.N.log.gz` (or `.log.xz`).
+# The compressed data is first written to a temporary file, then atomically renamed, and the
+# original segment is only removed once its compressed copy is complete.
+
+# ====== Imports ======
+# Standard library imports
+import threading
+import shutil
+import queue
+import gzip
+import lzma
+import os
+
+# Internal project imports
+from logger.logger_configs import CompressionFormat
+
+
+# ====== Constants ======
+# Compression modules matching each compression format
+COMPRESSION_MODULES = {
+    CompressionFormat.GZIP: gzip,
+    CompressionFormat.XZ: lzma,
+}
+
+# Extensions of the compressed log files, recognised by the disk monitor
+COMPRESSED_LOG_EXTENSIONS = (".log.gz", ".log.xz")
+
+
+def open_log_file(path: str):
+    """
+    Opens a plain or compressed log file for binary reading, based on its extension.
+
+    Args:
+        path (str): Path of the log file.
+
+    Returns:
+        A binary file object yielding the uncompressed content.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+# ====== Segment Compressor ======
+class SegmentCompressor:
+    """
+    Background worker compressing rotated log segments one at a time.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[tuple[str, CompressionFormat]] = queue.Queue()
+        self._thread = threading.Thread(target=self._worker_loop, name="logger-segment-compressor", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, compression: CompressionFormat) -> None:
+        """
+        Schedules the compression of a rotated segment.
+
+        Args:
+            path (str): Path of the rotated segment.
+            compression (CompressionFormat): Compression format to apply.
+        """
+        if compression is not CompressionFormat.NONE:
+            self._queue.put((path, compression))
+
+    def join(self) -> None:
+        """Blocks until every scheduled segment has been compressed."""
+        self._queue.join()
+
+    @staticmethod
+    def compress(path: str, compression: CompressionFormat) -> str:
+        """
+        Compresses a segment and removes the original file.
+
+        Args:
+            path (str): Path of the segment to compress.
+            compression (CompressionFormat): Compression format to apply.
+
+        Returns:
+            str: Path of the compressed segment.
+        """
+        destination = path + compression.extension
+        temporary = destination + ".tmp"
+        with open(path, "rb") as source, COMPRESSION_MODULES[compression].open(temporary, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        os.replace(temporary, destination)
+        os.remove(path)
+        return destination
+
+    def _worker_loop(self) -> None:
+        """Background loop compressing the scheduled segments."""
+        while True:
+            path, compression = self._queue.get()
+            try:
+                self.compress(path, compression)
+            except OSError:
+                # The segment stays uncompressed but is still a regular, readable log file
+                pass
+            finally:
+                self._queue.task_done()
+
+
+# ====== Shared Instance ======
+_compressor: SegmentCompressor | None = None
+_compressor_lock = threading.Lock()
+
+
+def get_segment_compressor() -> SegmentCompressor:
+    """Returns the compressor shared by every rotating handler, starting it on first use."""
+    global _compressor
+    with _compressor_lock:
+        if _compressor is None:
+            _compressor = SegmentCompressor()
+        return _compressor
@@ -0,0 +1,240 @@
+# ====== Code Summary ======
+# This module provides a `BufferedFileHandler` that batches log lines before writing them to disk.
+# Encoded records are collected in memory and written with a single vectored `os.writev` call when:
+# - the buffer reaches its size threshold,
+# - the flush interval elapses (background flusher thread),
+# - an ERROR, CRITICAL or FATAL record is emitted (flushed immediately).
+# Durability is controlled by an `FsyncPolicy` (never, on error, periodic).
+# A failed write (e.g. ENOSPC, EIO) drops the batch, which may have been partially written, and counts
+# its lines in `dropped_records`; the error is reported through `handleError` and the next batches are
+# written as usual.
+
+# ====== Imports ======
+# Standard library imports
+import threading
+import logging
+import time
+import os
+
+# Internal project imports
+from logger.log_levels import LogLevels
+from logger.logger_configs import FsyncPolicy
+
+# ====== Constants ======
+# Maximum number of buffers accepted by one writev call
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+
+# ====== Functions ======
+def write_buffers(fd: int, buffers: list[bytes]) -> int:
+    """
+    Writes every buffer to a file descriptor, using vectored writes when available
+    and resuming after partial writes.
+
+    Args:
+        fd (int): The file descriptor to write to.
+        buffers (list[bytes]): The buffers to write, in order.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    total = 0
+    if not hasattr(os, "writev"):  # Windows
+        data = memoryview(b"".join(buffers))
+        while data:
+            written = os.write(fd, data)
+            total += written
+            data = data[written:]
+        return total
+
+    pending = [memoryview(buffer) for buffer in buffers if buffer]
+    while pending:
+        chunk = pending[:IOV_MAX]
+        written = os.writev(fd, chunk)
+        total += written
+
+        # Skip the fully written buffers and keep the unwritten part of a partially written one
+        index = 0
+        while index < len(chunk) and written >= len(chunk[index]):
+            written -= len(chunk[index])
+            index += 1
+        if index < len(chunk) and written:
+            chunk[index] = chunk[index][written:]
+        pending = chunk[index:] + pending[len(chunk):]
+    return total
+
+
+# ====== Buffered File Handler ======
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler writing records in batches through a raw file descriptor.
+
+    It subclasses `logging.FileHandler` so that it is recognised wherever a file handler is expected,
+    but never opens the text stream of its parent class.
+    """
+
+    def __init__(
+            self,
+            filename: str,
+            buffer_size: int = 64 * 1024,
+            flush_interval: float = 1.0,
+            fsync_policy: FsyncPolicy | str = FsyncPolicy.NEVER,
+            fsync_interval: float = 5.0,
+            encoding: str = "utf-8",
+    ):
+        """
+        Initializes the handler, opens the log file and starts the background flusher.
+
+        Args:
+            filename (str): Path of the log file.
+            buffer_size (int, optional): Number of buffered bytes triggering a write. Defaults to 64 KiB.
+            flush_interval (float, optional): Maximum time in seconds a record stays in the buffer.
+                0 disables the background flusher. Defaults to 1.0.
+            fsync_policy (FsyncPolicy | str, optional): Durability policy. Defaults to NEVER.
+            fsync_interval (float, optional): Minimum time in seconds between two periodic fsync. Defaults to 5.0.
+            encoding (str, optional): Encoding of the log file. Defaults to "utf-8".
+        """
+        super().__init__(filename, mode="a", encoding=encoding, delay=True)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.fsync_policy = FsyncPolicy(fsync_policy)
+        self.fsync_interval = fsync_interval
+
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        self.flushes = 0  # Writes of the buffer to the file
+        self.dropped_records = 0  # Lines of the batches whose write failed
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+        self._fd = self._open_fd(self.baseFilename)
+
+        self._stop_event = threading.Event()
+        self._flusher = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="logger-file-flusher", daemon=True)
+            self._flusher.start()
+
+    # ====== File Methods ======
+    @staticmethod
+    def _open_fd(path: str) -> int:
+        """Opens a log file in append mode and returns its raw file descriptor."""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        return os.open(path, flags, 0o644)
+
+    def _fsync(self) -> None:
+        """Forces the written data to disk."""
+        os.fsync(self._fd)
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+    def _flush_buffer(self, force_fsync: bool = False) -> None:
+        """
+        Writes the buffered records with one vectored write. Must be called with the handler lock held.
+        If the write fails, the batch is dropped and counted, so that a full disk does not grow the buffer.
+
+        Args:
+            force_fsync (bool, optional): Sync the file after writing, regardless of the periodic policy.
+
+        Raises:
+            OSError: If the write or the sync failed.
+        """
+        if self._buffer:
+            buffers, self._buffer, self._buffered_bytes = self._buffer, [], 0
+            try:
+                write_buffers(self._fd, buffers)
+            except OSError:
+                # A buffer may hold several lines (batches received from worker processes)
+                self.dropped_records += sum(buffer.count(b"\n") for buffer in buffers)
+                raise
+            self._unsynced = True
+            self.flushes += 1
+
+        if self._unsynced and (
+                force_fsync
+                or (
+                        self.fsync_policy is FsyncPolicy.PERIODIC
+                        and time.monotonic() - self._last_fsync >= self.fsync_interval
+                )
+        ):
+            self._fsync()
+
+    def _flush_loop(self) -> None:
+        """Background loop flushing the buffer every flush interval."""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                self.handleError(None)  # Reported, the flusher keeps going
+
+    # ====== Handler Methods ======
+    def _append(self, data: list[bytes], urgent: bool) -> None:
+        """
+        Buffers encoded lines, writing the buffer if it is full or if the lines are urgent.
+        Must be called with the handler lock held.
+
+        Args:
+            data (list[bytes]): The encoded lines.
+            urgent (bool): Write immediately (ERROR, CRITICAL or FATAL lines).
+        """
+        self._buffer.extend(data)
+        self._buffered_bytes += sum(len(line) for line in data)
+
+        if urgent:
+            self._flush_buffer(force_fsync=self.fsync_policy is FsyncPolicy.ON_ERROR)
+        elif self._buffered_bytes >= self.buffer_size:
+            self._flush_buffer()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Formats and buffers a record, writing the buffer if it is full or if the record is an error.
+
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding, self.errors or "strict")
+            self._append([data], urgent=record.levelno >= LogLevels.ERROR)
+        except Exception:
+            self.handleError(record)
+
+    def write_lines(self, data: list[bytes], urgent: bool = False) -> None:
+        """
+        Buffers lines that are already formatted and encoded (e.g. received from another process).
+
+        Args:
+            data (list[bytes]): The encoded lines, each one ending with a line terminator.
+            urgent (bool, optional): Write immediately, as for an ERROR record. Defaults to False.
+        """
+        with self.lock:
+            try:
+                self._append(data, urgent)
+            except OSError:
+                self.handleError(None)  # Dropped and counted, the caller keeps receiving lines
+
+    def flush(self) -> None:
+        """Writes the buffered records to the file."""
+        with self.lock:
+            if self._fd is not None:
+                self._flush_buffer()
+
+    def close(self) -> None:
+        """Stops the flusher, writes the remaining records and closes the file."""
+        self._stop_event.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+
+        try:
+            with self.lock:
+                if self._fd is not None:
+                    try:
+                        self._flush_buffer(force_fsync=self.fsync_policy is not FsyncPolicy.NEVER)
+                    except OSError:
+                        self.handleError(None)
+                    finally:
+                        os.close(self._fd)
+                        self._fd = None
+        finally:
+            super().close()
@@ -0,0 +1,194 @@
+# ====== Code Summary ======
+# This module provides an `AsyncQueueHandler` that moves formatting and I/O off the calling thread.
+# Records are pushed into a bounded in-memory queue and a background writer thread drives the
+# real output handlers (console, file, ...). When the queue is full, a configurable backpressure
+# policy decides whether the caller waits, the new record is dropped, or the least important
+# queued record is evicted. Pending records are flushed at interpreter exit.
+
+# ====== Imports ======
+# Standard library imports
+from collections import deque
+import threading
+import logging
+import atexit
+
+# Internal project imports
+from logger.logger_configs import BackpressurePolicy
+
+
+# ====== Async Queue Handler ======
+class AsyncQueueHandler(logging.Handler):
+    """
+    Logging handler that enqueues records and lets a background thread emit them
+    through the wrapped handlers.
+
+    Attributes:
+        handlers (list[logging.Handler]): Output handlers driven by the writer thread.
+        max_size (int): Maximum number of queued records.
+        policy (BackpressurePolicy): Behaviour applied when the queue is full.
+        dropped_records (int): Number of records discarded by the backpressure policy.
+    """
+
+    def __init__(
+            self,
+            handlers: list[logging.Handler],
+            max_size: int = 10000,
+            policy: BackpressurePolicy | str = BackpressurePolicy.BLOCK,
+    ):
+        """
+        Initializes the queue and starts the writer thread.
+
+        Args:
+            handlers (list[logging.Handler]): Output handlers to drive from the writer thread.
+            max_size (int, optional): Maximum number of queued records. Defaults to 10000.
+            policy (BackpressurePolicy | str, optional): Backpressure policy. Defaults to BLOCK.
+        """
+        # Records below every output handler level are rejected before being queued
+        super().__init__(level=min((h.level for h in handlers), default=logging.NOTSET))
+        self.handlers = list(handlers)
+        self.max_size = max(1, max_size)
+        self.policy = BackpressurePolicy(policy)
+        self.dropped_records = 0
+
+        self._records = deque()
+        # DROP_LOWEST_LEVEL only: the queued records of each level, oldest first, and the ids of the evicted
+        # records, skipped by the writer, so that an eviction does not scan the queue
+        self._records_by_level: dict[int, deque] = {}
+        self._evicted_ids: set[int] = set()
+        self._condition = threading.Condition()
+        self._writing = False
+        self._closed = False
+
+        self._writer = threading.Thread(target=self._writer_loop, name="logger-async-writer", daemon=True)
+        self._writer.start()
+
+        # Guarantee that queued records reach their handlers before the interpreter exits
+        atexit.register(self.close)
+
+    # ====== Queue Methods ======
+    @property
+    def queue_depth(self) -> int:
+        """Number of records currently waiting in the queue."""
+        return len(self._records) - len(self._evicted_ids)
+
+    def _evict_lowest_level(self, record: logging.LogRecord) -> bool:
+        """
+        Evicts the oldest queued record with the lowest level, if it is less important
+        than the incoming record, in constant time. Must be called with the condition held.
+
+        Args:
+            record (logging.LogRecord): The record waiting to be queued.
+
+        Returns:
+            bool: True if a slot was freed, False if the incoming record should be dropped.
+        """
+        lowest_level = min(self._records_by_level)
+        if lowest_level >= record.levelno:
+            return False
+
+        records = self._records_by_level[lowest_level]
+        self._evicted_ids.add(id(records.popleft()))  # Still referenced by the queue: its id stays unique
+        if not records:
+            del self._records_by_level[lowest_level]
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Queues a record for the writer thread, applying the backpressure policy if the queue is full.
+
+        Args:
+            record (logging.LogRecord): The record to queue.
+        """
+        with self._condition:
+            if self._closed:
+                # The writer is gone (interpreter shutdown): write synchronously instead of losing the record
+                self._handle(record)
+                return
+
+            if self.queue_depth >= self.max_size:
+                if self.policy is BackpressurePolicy.BLOCK:
+                    while len(self._records) >= self.max_size and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        self._handle(record)
+                        return
+                elif self.policy is BackpressurePolicy.DROP_NEWEST or not self._evict_lowest_level(record):
+                    self.dropped_records += 1
+                    return
+                else:
+                    # One queued record has been evicted to make room for this one
+                    self.dropped_records += 1
+
+            self._records.append(record)
+            if self.policy is BackpressurePolicy.DROP_LOWEST_LEVEL:
+                records = self._records_by_level.get(record.levelno)
+                if records is None:
+                    records = self._records_by_level[record.levelno] = deque()
+                records.append(record)
+            self._condition.notify_all()
+
+    # ====== Writer Methods ======
+    def _handle(self, record: logging.LogRecord) -> None:
+        """Dispatches a record to every output handler whose level accepts it."""
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _writer_loop(self) -> None:
+        """Background loop draining the queue in batches."""
+        while True:
+            with self._condition:
+                while not self._records and not self._closed:
+                    self._condition.wait()
+                if not self._records and self._closed:
+                    return
+
+                # Take the whole backlog at once to keep lock traffic low
+                batch, evicted_ids = self._records, self._evicted_ids
+                self._records = deque()
+                self._records_by_level = {}
+                self._evicted_ids = set()
+                self._writing = True
+                self._condition.notify_all()
+
+            for record in batch:
+                if evicted_ids and id(record) in evicted_ids:
+                    continue
+                self._handle(record)
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued record has been handled, then flushes the output handlers.
+        """
+        if threading.current_thread() is not self._writer:
+            with self._condition:
+                while (self._records or self._writing) and self._writer.is_alive():
+                    self._condition.wait()
+
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """
+        Drains the queue, stops the writer thread and closes the output handlers.
+        Safe to call several times.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+
+        if threading.current_thread() is not self._writer:
+            self._writer.join()
+
+        for handler in self.handlers:
+            handler.flush()
+            handler.close()
+
+        atexit.unregister(self.close)
+        super().close()
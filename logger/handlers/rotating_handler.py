@@ -0,0 +1,249 @@
+# ====== Code Summary ======
+# This module provides a `RotatingFileHandler` that keeps long-running processes writing to the
+# dated log file of the current day (`logs/YYYY-MM-DD.log`), with two rotation triggers:
+# - Midnight: the next midnight is precomputed as a timestamp, so the logging call path only compares
+#   `record.created` with it. The switch itself (opening the new file, swapping the descriptor,
+#   closing the old one) is performed by a background thread and never blocks the caller.
+# - Size: once the file reaches a maximum size, it is renamed to a numbered segment
+#   (`YYYY-MM-DD.N.log`) and compressed by a background worker (`YYYY-MM-DD.N.log.gz`).
+
+# ====== Imports ======
+# Standard library imports
+from typing import Callable, Optional
+import threading
+import datetime
+import logging
+import time
+import re
+import os
+
+# Internal project imports
+from logger.logger_configs import CompressionFormat
+from logger.handlers.file_handler import BufferedFileHandler
+from logger.handlers.compression import get_segment_compressor
+
+
+# ====== Globals ======
+# Every logger of the process writes to the same dated file: size-rotated writes and rotations are
+# serialized, and each rotation bumps the generation of the path so that the other handlers reopen it
+_rotation_lock = threading.Lock()
+_rotation_generations: dict[str, int] = {}
+
+
+# ====== Functions ======
+def get_next_midnight(timestamp: float) -> float:
+    """
+    Returns the timestamp of the first local midnight after a given timestamp.
+
+    Args:
+        timestamp (float): A POSIX timestamp.
+
+    Returns:
+        float: The POSIX timestamp of the next local midnight.
+    """
+    tomorrow = datetime.date.fromtimestamp(timestamp) + datetime.timedelta(days=1)
+    return datetime.datetime.combine(tomorrow, datetime.time()).timestamp()
+
+
+# ====== Rotating File Handler ======
+class RotatingFileHandler(BufferedFileHandler):
+    """
+    Buffered file handler switching to a new dated log file at midnight, and/or splitting
+    the current file into compressed segments when it exceeds a maximum size.
+    """
+    # Defined at class level as the flusher thread may start before the instance attributes are set
+    max_bytes: int = 0
+    _generation: int = 0
+
+    def __init__(
+            self,
+            path_factory: Callable[[datetime.date], str],
+            on_rollover: Optional[Callable[[str], None]] = None,
+            daily_rotation: bool = True,
+            max_bytes: int = 0,
+            compression: CompressionFormat | str = CompressionFormat.GZIP,
+            **kwargs
+    ):
+        """
+        Initializes the handler on today's log file and starts the rotation thread.
+
+        Args:
+            path_factory (Callable[[datetime.date], str]): Returns the log file path of a given day.
+            on_rollover (Callable[[str], None], optional): Called with the new path after each midnight rotation.
+            daily_rotation (bool, optional): Switch to a new dated file at midnight. Defaults to True.
+            max_bytes (int, optional): Size from which the file is rotated into a segment. 0 disables it.
+            compression (CompressionFormat | str, optional): Compression of the rotated segments. Defaults to GZIP.
+            **kwargs: Buffering options forwarded to `BufferedFileHandler`.
+        """
+        now = time.time()
+        super().__init__(path_factory(datetime.date.fromtimestamp(now)), **kwargs)
+        self.path_factory = path_factory
+        self.on_rollover = on_rollover
+        self.max_bytes = max_bytes
+        self.compression = CompressionFormat(compression)
+        self._generation = _rotation_generations.get(self.baseFilename, 0)
+        self._scan_segments(self.baseFilename)
+
+        self._rollover_event = threading.Event()
+        self._rotator = None
+        self._rollover_at = float("inf")
+        if daily_rotation:
+            self._rollover_at = get_next_midnight(now)
+            self._rotator = threading.Thread(target=self._rotation_loop, name="logger-file-rotator", daemon=True)
+            self._rotator.start()
+
+    # ====== Rotation Methods ======
+    def _rotation_loop(self) -> None:
+        """Background loop sleeping until the next midnight, then rotating the file."""
+        while not self._stop_event.is_set():
+            self._rollover_event.wait(timeout=max(0.0, self._rollover_at - time.time()))
+            self._rollover_event.clear()
+            if self._stop_event.is_set():
+                return
+            if time.time() >= self._rollover_at:
+                try:
+                    self.rollover()
+                except OSError:
+                    # Keep writing to the current file, the next record will retry the rotation
+                    self._rollover_at = time.time() + 1.0
+
+    def _scan_segments(self, path: str) -> None:
+        """
+        Schedules the compression of the segments of a log file left uncompressed
+        (e.g. by a previous process which exited before compressing them).
+
+        Args:
+            path (str): Path of the dated log file.
+        """
+        if not self.max_bytes:
+            return
+
+        directory, filename = os.path.split(path)
+        pattern = re.compile(rf"^{re.escape(filename[:-len('.log')])}\.\d+\.log$")
+        for entry in os.scandir(directory):
+            if pattern.match(entry.name):
+                get_segment_compressor().submit(entry.path, self.compression)
+
+    def _get_free_segment_path(self) -> str:
+        """
+        Returns the path of the next numbered segment, skipping the indexes already used
+        by plain or compressed segments.
+        """
+        stem = self.baseFilename[:-len(".log")]
+        index = 1
+        while any(
+                os.path.exists(f"{stem}.{index}.log{extension}")
+                for extension in ("", ".gz", ".xz")
+        ):
+            index += 1
+        return f"{stem}.{index}.log"
+
+    def _reopen(self) -> None:
+        """Reopens the log file path, after it has been rotated. Must be called with the rotation lock held."""
+        old_fd, self._fd = self._fd, self._open_fd(self.baseFilename)
+        os.close(old_fd)
+        self._generation = _rotation_generations.get(self.baseFilename, 0)
+
+    def _rotate_segment(self) -> None:
+        """
+        Renames the current file into the next numbered segment and reopens an empty file.
+        Must be called with the handler and rotation locks held, and an empty buffer.
+        The compression of the segment is left to the background compressor.
+        """
+        try:
+            rotated_elsewhere = not os.path.samestat(os.stat(self.baseFilename), os.fstat(self._fd))
+        except FileNotFoundError:
+            rotated_elsewhere = True
+
+        if rotated_elsewhere:
+            # Another process already rotated the file
+            self._reopen()
+            return
+
+        segment_path = self._get_free_segment_path()
+        os.rename(self.baseFilename, segment_path)
+        _rotation_generations[self.baseFilename] = self._generation + 1
+        self._reopen()
+
+        get_segment_compressor().submit(segment_path, self.compression)
+
+    def _flush_buffer(self, force_fsync: bool = False) -> None:
+        """
+        Writes the buffered records, then rotates the file into a segment if it reached the maximum size.
+
+        Args:
+            force_fsync (bool, optional): Sync the file after writing, regardless of the periodic policy.
+        """
+        if not self.max_bytes:
+            super()._flush_buffer(force_fsync)
+            return
+
+        with _rotation_lock:
+            if _rotation_generations.get(self.baseFilename, 0) != self._generation:
+                self._reopen()
+
+            written = bool(self._buffer)
+            super()._flush_buffer(force_fsync)
+
+            # The size is read from the file itself, as other handlers may be writing to it as well
+            if written and os.fstat(self._fd).st_size >= self.max_bytes:
+                self._rotate_segment()
+
+    def _swap_file(self, new_path: str, new_fd: int) -> int:
+        """
+        Flushes the buffer to the current file and makes a new file the current one.
+
+        Args:
+            new_path (str): Path of the new log file.
+            new_fd (int): Descriptor of the new log file, already opened.
+
+        Returns:
+            int: Descriptor of the previous file, to be closed by the caller.
+        """
+        with self.lock:
+            try:
+                self._flush_buffer()
+            except OSError:
+                self.handleError(None)  # The batch is dropped, the file is switched anyway
+            old_fd, self._fd = self._fd, new_fd
+            self.baseFilename = new_path
+            self._generation = _rotation_generations.get(new_path, 0)
+        return old_fd
+
+    def rollover(self) -> None:
+        """
+        Switches to the log file of the current day. Called by the rotation thread.
+        """
+        now = time.time()
+        new_path = os.path.abspath(self.path_factory(datetime.date.fromtimestamp(now)))
+        self._rollover_at = get_next_midnight(now)
+        if new_path == self.baseFilename:
+            return
+
+        # The new file is opened outside the handler lock, so emitting threads never wait on the file system
+        old_fd = self._swap_file(new_path, self._open_fd(new_path))
+        if old_fd is not None:
+            os.close(old_fd)
+
+        if self.on_rollover is not None:
+            self.on_rollover(new_path)
+
+    # ====== Handler Methods ======
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Buffers a record, waking the rotation thread if the record belongs to the next day.
+
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        if record.created >= self._rollover_at:
+            self._rollover_event.set()
+        super().emit(record)
+
+    def close(self) -> None:
+        """Stops the rotation thread, then flushes and closes the file."""
+        self._stop_event.set()
+        self._rollover_event.set()
+        if self._rotator is not None and self._rotator is not threading.current_thread():
+            self._rotator.join()
+        super().close()
@@ -0,0 +1,242 @@
+# ====== Code Summary ======
+# This module provides the opt-in latency instrumentation of the logging pipeline (`latency_instrumentation`),
+# telling where the time of a log call goes:
+# - "caller", "record", "dispatch": Caller location capture (the `findCaller` step), record creation,
+#   and hand-off to the handlers, measured by `Logger._emit_record`.
+# - "handle", "format", "format_time", "message", "write": For each handler, the whole
+#   `Handler.handle` call, `Formatter.format`, `TimeFormatter.formatTime`, the message rendering,
+#   and the rest of the handler (locking, encoding, buffering, writing).
+# Durations are recorded in per-thread `LatencyHistogram`s (no shared lock on the logging path) and merged
+# when a report is built. Handlers and formatters are instrumented by wrapping their methods on the instance,
+# so that nothing changes for the loggers which do not enable the instrumentation. The measures include the
+# cost of the instrumentation itself (a few `perf_counter` calls per stage).
+
+# ====== Imports ======
+# Standard library imports
+from typing import Callable
+import threading
+import logging
+import time
+
+# Internal project imports
+from logger.timing_stats import LatencyHistogram, format_duration
+
+# ====== Constants ======
+LOGGER_SCOPE = "logger"
+# Stages in report order
+STAGES = ("caller", "record", "dispatch", "handle", "format", "format_time", "message", "write")
+REPORT_PERCENTILES = (("p50", 0.5), ("p99", 0.99), ("p999", 0.999))
+
+
+# ====== Stage Timings ======
+class _ThreadStages:
+    """Histograms written by a single thread, and read when a report is built."""
+    __slots__ = ("thread", "lock", "histograms", "format_elapsed")
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.lock = threading.Lock()  # Only contended while the histograms are collected
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.format_elapsed = 0.0  # Duration of the last `format` call of this thread, subtracted from "handle"
+
+
+class StageTimings:
+    """
+    Latency histograms of the stages of the logging pipeline, for the logger and each of its handlers.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._thread_stages: list[_ThreadStages] = []
+        self._lock = threading.Lock()
+
+    def _get_thread_stages(self) -> _ThreadStages:
+        """Returns the histograms of the calling thread, creating them on its first record."""
+        thread_stages = getattr(self._local, "stages", None)
+        if thread_stages is None:
+            thread_stages = self._local.stages = _ThreadStages()
+            with self._lock:
+                self._thread_stages.append(thread_stages)
+        return thread_stages
+
+    def record(self, scope: str, stage: str, elapsed: float) -> None:
+        """
+        Records the duration of a stage for the calling thread.
+
+        Args:
+            scope (str): "logger", or the name of the handler.
+            stage (str): The stage, one of `STAGES`.
+            elapsed (float): The duration in seconds.
+        """
+        thread_stages = self._get_thread_stages()
+        with thread_stages.lock:
+            histogram = thread_stages.histograms.get((scope, stage))
+            if histogram is None:
+                histogram = thread_stages.histograms[(scope, stage)] = LatencyHistogram()
+            histogram.add(elapsed)
+
+    def record_log_call(self, start: float, caller_end: float, record_end: float, end: float) -> None:
+        """
+        Records the logger stages of a log call, from the timestamps taken by `Logger._emit_record`.
+
+        Args:
+            start (float): Start of the call.
+            caller_end (float): End of the caller location capture.
+            record_end (float): End of the record creation.
+            end (float): End of the hand-off to the handlers.
+        """
+        thread_stages = self._get_thread_stages()
+        with thread_stages.lock:
+            histograms = thread_stages.histograms
+            for stage, elapsed in (
+                    ("caller", caller_end - start), ("record", record_end - caller_end), ("dispatch", end - record_end)
+            ):
+                histogram = histograms.get((LOGGER_SCOPE, stage))
+                if histogram is None:
+                    histogram = histograms[(LOGGER_SCOPE, stage)] = LatencyHistogram()
+                histogram.add(elapsed)
+
+    def collect(self, reset: bool = False) -> dict[tuple[str, str], LatencyHistogram]:
+        """
+        Merges the histograms of every thread.
+
+        Args:
+            reset (bool, optional): Start over from empty histograms. Defaults to False.
+
+        Returns:
+            dict[tuple[str, str], LatencyHistogram]: The merged histograms, keyed by (scope, stage).
+        """
+        merged: dict[tuple[str, str], LatencyHistogram] = {}
+        with self._lock:
+            for thread_stages in self._thread_stages:
+                with thread_stages.lock:
+                    for key, histogram in thread_stages.histograms.items():
+                        merged.setdefault(key, LatencyHistogram()).merge(histogram)
+                    if reset:
+                        thread_stages.histograms = {}
+            self._thread_stages = [
+                thread_stages for thread_stages in self._thread_stages
+                if thread_stages.thread.is_alive() or (thread_stages.histograms and not reset)
+            ]
+        return merged
+
+    def report(self, title: str, reset: bool = False) -> str:
+        """
+        Builds the breakdown table of the recorded stages.
+
+        Args:
+            title (str): Title of the table (e.g. the logger identifier).
+            reset (bool, optional): Start over from empty histograms. Defaults to False.
+
+        Returns:
+            str: One line per (scope, stage), with its count, total, mean, percentiles and maximum.
+        """
+        histograms = self.collect(reset)
+
+        # The logger stages first, then each handler in order of first appearance
+        scopes = [LOGGER_SCOPE] + list(dict.fromkeys(scope for scope, _ in histograms if scope != LOGGER_SCOPE))
+        rows = [
+            (f"{scope}/{stage}", histograms[(scope, stage)])
+            for scope in scopes for stage in STAGES
+            if (scope, stage) in histograms and histograms[(scope, stage)].count
+        ]
+        width = max([len("stage")] + [len(name) for name, _ in rows])
+
+        lines = [
+            f"[{title}]",
+            f"  {'stage':<{width}} {'calls':>9} {'total':>10} {'mean':>10} "
+            + " ".join(f"{name:>10}" for name, _ in REPORT_PERCENTILES) + f" {'max':>10}",
+        ]
+        for name, histogram in rows:
+            percentiles = " ".join(
+                f"{format_duration(histogram.percentile(fraction)):>10}" for _, fraction in REPORT_PERCENTILES
+            )
+            lines.append(
+                f"  {name:<{width}} {histogram.count:>9} {format_duration(histogram.total):>10} "
+                f"{format_duration(histogram.mean):>10} {percentiles} {format_duration(histogram.max):>10}"
+            )
+        if not rows:
+            lines.append("  (no record)")
+        return "\n".join(lines)
+
+
+# ====== Functions ======
+def _timed(timings: StageTimings, scope: str, stage: str, function: Callable) -> Callable:
+    """Wraps a function so that each call is recorded as a stage."""
+    perf_counter = time.perf_counter
+
+    def timed_function(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings.record(scope, stage, perf_counter() - start)
+
+    return timed_function
+
+
+def instrument_formatter(formatter: logging.Formatter, timings: StageTimings, scope: str) -> None:
+    """
+    Records the stages of a formatter: the whole `format` call, and for our formatters the timestamp
+    and the message rendering.
+
+    Args:
+        formatter (logging.Formatter): The formatter of the handler.
+        timings (StageTimings): The histograms to record into.
+        scope (str): The name of the handler.
+    """
+    if getattr(formatter, "stage_timings", None) is timings:
+        return  # Already instrumented
+    formatter.stage_timings = timings
+
+    format_function = formatter.format
+    perf_counter = time.perf_counter
+
+    def timed_format(record):
+        start = perf_counter()
+        try:
+            return format_function(record)
+        finally:
+            elapsed = perf_counter() - start
+            timings._get_thread_stages().format_elapsed += elapsed
+            timings.record(scope, "format", elapsed)
+
+    formatter.format = timed_format
+    formatter.formatTime = _timed(timings, scope, "format_time", formatter.formatTime)
+    if hasattr(formatter, "_render_message"):
+        formatter._render_message = _timed(timings, scope, "message", formatter._render_message)
+
+
+def instrument_handler(handler: logging.Handler, timings: StageTimings, scope: str) -> None:
+    """
+    Records the stages of a handler: the whole `handle` call, its formatter stages, and the rest
+    of the call as "write". A handler without formatter (the asynchronous queue) only records "handle",
+    which is then the enqueue time.
+
+    Args:
+        handler (logging.Handler): The handler.
+        timings (StageTimings): The histograms to record into.
+        scope (str): The name of the handler.
+    """
+    if handler.formatter is not None:
+        instrument_formatter(handler.formatter, timings, scope)
+    if getattr(handler, "stage_timings", None) is timings:
+        return
+    handler.stage_timings = timings
+
+    handle_function = handler.handle
+    perf_counter = time.perf_counter
+
+    def timed_handle(record):
+        thread_stages = timings._get_thread_stages()
+        thread_stages.format_elapsed = 0.0
+        start = perf_counter()
+        try:
+            return handle_function(record)
+        finally:
+            elapsed = perf_counter() - start
+            timings.record(scope, "handle", elapsed)
+            if handler.formatter is not None and thread_stages.format_elapsed:
+                timings.record(scope, "write", max(0.0, elapsed - thread_stages.format_elapsed))
+
+    handler.handle = timed_handle
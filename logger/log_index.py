@@ -0,0 +1,316 @@
+# ====== Code Summary ======
+# This module provides a `LogFilesIndex`, a small sidecar file (`.log_index.json`) kept in the log directory
+# that remembers, for each log file, its size, modification time, inode and line count, along with the
+# byte offset up to which lines have been counted. It lets `DiskMonitor` avoid reading every log file:
+# - unchanged files are not opened at all,
+# - files that have grown only have their appended bytes read,
+# - files that were replaced (new inode), truncated or rewritten are counted again from the start,
+# - files that no longer exist (deleted, rotated away) are dropped from the index.
+# Files are read in binary, in large chunks counted with `bytearray.count`, by a pool of threads.
+# A compressed file may end without its end-of-stream marker (gzip stream still being written in degraded
+# mode, or left open by a process which died): its lines are counted up to that point and the entry is
+# marked as truncated.
+
+# ====== Imports ======
+# Standard library imports
+import os
+import zlib
+import lzma
+import json
+import threading
+from functools import partial
+from typing import Any, BinaryIO, Callable
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+
+# ====== Constants ======
+INDEX_FILENAME = ".log_index.json"
+INDEX_VERSION = 1
+READ_CHUNK_SIZE = 1024 * 1024
+COMPRESSED_READ_CHUNK_SIZE = 64 * 1024  # Compressed bytes decompressed at once, keeping the output small
+NEWLINE = ord("\n")
+GZIP_WBITS = 16 + zlib.MAX_WBITS  # gzip header and trailer
+MAX_COUNTING_WORKERS = min(8, os.cpu_count() or 1)
+
+# ====== Globals ======
+_buffers = threading.local()  # Read buffer of each counting thread
+
+
+# ====== Data Classes ======
+@dataclass
+class LogIndexEntry:
+    """
+    Indexed state of a log file. `newlines` counts the line terminators found before `offset`;
+    `partial_line` tells whether bytes follow the last one (an unterminated last line).
+    For compressed files, `logical_size` is the uncompressed size, and `truncated` tells whether the file
+    ended before its end-of-stream marker (the counts then stop at the last decompressed chunk).
+    """
+    size: int
+    mtime_ns: int
+    inode: int
+    offset: int
+    newlines: int
+    partial_line: bool
+    logical_size: int
+    truncated: bool = False
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines of the file, counting an unterminated last line, as iterating over the file would."""
+        return self.newlines + self.partial_line
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Tells whether the file is unchanged since it was indexed."""
+        return (
+            self.inode == stat.st_ino
+            and self.offset == self.size == stat.st_size
+            and self.mtime_ns == stat.st_mtime_ns
+        )
+
+
+# ====== Log Files Index ======
+class LogFilesIndex:
+    """
+    Persistent index of the line counts and sizes of the log files of a directory.
+    """
+
+    def __init__(self, directory: str, persistent: bool = True, max_workers: int = MAX_COUNTING_WORKERS):
+        """
+        Loads the index of a log directory, starting from an empty index if it is missing or unreadable.
+
+        Args:
+            directory (str): The log directory.
+            persistent (bool, optional): Read and write the index file. Otherwise, the index only lives
+                in memory, as long as this instance. Defaults to True.
+            max_workers (int, optional): Maximum number of threads reading changed files.
+                Defaults to the number of CPUs, up to 8.
+        """
+        self.directory = directory
+        self.persistent = persistent
+        self.max_workers = max(1, max_workers)
+        self.path = os.path.join(directory, INDEX_FILENAME)
+        self.entries: dict[str, LogIndexEntry] = self._load() if persistent else {}
+        self._seen: set[str] = set()
+
+    def _load(self) -> dict[str, LogIndexEntry]:
+        """Reads the index file, ignoring it if it is missing, corrupted or from another version."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as index_file:
+                data = json.load(index_file)
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return {name: LogIndexEntry(**entry) for name, entry in data["files"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def save(self) -> None:
+        """
+        Drops the entries of the files not seen since the last save, then writes the index file atomically.
+        """
+        self.entries = {name: entry for name, entry in self.entries.items() if name in self._seen}
+        self._seen = set()
+        if not self.persistent:
+            return
+
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as index_file:
+                json.dump(
+                    {"version": INDEX_VERSION, "files": {name: asdict(e) for name, e in self.entries.items()}},
+                    index_file,
+                    separators=(",", ":"),
+                )
+            os.replace(temporary, self.path)
+        except OSError:
+            # The index is only a cache: a read-only or full disk must not break the monitoring
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+    # ====== Counting Methods ======
+    @staticmethod
+    def _index_plain_file(file_path: str, stat: os.stat_result, entry: LogIndexEntry | None) -> LogIndexEntry:
+        """Updates the entry of a plain log file, only reading the bytes appended since it was indexed."""
+        if entry is not None and entry.inode == stat.st_ino and stat.st_size > entry.offset:
+            # Appended to: only the new bytes are read
+            with open(file_path, "rb", buffering=0) as f:
+                f.seek(entry.offset)
+                newlines, read, ends_with_newline = count_newlines(f, stat.st_size - entry.offset)
+            return LogIndexEntry(
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                inode=stat.st_ino,
+                offset=entry.offset + read,
+                newlines=entry.newlines + newlines,
+                partial_line=not ends_with_newline if read else entry.partial_line,
+                logical_size=entry.offset + read,
+            )
+
+        # New, replaced (rotated), truncated or rewritten file: counted from the start
+        with open(file_path, "rb", buffering=0) as f:
+            newlines, read, ends_with_newline = count_newlines(f, stat.st_size)
+        return LogIndexEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            offset=read,
+            newlines=newlines,
+            partial_line=read > 0 and not ends_with_newline,
+            logical_size=read,
+        )
+
+    @staticmethod
+    def _index_compressed_file(file_path: str, stat: os.stat_result) -> LogIndexEntry:
+        """Decompresses a compressed log file on the fly to measure it, up to its end or its truncation."""
+        if file_path.endswith(".gz"):
+            new_decompressor = partial(zlib.decompressobj, GZIP_WBITS)
+        else:
+            new_decompressor = lzma.LZMADecompressor
+        with open(file_path, "rb") as f:
+            reader = _DecompressingReader(f, new_decompressor)
+            newlines, logical_size, ends_with_newline = count_newlines(reader)
+        return LogIndexEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            offset=stat.st_size,
+            newlines=newlines,
+            partial_line=logical_size > 0 and not ends_with_newline,
+            logical_size=logical_size,
+            truncated=reader.truncated,
+        )
+
+    def _index_file(self, file: tuple[str, os.stat_result, bool, LogIndexEntry | None]) -> LogIndexEntry:
+        """Computes the new entry of a changed file (run by the worker threads)."""
+        file_path, stat, compressed, entry = file
+        if compressed:
+            # Compressed segments are never appended to: any change means a new file
+            return self._index_compressed_file(file_path, stat)
+        return self._index_plain_file(file_path, stat, entry)
+
+    def get_entries(
+            self, files: list[tuple[str, os.stat_result, bool]], count_lines: bool = True
+    ) -> list[LogIndexEntry | None]:
+        """
+        Returns the up-to-date entries of log files. Unchanged files are not opened, the others are
+        read (only as much as needed) in parallel by a thread pool.
+
+        Args:
+            files (list[tuple[str, os.stat_result, bool]]): Path, result of `os.stat` and compression flag
+                of each log file.
+            count_lines (bool, optional): Read the changed files to update their entries. If False,
+                None is returned for them and their entries are left untouched. Defaults to True.
+
+        Returns:
+            list[LogIndexEntry | None]: The entry of each file, in the same order.
+        """
+        entries: list[LogIndexEntry | None] = []
+        changed = []
+        for file_path, stat, compressed in files:
+            name = os.path.relpath(file_path, self.directory)
+            self._seen.add(name)
+            entry = self.entries.get(name)
+            if entry is not None and entry.matches(stat):
+                entries.append(entry)
+                continue
+            entries.append(None)
+            if count_lines:
+                changed.append((len(entries) - 1, name, (file_path, stat, compressed, entry)))
+
+        if len(changed) == 1:
+            updated = [self._index_file(changed[0][2])]
+        elif changed:
+            with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(changed)), thread_name_prefix="logger-line-counter"
+            ) as pool:
+                updated = list(pool.map(self._index_file, [file for _, _, file in changed]))
+        else:
+            updated = []
+
+        for (position, name, _), entry in zip(changed, updated):
+            self.entries[name] = entries[position] = entry
+        return entries
+
+
+class _DecompressingReader:
+    """
+    Incremental reader of a gzip (possibly multi-member) or xz file, reading a truncated or corrupted stream
+    as its end, with every byte decompressed before that point, instead of raising.
+    """
+
+    def __init__(self, file: BinaryIO, new_decompressor: Callable[[], Any]):
+        """
+        Args:
+            file (BinaryIO): The compressed file, opened in binary.
+            new_decompressor (Callable[[], Any]): Creates the decompressor of a member
+                (`zlib.decompressobj` or `lzma.LZMADecompressor`).
+        """
+        self.file = file
+        self.new_decompressor = new_decompressor
+        self.truncated = False
+        self._decompressor = new_decompressor()
+        self._started = False  # Bytes were fed to the current member
+        self._pending = memoryview(b"")
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Decompresses a chunk, starting a new member at the end of each one."""
+        output = []
+        while data:
+            if self._decompressor.eof:
+                self._decompressor, self._started = self.new_decompressor(), False
+            self._started = True
+            output.append(self._decompressor.decompress(data))
+            data = self._decompressor.unused_data if self._decompressor.eof else b""
+        return b"".join(output)
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            data = self.file.read(COMPRESSED_READ_CHUNK_SIZE)
+            if not data:
+                self.truncated = self._started and not self._decompressor.eof
+                return 0
+            try:
+                self._pending = memoryview(self._decompress(data))
+            except (zlib.error, lzma.LZMAError):
+                self.truncated = True
+                return 0
+        read = min(len(buffer), len(self._pending))
+        buffer[:read] = self._pending[:read]
+        self._pending = self._pending[read:]
+        return read
+
+
+# ====== Functions ======
+def count_newlines(file: BinaryIO, limit: int | None = None) -> tuple[int, int, bool]:
+    """
+    Counts the line terminators of a binary file from its current position, reading large chunks
+    into a buffer reused by each thread instead of decoding and splitting lines.
+
+    Args:
+        file (BinaryIO): The binary file (raw, buffered or decompressing).
+        limit (int | None, optional): Maximum number of bytes to read. Defaults to None (until the end).
+
+    Returns:
+        tuple[int, int, bool]: The number of line terminators, the number of bytes read
+            and whether the last byte read is a line terminator.
+    """
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _buffers.buffer = bytearray(READ_CHUNK_SIZE)
+    view = memoryview(buffer)
+
+    newlines = total = 0
+    last_byte = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        read = file.readinto(view if remaining is None or remaining >= READ_CHUNK_SIZE else view[:remaining])
+        if not read:
+            break
+        newlines += buffer.count(b"\n", 0, read)
+        last_byte = buffer[read - 1]
+        total += read
+        if remaining is not None:
+            remaining -= read
+    view.release()
+    return newlines, total, last_byte == NEWLINE
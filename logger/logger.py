@@ -11,8 +11,9 @@
 
 # ====== Imports ======
 # Standard library imports
-from typing import Optional
+from typing import Optional, Any
 import logging
+import time
 import sys
 
 # Third-party library imports
@@ -21,10 +22,21 @@ from colorama import just_fix_windows_console
 # Internal project imports
 from logger.log_levels import LogLevels
 from logger.monitoring import DiskMonitor
-from logger.formatter import Formatter
+from logger.profiler import SamplingProfiler
+from logger.formatter import Formatter, CompiledFormatter
+from logger.record import CompactRecord, dispatch_compact_record
+from logger.quota import WriteQuota
+from logger.degradation import DiskPressureGuard
+from logger.metrics import LoggerMetrics, HandlerMetrics
+from logger.instrumentation import StageTimings, instrument_handler
+from logger.handlers import AsyncQueueHandler, BufferedFileHandler, RotatingFileHandler, CollectorHandler
 from logger.colors import BaseColors
 from logger.logger_configs import LoggerConfig
 from logger.logger_manager import LoggerManager
+from logger.tools import CacheInfo
+
+# ====== Constants ======
+QUOTA_LINE_OVERHEAD = 30  # Characters of a log line besides the message and the padded fields
 
 # ====== Initialize Console for Colors ======
 just_fix_windows_console()  # Enables colors in windows consoles (why not)
@@ -137,23 +149,42 @@ class Logger:
         """
         Post-initialization setup for the logger instance.
         - Checks if logger already exists to avoid duplicate handlers.
-        - Configures disk monitoring if enabled.
+        - Configures disk monitoring if enabled (left to the collector process in collector mode),
+          and starts its periodic checks if a monitoring interval is configured.
         - Sets up logging handlers if necessary.
+        - Sets up the write quota if a record or byte rate limit is configured,
+          and the disk pressure degradation if enabled.
+        - Starts the statistical profiler if enabled.
+        - Sets up the pipeline metrics if enabled, and their Prometheus export if configured.
+        - Instruments the handlers with per-stage latency histograms if enabled.
         """
         already_exists = self.config.identifier in logging.root.manager.loggerDict
 
         self.logger = logging.getLogger(self.config.identifier)
-        self.logger.setLevel(LogLevels.DEBUG)  # Set the lowest level to capture all messages
+        if not already_exists:
+            self.logger.setLevel(LogLevels.DEBUG)  # Set the lowest level to capture all messages
+
+        if self.config.collector_config.collector_address is not None:
+            self.config.monitor_config.display_monitoring = False
+            self.config.monitor_config.files_monitoring = False
+
+        self.write_quota = self._create_write_quota()
+        self.metrics = self._create_metrics()
+        self.stage_timings = self._create_stage_timings()
 
         if self.config.monitor_config.is_monitoring_enabled():
             self.disk_monitor = DiskMonitor(
                 logger=self,
                 directory=self.config.path,
-                config=self.config.monitor_config
+                config=self.config.monitor_config,
+                get_active_files=self._get_active_log_files,
             )
 
         if not already_exists:
             self._setup_handlers()
+            if self.stage_timings is not None:
+                self._instrument_handlers()
+        self.disk_pressure_guard = self._create_disk_pressure_guard(already_exists)
 
         self.log_level_to_logger_function = self._get_log_level_to_logger_function_map()
 
@@ -161,24 +192,222 @@ class Logger:
             self.disk_monitor.display_monitoring()
         if self.config.monitor_config.files_monitoring and not already_exists:
             self.disk_monitor.clean_logs()
+        if self.config.monitor_config.is_monitoring_enabled() and not already_exists:
+            self.disk_monitor.start()  # Periodic checks, if a monitoring interval is configured
+
+        self.profiler = None
+        if self.config.profiler_config.profiling and not already_exists:
+            self.profiler = SamplingProfiler(
+                logger=self,
+                interval=self.config.profiler_config.profiler_interval,
+                report_interval=self.config.profiler_config.profiler_report_interval,
+                top_n=self.config.profiler_config.profiler_top_n,
+            ).start()
+
+        metrics_config = self.config.metrics_config
+        if metrics_config.metrics_export_path is not None or metrics_config.metrics_export_port is not None:
+            LoggerManager.start_metrics_exporter(
+                path=metrics_config.metrics_export_path,
+                port=metrics_config.metrics_export_port,
+                interval=metrics_config.metrics_export_interval,
+            )
+
+    def _create_write_quota(self) -> Optional[WriteQuota]:
+        """
+        Creates the record and byte budget of the logger, if a rate limit is configured.
+        Loggers sharing an identifier share the budget of the first one.
+
+        Returns:
+            Optional[WriteQuota]: The write quota, or None if no limit is configured.
+        """
+        monitor_config = self.config.monitor_config
+        if monitor_config.max_records_per_second is None and monitor_config.max_bytes_per_second is None:
+            return None
+
+        first_logger = LoggerManager.get_logger(self.config.identifier)
+        if first_logger is not self and getattr(first_logger, "write_quota", None) is not None:
+            return first_logger.write_quota
+
+        placement_config = self.config.placement_config
+        return WriteQuota(
+            logger=self,
+            max_records_per_second=monitor_config.max_records_per_second,
+            max_bytes_per_second=monitor_config.max_bytes_per_second,
+            window=monitor_config.quota_window,
+            summary_interval=monitor_config.quota_summary_interval,
+            # Date, separators and padded fields written before each message
+            line_overhead=(
+                    QUOTA_LINE_OVERHEAD + placement_config.identifier_max_width
+                    + placement_config.filename_lineno_max_width + placement_config.level_max_width
+            ),
+        )
+
+    def _create_metrics(self) -> Optional[LoggerMetrics]:
+        """
+        Creates the counters of the logger, if the metrics are enabled.
+        Loggers sharing an identifier share the counters of the first one.
+
+        Returns:
+            Optional[LoggerMetrics]: The counters, or None if the metrics are disabled.
+        """
+        if not self.config.metrics_config.is_metrics_enabled():
+            return None
+
+        first_logger = LoggerManager.get_logger(self.config.identifier)
+        if first_logger is not self and getattr(first_logger, "metrics", None) is not None:
+            return first_logger.metrics
+        return LoggerMetrics()
+
+    def _create_stage_timings(self) -> Optional[StageTimings]:
+        """
+        Creates the per-stage latency histograms of the logger, if the instrumentation is enabled.
+        Loggers sharing an identifier share the histograms of the first one.
+
+        Returns:
+            Optional[StageTimings]: The histograms, or None if the instrumentation is disabled.
+        """
+        if not self.config.metrics_config.latency_instrumentation:
+            return None
+
+        first_logger = LoggerManager.get_logger(self.config.identifier)
+        if first_logger is not self and getattr(first_logger, "stage_timings", None) is not None:
+            return first_logger.stage_timings
+        return StageTimings()
+
+    def _create_disk_pressure_guard(self, already_exists: bool) -> Optional[DiskPressureGuard]:
+        """
+        Creates the guard degrading the file output when the disk is under pressure, if enabled.
+        Loggers sharing an identifier share the guard of the first one, which owns the handlers.
+
+        Args:
+            already_exists (bool): Whether the handlers were set up by a previous logger with this identifier.
+
+        Returns:
+            Optional[DiskPressureGuard]: The guard, or None if the degradation is disabled.
+        """
+        monitor_config = self.config.monitor_config
+        if not (
+                monitor_config.disk_pressure_degradation
+                and self.config.log_levels_config.write_to_file
+                and self.config.collector_config.collector_address is None
+        ):
+            return None
+
+        if already_exists:
+            return getattr(LoggerManager.get_logger(self.config.identifier), "disk_pressure_guard", None)
+        return DiskPressureGuard(
+            logger=self,
+            high_watermark=monitor_config.disk_alert_threshold_percent,
+            low_watermark=monitor_config.disk_restore_threshold_percent,
+            degraded_level=monitor_config.degraded_file_log_level,
+            compress=monitor_config.degraded_compression,
+            check_interval=monitor_config.disk_check_interval,
+        )
 
     # ====== Handlers Methods ======
     def _setup_handlers(self):
-        """Sets up logging handlers for console and file output."""
+        """
+        Sets up logging handlers for console and file output.
+        In asynchronous mode, the handlers are driven by a background writer thread.
+        """
+        handlers = []
         if self.config.log_levels_config.print_log:
-            self._set_handler(
+            handlers.append(self._configure_handler(
                 logging.StreamHandler(stream=sys.stdout),
                 self.config.log_levels_config.print_log_level,
                 self.config.colors
-            )
+            ))
         if self.config.log_levels_config.write_to_file:
-            self._set_handler(
-                logging.FileHandler(self.config.full_path),
+            handlers.append(self._configure_handler(
+                self._create_file_handler(),
                 self.config.log_levels_config.file_log_level,
                 colors=None
+            ))
+
+        if self.config.async_config.async_logging and handlers:
+            self.logger.addHandler(AsyncQueueHandler(
+                handlers=handlers,
+                max_size=self.config.async_config.async_queue_size,
+                policy=self.config.async_config.backpressure_policy,
+            ))
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        # Let `isEnabledFor` reject records that no handler would emit, before any record is built
+        if handlers:
+            self.logger.setLevel(min(handler.level for handler in handlers))
+
+    def _create_file_handler(self) -> logging.Handler:
+        """
+        Creates the handler of the file logs: a `CollectorHandler` sending them to the collector process
+        if a collector address is configured, otherwise the local file handler.
+
+        Returns:
+            logging.Handler: The handler of the file logs.
+        """
+        collector_config = self.config.collector_config
+        if collector_config.collector_address is not None:
+            return CollectorHandler(
+                address=collector_config.collector_address,
+                fallback_factory=self._create_local_file_handler,
+                batch_size=collector_config.collector_batch_size,
+                flush_interval=collector_config.collector_flush_interval,
+                reconnect_interval=collector_config.collector_reconnect_interval,
+                authkey=(
+                    collector_config.collector_authkey.encode("utf-8")
+                    if collector_config.collector_authkey is not None else None
+                ),
+                max_pending=collector_config.collector_max_pending,
             )
+        return self._create_local_file_handler()
 
-    def _set_handler(self, handler: logging.Handler, level: int, colors: Optional[type[BaseColors]]):
+    def _create_local_file_handler(self) -> logging.FileHandler:
+        """
+        Creates the file handler selected by the file configuration.
+
+        Returns:
+            logging.FileHandler: A `RotatingFileHandler` if a rotation is enabled, a `BufferedFileHandler`
+                if buffering is enabled, otherwise a plain `FileHandler`.
+        """
+        file_config = self.config.file_config
+        if file_config.daily_rotation or file_config.rotation_max_bytes:
+            # Without buffering, the rotating sink writes every record as soon as it is emitted
+            return RotatingFileHandler(
+                path_factory=self.config.get_log_file_path,
+                on_rollover=self._on_file_rollover,
+                daily_rotation=file_config.daily_rotation,
+                max_bytes=file_config.rotation_max_bytes,
+                compression=file_config.rotation_compression,
+                buffer_size=file_config.file_buffer_size if file_config.buffered_file else 0,
+                flush_interval=file_config.file_flush_interval if file_config.buffered_file else 0,
+                fsync_policy=file_config.fsync_policy,
+                fsync_interval=file_config.fsync_interval,
+            )
+        if file_config.buffered_file:
+            return BufferedFileHandler(
+                self.config.full_path,
+                buffer_size=file_config.file_buffer_size,
+                flush_interval=file_config.file_flush_interval,
+                fsync_policy=file_config.fsync_policy,
+                fsync_interval=file_config.fsync_interval,
+            )
+        return logging.FileHandler(self.config.full_path)
+
+    def _get_active_log_files(self) -> list[str]:
+        """Returns the paths of the log files that may be written to, which the log cleanup never deletes."""
+        if not self.config.log_levels_config.write_to_file:
+            return []
+        # The compressed stream of the disk pressure degradation is active as well
+        return [self.config.full_path, self.config.full_path + ".gz", self.config.get_log_file_path()]
+
+    def _on_file_rollover(self, new_path: str) -> None:
+        """Keeps the configured file path in sync with the file written by the rotating handler."""
+        self.config.full_path = new_path
+
+    def _configure_handler(
+            self, handler: logging.Handler, level: int, colors: Optional[type[BaseColors]]
+    ) -> logging.Handler:
         """
         Configures a given handler with a formatter and logging level.
 
@@ -186,22 +415,178 @@ class Logger:
             handler (logging.Handler): The logging handler to configure.
             level (int): The logging level for this handler.
             colors (Optional[type[BaseColors]]): Color settings for console output.
+
+        Returns:
+            logging.Handler: The configured handler.
         """
-        formatter = Formatter(
+        formatter = self._get_formatter_class()(
             identifier=self.config.identifier,
             identifier_max_width=self.config.placement_config.identifier_max_width,
             filename_lineno_max_width=self.config.placement_config.filename_lineno_max_width,
             level_max_width=self.config.placement_config.level_max_width,
             colors=colors,
+            filename_cache_size=self.config.placement_config.filename_cache_size,
         )
+        if self.config.metrics_config.is_metrics_enabled():
+            formatter.metrics = HandlerMetrics()
         handler.setLevel(level)
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        return handler
+
+    def _get_output_handlers(self) -> list[logging.Handler]:
+        """
+        Returns the handlers actually writing the logs, looking through the asynchronous queue if any.
+
+        Returns:
+            list[logging.Handler]: The output handlers of the logger.
+        """
+        output_handlers = []
+        for handler in self.logger.handlers:
+            if isinstance(handler, AsyncQueueHandler):
+                output_handlers.extend(handler.handlers)
+            else:
+                output_handlers.append(handler)
+        return output_handlers
+
+    def _instrument_handlers(self) -> None:
+        """Records the stage latencies of every handler, including the asynchronous queue if any."""
+        for handler in self.logger.handlers + self._get_output_handlers():
+            instrument_handler(handler, self.stage_timings, type(handler).__name__)
+
+    def get_file_handlers(self) -> list[logging.FileHandler]:
+        """
+        Returns the output handlers writing to local log files.
+
+        Returns:
+            list[logging.FileHandler]: The file handlers of the logger.
+        """
+        return [handler for handler in self._get_output_handlers() if isinstance(handler, logging.FileHandler)]
+
+    def replace_output_handler(self, handler: logging.Handler, replacement: logging.Handler) -> None:
+        """
+        Replaces an output handler in place, behind the asynchronous queue if any.
+
+        Args:
+            handler (logging.Handler): The output handler to replace.
+            replacement (logging.Handler): The new output handler.
+        """
+        for handlers in [self.logger.handlers] + [
+            h.handlers for h in self.logger.handlers if isinstance(h, AsyncQueueHandler)
+        ]:
+            if handler in handlers:
+                handlers[handlers.index(handler)] = replacement  # Item assignment is atomic
+                return
+
+    def refresh_levels(self) -> None:
+        """Lowers (or raises) the logger and queue levels to the lowest level of their output handlers."""
+        for handler in self.logger.handlers:
+            if isinstance(handler, AsyncQueueHandler):
+                handler.setLevel(min((h.level for h in handler.handlers), default=logging.NOTSET))
+        if self.logger.handlers:
+            self.logger.setLevel(min(handler.level for handler in self.logger.handlers))
+
+    @property
+    def dropped_records(self) -> int:
+        """
+        Number of records discarded by the asynchronous queue backpressure policy, while too many records
+        were waiting to be sent to the collector, or by failed writes of the buffered file handler.
+        """
+        dropped = 0
+        for handler in self.logger.handlers:
+            if isinstance(handler, (AsyncQueueHandler, CollectorHandler)):
+                dropped += handler.dropped_records
+            if isinstance(handler, AsyncQueueHandler):
+                dropped += sum(
+                    output.dropped_records for output in handler.handlers if isinstance(output, BufferedFileHandler)
+                )
+            elif isinstance(handler, BufferedFileHandler):
+                dropped += handler.dropped_records
+        return dropped
+
+    def get_filename_cache_info(self) -> dict[str, CacheInfo]:
+        """
+        Returns the statistics of the truncated filename cache of each output handler,
+        to help sizing `PlacementConfig.filename_cache_size`.
+
+        Returns:
+            dict[str, CacheInfo]: Cache statistics, keyed by handler class name.
+        """
+        return {
+            type(handler).__name__: handler.formatter.filename_cache.info()
+            for handler in self._get_output_handlers()
+            if isinstance(handler.formatter, Formatter)
+        }
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Returns the counters and gauges of the logging pipeline of the logger.
+
+        Returns:
+            dict[str, Any]: Records handed to the handlers by level name, filtered, suppressed (write quota)
+                and dropped (asynchronous queue) records, queue depth, disk pressure degradation state,
+                and the records, bytes, flushes and formatting time of each output handler,
+                keyed by handler class name. Counters are None when the metrics are disabled.
+        """
+        metrics = self.metrics
+        handlers = {}
+        for handler in self._get_output_handlers():
+            handler_metrics = getattr(handler.formatter, "metrics", None)
+            if handler_metrics is None:
+                continue
+            handlers[type(handler).__name__] = {
+                "records": handler_metrics.records,
+                "bytes": handler_metrics.bytes,
+                # The standard stream and file handlers flush their stream after every record
+                "flushes": getattr(handler, "flushes", handler_metrics.records),
+                "format_seconds": handler_metrics.format_time_ns / 1e9,
+            }
+
+        return {
+            "records": {
+                logging.getLevelName(level): count for level, count in sorted(metrics.records.items())
+            } if metrics is not None else {},
+            "filtered_records": metrics.filtered_records if metrics is not None else None,
+            "suppressed_records": self.write_quota.suppressed_records if self.write_quota is not None else 0,
+            "dropped_records": self.dropped_records,
+            "queue_depth": sum(
+                handler.queue_depth for handler in self.logger.handlers if isinstance(handler, AsyncQueueHandler)
+            ),
+            "degraded": self.disk_pressure_guard is not None and self.disk_pressure_guard.degraded,
+            "handlers": handlers,
+        }
+
+    def get_latency_report(self, reset: bool = False) -> Optional[str]:
+        """
+        Returns the per-stage latency breakdown of the log calls, if the instrumentation is enabled.
+
+        Args:
+            reset (bool, optional): Start over from empty histograms. Defaults to False.
+
+        Returns:
+            Optional[str]: The breakdown table, or None if the instrumentation is disabled.
+        """
+        if self.stage_timings is None:
+            return None
+        return self.stage_timings.report(self.config.identifier, reset)
+
+    def flush(self) -> None:
+        """Flushes every handler, waiting for the asynchronous queue to be drained if needed."""
+        for handler in self.logger.handlers:
+            handler.flush()
 
     # ====== Formatter Methods ======
+    def _get_formatter_class(self) -> type[Formatter]:
+        """
+        Returns the formatter class selected by the configuration.
+
+        Returns:
+            type[Formatter]: `CompiledFormatter` if the compiled mode is enabled, otherwise `Formatter`.
+        """
+        return CompiledFormatter if self.config.formatter_config.compiled_formatter else Formatter
+
     def update_handler_formatter(
             self,
-            handler_type: type[logging.FileHandler] | type[logging.StreamHandler],
+            handler_type: type[logging.Handler] | tuple[type[logging.Handler], ...],
             identifier: Optional[str] = None,
             identifier_max_width: Optional[int] = None,
             filename_lineno_max_width: Optional[int] = None,
@@ -213,8 +598,8 @@ class Logger:
         Updates the formatter of a specified handler type dynamically.
 
         Args:
-            handler_type (type[logging.FileHandler] | type[logging.StreamHandler]):
-                The logging handler type to update.
+            handler_type (type[logging.Handler] | tuple[type[logging.Handler], ...]):
+                The logging handler type (or types) to update.
             identifier (Optional[str]):
                 Identifier to be used in the formatter (default: existing identifier).
             identifier_max_width (Optional[int]):
@@ -238,18 +623,23 @@ class Logger:
         )
 
         if hasattr(self, "logger"):
-            for handler in self.logger.handlers:
+            for handler in self._get_output_handlers():
                 if isinstance(handler, handler_type):
-                    handler.setFormatter(Formatter(
+                    formatter = self._get_formatter_class()(
                         identifier=self.config.identifier,
                         identifier_max_width=self.config.placement_config.placement_improvement,
                         filename_lineno_max_width=self.config.placement_config.filename_lineno_max_width,
                         level_max_width=self.config.placement_config.level_max_width,
                         colors=(
-                            None if handler_type is logging.FileHandler else
+                            None if handler_type is not logging.StreamHandler else
                             (self.config.colors if colors is None else colors)
                         ),
-                    ))
+                        filename_cache_size=self.config.placement_config.filename_cache_size,
+                    )
+                    formatter.metrics = getattr(handler.formatter, "metrics", None)  # Keep counting
+                    handler.setFormatter(formatter)
+                    if self.stage_timings is not None:
+                        instrument_handler(handler, self.stage_timings, type(handler).__name__)
                     break  # Exit loop after updating the first matching handler
 
     def update_print_handler_formatter(
@@ -289,7 +679,7 @@ class Logger:
             **kwargs
     ):
         """
-        Updates the formatter of the FileHandler (file logging).
+        Updates the formatter of the FileHandler (file logging), or of the CollectorHandler in collector mode.
 
         Args:
             identifier (Optional[str]): Identifier for formatting.
@@ -298,7 +688,7 @@ class Logger:
             level_max_width (Optional[int]): Max width of the log level field.
         """
         self.update_handler_formatter(
-            handler_type=logging.FileHandler,
+            handler_type=(logging.FileHandler, CollectorHandler),
             identifier=identifier,
             identifier_max_width=identifier_max_width,
             filename_lineno_max_width=filename_lineno_max_width,
@@ -306,38 +696,121 @@ class Logger:
         )
 
     # ====== Logging Methods ======
-    def log(self, msg: str, level: LogLevels) -> None:
+    def _emit_record(self, level: int, msg: Any, args: tuple) -> None:
+        """
+        Builds a record and hands it to the handlers. Must be called directly by a public logging method.
+
+        The caller location is read from a fixed frame depth instead of walking the stack like
+        `logging.Logger.findCaller`, and is skipped entirely if caller capture is disabled.
+        With `compact_records`, the record is a `CompactRecord`, converted only for foreign handlers.
+        Records exceeding the write quota of the logger are dropped here, the disk pressure is polled
+        and the records handed to the handlers are counted. With the latency instrumentation, the
+        caller capture, record creation and dispatch stages are timed.
+
+        Args:
+            level (int): The log level.
+            msg (Any): The message, rendered later by the formatter.
+            args (tuple): The %-style arguments of the message.
+        """
+        stage_timings = self.stage_timings
+        if stage_timings is not None:
+            start = time.perf_counter()
+
+        if self.config.placement_config.capture_caller:
+            frame = sys._getframe(2)  # 0: this method, 1: public logging method, 2: caller
+            code = frame.f_code
+            pathname, lineno, func = code.co_filename, frame.f_lineno, code.co_name
+        else:
+            pathname, lineno, func = "(unknown file)", 0, "(unknown function)"
+        if stage_timings is not None:
+            caller_end = time.perf_counter()
+
+        if self.config.formatter_config.compact_records:
+            record = CompactRecord(self.logger.name, level, pathname, lineno, func, msg, args, time.time())
+        else:
+            record = self.logger.makeRecord(self.logger.name, level, pathname, lineno, msg, args, None, func)
+        if stage_timings is not None:
+            record_end = time.perf_counter()
+
+        if self.write_quota is not None and not self.write_quota.admit(record):
+            return
+        if self.disk_pressure_guard is not None:
+            self.disk_pressure_guard.poll()
+        if self.metrics is not None:
+            self.metrics.records[level] += 1
+        if type(record) is CompactRecord:
+            dispatch_compact_record(self.logger, record)
+        else:
+            self.logger.handle(record)
+
+        if stage_timings is not None:
+            stage_timings.record_log_call(start, caller_end, record_end, time.perf_counter())
+
+    def is_decorator_log_enabled(self, level: int) -> bool:
+        """
+        Tells whether a decorator logging at a given level would emit a record, so that decorators
+        can skip building their message (and timing the call) otherwise.
+
+        Args:
+            level (int): The log level of the decorator.
+
+        Returns:
+            bool: True if the level reaches the configured decorator level and is enabled for the logger.
+        """
+        return level >= self.config.log_levels_config.decorator_log_level and self.logger.isEnabledFor(level)
+
+    # Messages may be strings with %-style arguments, zero-argument callables or any object
+    # with a `__str__` method: they are only rendered by the formatter once a handler emits them.
+    def log(self, msg: Any, level: LogLevels, *args) -> None:
         """ Logs a message at the specified log level. """
-        log_func = self.log_level_to_logger_function.get(level)
-        if log_func is None:
+        if level not in self.log_level_to_logger_function:
             self.logger.warning(
                 f"Invalid log level [log message: {msg}]", stacklevel=2
             )
-        else:
-            log_func(msg, stacklevel=2)
-
-    def fatal(self, msg: str) -> None:
-        """ Logs a fatal message. """
-        # 3 because the logging library doesn't support the 'fatal' level natively, so I have added it manually
-        # (this added 1 to depth level)
-        self.logger.fatal(msg, stacklevel=3)
-
-    def critical(self, msg: str) -> None:
+        elif self.logger.isEnabledFor(level):
+            self._emit_record(level, msg, args)
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
+
+    def fatal(self, msg: Any, *args) -> None:
+        """ Logs a fatal message and flushes the handlers so that it is never lost. """
+        if self.logger.isEnabledFor(LogLevels.FATAL):
+            self._emit_record(LogLevels.FATAL, msg, args)
+            self.flush()
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
+
+    def critical(self, msg: Any, *args) -> None:
         """ Logs a critical message. """
-        self.logger.critical(msg, stacklevel=2)
+        if self.logger.isEnabledFor(LogLevels.CRITICAL):
+            self._emit_record(LogLevels.CRITICAL, msg, args)
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
 
-    def error(self, msg: str) -> None:
+    def error(self, msg: Any, *args) -> None:
         """ Logs an error message. """
-        self.logger.error(msg, stacklevel=2)
+        if self.logger.isEnabledFor(LogLevels.ERROR):
+            self._emit_record(LogLevels.ERROR, msg, args)
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
 
-    def warning(self, msg: str) -> None:
+    def warning(self, msg: Any, *args) -> None:
         """ Logs a warning message. """
-        self.logger.warning(msg, stacklevel=2)
+        if self.logger.isEnabledFor(LogLevels.WARNING):
+            self._emit_record(LogLevels.WARNING, msg, args)
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
 
-    def info(self, msg: str) -> None:
+    def info(self, msg: Any, *args) -> None:
         """ Logs an informational message. """
-        self.logger.info(msg, stacklevel=2)
+        if self.logger.isEnabledFor(LogLevels.INFO):
+            self._emit_record(LogLevels.INFO, msg, args)
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
 
-    def debug(self, msg: str) -> None:
+    def debug(self, msg: Any, *args) -> None:
         """ Logs a debug message. """
-        self.logger.debug(msg, stacklevel=2)
+        if self.logger.isEnabledFor(LogLevels.DEBUG):
+            self._emit_record(LogLevels.DEBUG, msg, args)
+        elif self.metrics is not None:
+            self.metrics.filtered_records += 1
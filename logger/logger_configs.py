@@ -2,6 +2,7 @@
 # Standard library imports
 import os
 import datetime
+from enum import Enum
 from typing import Dict, Any, Type, TypeVar
 from dataclasses import dataclass, field, fields, asdict
 
@@ -14,6 +15,39 @@ from logger.tools import unpack_dict
 T = TypeVar("T", bound="BaseConfig")
 
 
+# ====== Enums ======
+class BackpressurePolicy(Enum):
+    """
+    Behaviour of the asynchronous logging queue when it is full.
+    """
+    BLOCK = "block"  # Wait until the writer thread frees a slot
+    DROP_NEWEST = "drop_newest"  # Discard the incoming record
+    DROP_LOWEST_LEVEL = "drop_lowest_level"  # Evict the oldest queued record with the lowest level
+
+
+class FsyncPolicy(Enum):
+    """
+    Durability policy of the buffered file sink.
+    """
+    NEVER = "never"  # Leave the data in the OS page cache
+    ON_ERROR = "on_error"  # fsync after writing ERROR, CRITICAL or FATAL records
+    PERIODIC = "periodic"  # fsync at most once per fsync interval
+
+
+class CompressionFormat(Enum):
+    """
+    Compression applied to rotated log segments.
+    """
+    NONE = "none"
+    GZIP = "gz"
+    XZ = "xz"
+
+    @property
+    def extension(self) -> str:
+        """Suffix appended to the compressed segment name."""
+        return "" if self is CompressionFormat.NONE else f".{self.value}"
+
+
 # ====== Configuration Classes ======
 @dataclass
 class BaseConfig:
@@ -102,6 +136,15 @@ class PlacementConfig(BaseConfig):
     level_max_width: int = 0
     filename_lineno_max_width: int = 15
     placement_improvement: bool = True
+    capture_caller: bool = True
+    filename_cache_size: int = 1024
+
+    def get_layout_attributes(self) -> Dict[str, Any]:
+        """Return the attributes defining the width and alignment of log components."""
+        return {
+            key: value for key, value in asdict(self).items()
+            if key not in ("capture_caller", "filename_cache_size")
+        }
 
     def adjust_placement(self, identifier: str):
         """Adjusts the placement of log components based on the provided identifier and log level."""
@@ -116,6 +159,15 @@ class PlacementConfig(BaseConfig):
             )
 
 
+@dataclass
+class FormatterConfig(BaseConfig):
+    """
+    Configuration class for selecting how log records are built and formatted.
+    """
+    compiled_formatter: bool = False
+    compact_records: bool = False  # Opt-in: foreign handlers receive converted records
+
+
 @dataclass
 class MonitorConfig(BaseConfig):
     """
@@ -128,12 +180,93 @@ class MonitorConfig(BaseConfig):
     disk_alert_threshold_percent: float = 0.8
     log_files_size_alert_threshold_percent: float = 0.2
     max_log_file_size: float = 1.0
+    max_records_per_second: float = None
+    max_bytes_per_second: float = None
+    quota_window: float = 10.0
+    quota_summary_interval: float = 60.0
+    disk_pressure_degradation: bool = False
+    disk_restore_threshold_percent: float = 0.7
+    degraded_file_log_level: LogLevels = LogLevels.WARNING
+    degraded_compression: bool = True
+    disk_check_interval: float = 5.0
+    max_log_age_days: float = None
+    max_log_files: int = None
+    log_files_index: bool = True
+    monitoring_interval: float = 0.0
+    alert_hysteresis_percent: float = 0.05
+    max_deletions_per_check: int = 10
 
     def is_monitoring_enabled(self) -> bool:
         """Check if monitoring is enabled."""
         return self.display_monitoring or self.files_monitoring
 
 
+@dataclass
+class AsyncConfig(BaseConfig):
+    """
+    Configuration class for the asynchronous (queue-backed) logging mode.
+    """
+    async_logging: bool = False
+    async_queue_size: int = 10000
+    backpressure_policy: BackpressurePolicy = BackpressurePolicy.BLOCK
+
+
+@dataclass
+class FileConfig(BaseConfig):
+    """
+    Configuration class for the log file sink.
+    """
+    buffered_file: bool = False
+    file_buffer_size: int = 64 * 1024
+    file_flush_interval: float = 1.0
+    fsync_policy: FsyncPolicy = FsyncPolicy.NEVER
+    fsync_interval: float = 5.0
+    daily_rotation: bool = False
+    rotation_max_bytes: int = 0
+    rotation_compression: CompressionFormat = CompressionFormat.GZIP
+
+
+@dataclass
+class CollectorConfig(BaseConfig):
+    """
+    Configuration class for sending the file logs of worker processes to a collector process.
+    """
+    collector_address: str | None = None  # Unix socket path (or Windows named pipe) of the collector
+    collector_batch_size: int = 256
+    collector_flush_interval: float = 0.5
+    collector_reconnect_interval: float = 5.0
+    collector_authkey: str | None = None  # Shared secret authenticating the workers to the collector
+    collector_max_pending: int = 10000  # Records waiting to be sent beyond which new records are dropped
+
+
+@dataclass
+class ProfilerConfig(BaseConfig):
+    """
+    Configuration class for the statistical profiler attached to a logger.
+    """
+    profiling: bool = False
+    profiler_interval: float = 0.01
+    profiler_report_interval: float = 60.0
+    profiler_top_n: int = 10
+
+
+@dataclass
+class MetricsConfig(BaseConfig):
+    """
+    Configuration class for the metrics of the logging pipeline, their Prometheus export,
+    and the per-stage latency instrumentation.
+    """
+    metrics: bool = False
+    metrics_export_path: str | None = None  # Prometheus text file, e.g. for a node exporter textfile collector
+    metrics_export_port: int | None = None  # Local HTTP port serving `/metrics`
+    metrics_export_interval: float = 15.0
+    latency_instrumentation: bool = False  # Per-stage latency histograms, for profiling the pipeline
+
+    def is_metrics_enabled(self) -> bool:
+        """Check if the metrics are counted, either enabled or exported."""
+        return self.metrics or self.metrics_export_path is not None or self.metrics_export_port is not None
+
+
 @dataclass
 class LoggerConfig:
     """
@@ -142,15 +275,28 @@ class LoggerConfig:
     identifier: str = "unknown"
     log_levels_config: LogLevelsConfig = field(default_factory=LogLevelsConfig)
     placement_config: PlacementConfig = field(default_factory=PlacementConfig)
+    formatter_config: FormatterConfig = field(default_factory=FormatterConfig)
     monitor_config: MonitorConfig = field(default_factory=MonitorConfig)
+    async_config: AsyncConfig = field(default_factory=AsyncConfig)
+    file_config: FileConfig = field(default_factory=FileConfig)
+    collector_config: CollectorConfig = field(default_factory=CollectorConfig)
+    profiler_config: ProfilerConfig = field(default_factory=ProfilerConfig)
+    metrics_config: MetricsConfig = field(default_factory=MetricsConfig)
     colors: type[BaseColors] = ClassicColors
     path: str = "logs"
     follow_logger_manager_rules: bool = False
 
+    def get_log_file_path(self, date: datetime.date | None = None) -> str:
+        """
+        Return the path of the dated log file for a given day (today by default).
+        """
+        date = date or datetime.datetime.now()
+        return os.path.join(self.path, f"{date.strftime('%Y-%m-%d')}.log")
+
     def _initialize_file_path(self):
         if not os.path.isdir(self.path):
             os.mkdir(self.path)
-        self.full_path = os.path.join(self.path, f"{datetime.datetime.now().strftime('%Y-%m-%d')}.log")
+        self.full_path = self.get_log_file_path()
 
     def __post_init__(self):
         if self.log_levels_config.write_to_file:
@@ -172,9 +318,27 @@ class LoggerConfig:
             placement_config=PlacementConfig.from_dict(
                 {**data, **data.get("placement_config", {})}
             ),
+            formatter_config=FormatterConfig.from_dict(
+                {**data, **data.get("formatter_config", {})}
+            ),
             monitor_config=MonitorConfig.from_dict(
                 {**data, **data.get("monitor_config", {})}
             ),
+            async_config=AsyncConfig.from_dict(
+                {**data, **data.get("async_config", {})}
+            ),
+            file_config=FileConfig.from_dict(
+                {**data, **data.get("file_config", {})}
+            ),
+            collector_config=CollectorConfig.from_dict(
+                {**data, **data.get("collector_config", {})}
+            ),
+            profiler_config=ProfilerConfig.from_dict(
+                {**data, **data.get("profiler_config", {})}
+            ),
+            metrics_config=MetricsConfig.from_dict(
+                {**data, **data.get("metrics_config", {})}
+            ),
             colors=data.get("colors", cls.colors),
             path=data.get("path", cls.path),
             follow_logger_manager_rules=data.get("follow_logger_manager_rules", cls.follow_logger_manager_rules),
@@ -7,6 +7,9 @@
 # - Dynamically updating a global logger configuration based on registered loggers.
 # - Ensuring unique logger identifiers.
 # - Managing monitoring settings so that only one logger handles file log monitoring.
+# - Looking up registered loggers by identifier in constant time.
+# - Gathering the metrics of every logger identifier, and exporting them in the Prometheus format.
+# - Reporting the per-stage latency breakdown of the instrumented loggers.
 
 # ====== Imports ======
 # Standard library imports
@@ -15,6 +18,7 @@ from dataclasses import asdict
 
 # Internal project imports
 from logger.logger_configs import LoggerConfig
+from logger.metrics import MetricsExporter
 
 
 # ====== LoggerManager Class ======
@@ -52,7 +56,9 @@ class LoggerManager:
 
     # Private class attributes
     __loggers = []
+    __loggers_by_identifier = {}
     __monitoring_logger = None
+    __metrics_exporters = {}
 
     @classmethod
     def register_logger(cls, logger_instance) -> None:
@@ -81,6 +87,85 @@ class LoggerManager:
         if cls.enable_files_logs_monitoring_only_for_one_logger:
             cls._unique_monitoring_logger(logger_instance)
 
+        # The first logger registered with an identifier keeps it in the registry
+        cls.__loggers_by_identifier.setdefault(logger_instance.config.identifier, logger_instance)
+
+    @classmethod
+    def get_logger(cls, identifier: str):
+        """
+        Returns the registered logger with a given identifier.
+
+        Args:
+            identifier (str): The logger identifier.
+
+        Returns:
+            Logger | None: The first logger registered with this identifier, or None if there is none.
+        """
+        return cls.__loggers_by_identifier.get(identifier)
+
+    @classmethod
+    def get_metrics_snapshot(cls) -> dict[str, dict]:
+        """
+        Returns the metrics of the logging pipeline of every logger identifier.
+
+        Returns:
+            dict[str, dict]: The metrics returned by `Logger.get_metrics`, keyed by logger identifier.
+        """
+        return {
+            identifier: logger_instance.get_metrics()
+            for identifier, logger_instance in list(cls.__loggers_by_identifier.items())
+        }
+
+    @classmethod
+    def start_metrics_exporter(
+            cls, path: str | None = None, port: int | None = None, interval: float = 15.0
+    ) -> MetricsExporter:
+        """
+        Starts exporting the metrics snapshot in the Prometheus text format, once per destination.
+
+        Args:
+            path (str, optional): File rewritten every interval. Defaults to None.
+            port (int, optional): Local HTTP port serving `/metrics`. Defaults to None.
+            interval (float, optional): Time in seconds between two writes of the file. Defaults to 15.0.
+
+        Returns:
+            MetricsExporter: The exporter of this destination, started by the first call.
+        """
+        exporter = cls.__metrics_exporters.get((path, port))
+        if exporter is None:
+            exporter = MetricsExporter(cls.get_metrics_snapshot, path=path, port=port, interval=interval).start()
+            cls.__metrics_exporters[(path, port)] = exporter
+        return exporter
+
+    @classmethod
+    def get_latency_report(cls, reset: bool = False) -> str:
+        """
+        Returns the per-stage latency breakdown of every logger identifier with the instrumentation enabled.
+
+        Args:
+            reset (bool, optional): Start over from empty histograms. Defaults to False.
+
+        Returns:
+            str: One breakdown table per instrumented logger identifier.
+        """
+        reports = [
+            report for logger_instance in list(cls.__loggers_by_identifier.values())
+            if (report := logger_instance.get_latency_report(reset)) is not None
+        ]
+        return "\n\n".join(
+            ["=== Logging latency breakdown ==="] + (reports or ["No logger with latency_instrumentation enabled."])
+        )
+
+    @classmethod
+    def print_latency_report(cls, reset: bool = False) -> None:
+        """
+        Prints the per-stage latency breakdown of every instrumented logger identifier.
+
+        Args:
+            reset (bool, optional): Start over from empty histograms. Defaults to False.
+        """
+        print(cls.get_latency_report(reset))
+
     @classmethod
     def _combine_logger_config_with_global(cls, logger_instance):
         """
@@ -95,7 +180,7 @@ class LoggerManager:
 
         # The placement config is not compared with the default config because
         # it is automatically adjusted if logger follows LoggerManager rules
-        placement_config_dict_keys = asdict(cls.global_config.placement_config).keys()
+        placement_config_dict_keys = cls.global_config.placement_config.get_layout_attributes().keys()
 
         # Compare each attribute with the default config
         for key, value in new_logger_config_dict.items():
@@ -163,6 +248,11 @@ class LoggerManager:
 
         cls.__loggers = updated_loggers
 
+        # Identifiers may have changed: rebuild the registry, keeping the first logger of each identifier
+        cls.__loggers_by_identifier = {}
+        for logger in cls.__loggers:
+            cls.__loggers_by_identifier.setdefault(logger.config.identifier, logger)
+
     @classmethod
     def _unique_monitoring_logger(cls, new_logger_registered):
         """
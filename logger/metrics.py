@@ -0,0 +1,254 @@
+# ====== Code Summary ======
+# This module provides the counters and gauges describing the logging pipeline itself, and their export:
+# - `LoggerMetrics`: Records handed to the handlers by level, and records filtered by the logger level,
+#   counted by each `Logger` identifier.
+# - `HandlerMetrics`: Records formatted, bytes produced and formatting time of an output handler,
+#   counted by its `Formatter`.
+# - `render_prometheus`: Renders a snapshot (`LoggerManager.get_metrics_snapshot`) in the Prometheus
+#   text format.
+# - `MetricsExporter`: Writes the rendered snapshot to a file periodically (for a textfile collector)
+#   and/or serves it on a local HTTP port.
+# The metrics are opt-in (`metrics`, or an export destination). The counters are plain integer increments
+# without any lock: the handler counters are updated under the handler lock and are exact, the logger
+# counters are approximate, as an increment may be lost when several threads log at the very same time
+# (their Prometheus HELP text says so).
+
+# ====== Imports ======
+# Standard library imports
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Callable, Optional
+import threading
+import atexit
+import os
+
+# ====== Constants ======
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Metrics of a logger: (snapshot key, Prometheus name, type, help)
+LOGGER_METRICS = [
+    ("filtered_records", "logger_filtered_records_total", "counter",
+     "Records rejected by the logger level before being built (approximate under concurrent logging)."),
+    ("suppressed_records", "logger_suppressed_records_total", "counter",
+     "Records dropped by the write quota."),
+    ("dropped_records", "logger_dropped_records_total", "counter",
+     "Records dropped by the asynchronous queue backpressure policy or the collector backlog."),
+    ("queue_depth", "logger_queue_depth", "gauge",
+     "Records waiting in the asynchronous queue."),
+    ("degraded", "logger_degraded", "gauge",
+     "1 while the file output is degraded by the disk pressure."),
+]
+
+# Metrics of an output handler: (snapshot key, Prometheus name, type, help)
+HANDLER_METRICS = [
+    ("records", "logger_handler_records_total", "counter",
+     "Records formatted by the handler."),
+    ("bytes", "logger_handler_bytes_total", "counter",
+     "Bytes of formatted lines produced by the handler."),
+    ("flushes", "logger_handler_flushes_total", "counter",
+     "Writes of the handler to its stream, file or collector."),
+    ("format_seconds", "logger_handler_format_seconds_total", "counter",
+     "Time spent formatting records."),
+]
+
+
+# ====== Counters ======
+class LoggerMetrics:
+    """
+    Counters of a `Logger` identifier, updated by its logging methods without lock, hence approximate
+    when several threads log at the same time.
+    """
+    __slots__ = ("records", "filtered_records")
+
+    def __init__(self):
+        self.records: Counter[int] = Counter()  # Records handed to the handlers, by level
+        self.filtered_records = 0
+
+
+class HandlerMetrics:
+    """
+    Counters of an output handler, updated by its formatter under the handler lock.
+    """
+    __slots__ = ("records", "bytes", "format_time_ns")
+
+    def __init__(self):
+        self.records = 0
+        self.bytes = 0
+        self.format_time_ns = 0
+
+    def add(self, length: int, duration_ns: int) -> None:
+        """
+        Counts a formatted record.
+
+        Args:
+            length (int): Length of the formatted line, without its terminator.
+            duration_ns (int): Formatting time in nanoseconds.
+        """
+        self.records += 1
+        self.bytes += length + 1  # Line terminator
+        self.format_time_ns += duration_ns
+
+
+# ====== Functions ======
+def _escape_label(value: str) -> str:
+    """Escapes a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_sample(name: str, labels: dict[str, str], value) -> str:
+    """Renders one sample line of the Prometheus text format."""
+    rendered_labels = ",".join(f'{key}="{_escape_label(label)}"' for key, label in labels.items())
+    # Counters are printed in full, `repr` keeps every digit of the float values
+    rendered_value = int(value) if isinstance(value, (bool, int)) else repr(float(value))
+    return f"{name}{{{rendered_labels}}} {rendered_value}"
+
+
+def render_prometheus(snapshot: dict[str, dict]) -> str:
+    """
+    Renders a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (dict[str, dict]): The metrics of each logger identifier,
+            as returned by `LoggerManager.get_metrics_snapshot`.
+
+    Returns:
+        str: The metrics, one `# HELP`/`# TYPE` header per metric followed by its samples.
+    """
+    lines = [
+        "# HELP logger_records_total Records handed to the handlers, by level "
+        "(approximate under concurrent logging).",
+        "# TYPE logger_records_total counter",
+    ]
+    for identifier, metrics in snapshot.items():
+        for level, count in metrics["records"].items():
+            lines.append(_format_sample("logger_records_total", {"logger": identifier, "level": level}, count))
+
+    for key, name, metric_type, help_text in LOGGER_METRICS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+        for identifier, metrics in snapshot.items():
+            if metrics.get(key) is not None:
+                lines.append(_format_sample(name, {"logger": identifier}, metrics[key]))
+
+    for key, name, metric_type, help_text in HANDLER_METRICS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+        for identifier, metrics in snapshot.items():
+            for handler_name, handler_metrics in metrics["handlers"].items():
+                lines.append(_format_sample(name, {"logger": identifier, "handler": handler_name}, handler_metrics[key]))
+
+    return "\n".join(lines) + "\n"
+
+
+# ====== Exporter ======
+class MetricsExporter:
+    """
+    Exports the metrics snapshot in the Prometheus text format, to a file and/or on a local HTTP port.
+    """
+
+    def __init__(
+            self,
+            get_snapshot: Callable[[], dict[str, dict]],
+            path: Optional[str] = None,
+            port: Optional[int] = None,
+            interval: float = 15.0,
+            host: str = "127.0.0.1",
+    ):
+        """
+        Args:
+            get_snapshot (Callable[[], dict[str, dict]]): Returns the current metrics snapshot.
+            path (str, optional): File rewritten every interval (e.g. "metrics/logger.prom"). Defaults to None.
+            port (int, optional): HTTP port serving the metrics on `/metrics`, 0 for any free port.
+                Defaults to None (no server).
+            interval (float, optional): Time in seconds between two writes of the file. Defaults to 15.0.
+            host (str, optional): Address the HTTP server listens on. Defaults to "127.0.0.1".
+        """
+        self.get_snapshot = get_snapshot
+        self.path = path
+        self.port = port
+        self.interval = interval
+        self.host = host
+
+        self._stop_event = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def render(self) -> str:
+        """Renders the current snapshot in the Prometheus text format."""
+        return render_prometheus(self.get_snapshot())
+
+    def write(self) -> None:
+        """Writes the current snapshot to the file, atomically so that the scraper never reads a partial file."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self.render())
+        os.replace(temporary_path, self.path)
+
+    def _write_loop(self) -> None:
+        """Background loop writing the file every interval."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass  # Retried at the next interval
+
+    def _create_server(self) -> ThreadingHTTPServer:
+        """Creates the HTTP server answering every GET on `/metrics` with a fresh rendering."""
+        exporter = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep the scrapes out of stderr
+
+        server = ThreadingHTTPServer((self.host, self.port), MetricsRequestHandler)
+        server.daemon_threads = True
+        return server
+
+    def start(self) -> "MetricsExporter":
+        """
+        Starts the periodic file writer and the HTTP server, as configured.
+
+        Returns:
+            MetricsExporter: The exporter itself.
+        """
+        if self.path is not None:
+            try:
+                self.write()
+            except OSError:
+                pass  # Retried at the next interval
+            self._writer = threading.Thread(target=self._write_loop, name="logger-metrics-writer", daemon=True)
+            self._writer.start()
+        if self.port is not None:
+            self._server = self._create_server()
+            self.port = self._server.server_address[1]  # Actual port when 0 was given
+            threading.Thread(
+                target=self._server.serve_forever, name="logger-metrics-server", daemon=True
+            ).start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self) -> None:
+        """Stops the exporter, writing the file a last time. Safe to call several times."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self.path is not None:
+            try:
+                self.write()
+            except OSError:
+                pass
@@ -1,20 +1,29 @@
 # ====== Code Summary ======
 # This module provides a `DiskMonitor` class for monitoring disk usage and log files within a specified directory.
 # It includes functionalities for retrieving disk statistics, summarizing log files, and automatically cleaning logs
-# when they exceed a defined threshold.
+# when they exceed a defined threshold. Compressed log segments (`.log.gz`, `.log.xz`) are taken into account
+# with both their compressed (on-disk) and logical (uncompressed) sizes. Line counts and sizes are kept in
+# a sidecar index (`.log_index.json`) so that only the bytes appended since the last run are read.
+# With a monitoring interval, a background thread re-checks the disk and log files usage periodically,
+# raising alerts with hysteresis and spreading the cleanups over several checks. Cleanups are decided by the
+# retention engine (`logger.retention`) from a directory scan only: size, age and number of files limits.
 
 # ====== Imports ======
 # Standard library imports
 import os
-import re
 import shutil
 import datetime
+import threading
 from enum import Enum
-from typing import List
+from typing import List, Optional, Callable, Iterable
 from dataclasses import dataclass
 
 # Internal project imports
 from logger.logger_configs import MonitorConfig
+from logger.log_index import LogFilesIndex
+from logger.retention import (
+    RetentionPolicy, RetentionReport, extract_log_date, is_log_file, plan_retention, scan_log_files
+)
 
 
 # ====== Enum for Storage Units ======
@@ -62,10 +71,16 @@ class DiskUsage:
 class LogFileInfo:
     """
     Represents details of an individual log file.
+    For compressed files, `size` is the size on disk and `logical_size` the uncompressed size.
+    `line_count` (and `logical_size` for compressed files) is None if lines were not counted.
+    `truncated` compressed files (unterminated gzip stream) are only counted up to their last readable chunk.
     """
     path: str
     size: float
-    line_count: int
+    line_count: Optional[int]
+    logical_size: Optional[float]
+    compressed: bool = False
+    truncated: bool = False
 
 
 @dataclass
@@ -76,6 +91,7 @@ class LogFilesSummary:
     files: List[LogFileInfo]
     total_size: float
     usage_ratio: float
+    total_logical_size: float = 0
 
 
 # ====== Disk Monitor Class ======
@@ -86,7 +102,8 @@ class DiskMonitor:
     """
 
     def __init__(
-            self, logger, directory: str, config: MonitorConfig
+            self, logger, directory: str, config: MonitorConfig,
+            get_active_files: Optional[Callable[[], Iterable[str]]] = None,
     ):
         """
         Initializes the DiskMonitor with monitoring parameters.
@@ -95,6 +112,8 @@ class DiskMonitor:
             logger: Logger instance for logging information.
             directory (str): Directory to monitor.
             config (MonitorConfig): Configuration settings for monitoring.
+            get_active_files (Callable[[], Iterable[str]], optional): Returns the paths of the log files
+                being written, which the cleanup never deletes. Defaults to None (no protected file).
         """
         self.logger = logger
         self.directory: str = directory
@@ -107,7 +126,27 @@ class DiskMonitor:
             if config.max_log_file_size is not None
             else None
         )
+        self.retention_policy = RetentionPolicy(
+            max_total_size=self.max_log_size,
+            max_age=(
+                datetime.timedelta(days=config.max_log_age_days)
+                if config.max_log_age_days is not None
+                else None
+            ),
+            max_files=config.max_log_files,
+        )
+        self.get_active_files: Callable[[], Iterable[str]] = get_active_files or tuple
         self.enable_monitoring_logs: bool = config.files_monitoring
+        self.files_index = LogFilesIndex(directory, persistent=config.log_files_index)
+
+        # Periodic monitoring
+        self.monitoring_interval: float = config.monitoring_interval
+        self.alert_hysteresis: float = config.alert_hysteresis_percent
+        self.max_deletions_per_check: int = config.max_deletions_per_check
+        self._active_alerts: set[str] = set()
+        self._lock = threading.Lock()  # Serializes the uses of the files index (periodic checks run in a thread)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
 
     def convert_unit(self, size: float) -> float:
         """
@@ -127,96 +166,211 @@ class DiskMonitor:
             usage_ratio=round(used / total, 2)
         )
 
-    def get_log_files_info(self) -> LogFilesSummary:
+    @staticmethod
+    def is_log_file(filename: str) -> bool:
+        """
+        Checks whether a file is a log file, plain or compressed.
+        """
+        return is_log_file(filename)
+
+    def get_log_files_info(self, count_lines: bool = True) -> LogFilesSummary:
         """
         Retrieves information about log files in the monitored directory.
+        Files are only read as far as needed to update their line counts, see `LogFilesIndex`.
+
+        Args:
+            count_lines (bool, optional): Read the files changed since they were indexed to count their lines.
+                If False, their line count (and the logical size of compressed files) is None.
+                Defaults to True.
         """
         if not os.path.isdir(self.directory):
             return LogFilesSummary(files=[], total_size=0, usage_ratio=0)
 
-        log_files = []
-        total_size = 0
-
+        log_files_stats = []
         for root, _, files in os.walk(self.directory):
             for file in files:
                 # Only consider log files
-                if file.endswith(".log"):
+                if self.is_log_file(file):
                     file_path = os.path.join(root, file)
-                    file_size = os.path.getsize(file_path)
-                    with open(file_path, 'r') as f:
-                        line_count = sum(1 for _ in f)
-                    log_files.append(
-                        LogFileInfo(
-                            path=file_path,
-                            size=self.convert_unit(file_size),
-                            line_count=line_count
-                        )
-                    )
-                    total_size += file_size
+                    try:
+                        stat = os.stat(file_path)
+                    except FileNotFoundError:
+                        continue  # Deleted or rotated away since the directory was listed
+                    log_files_stats.append((file_path, stat, not file.endswith(".log")))
+
+        log_files = []
+        total_size = 0
+        total_logical_size = 0
+        with self._lock:
+            entries = self.files_index.get_entries(log_files_stats, count_lines=count_lines)
+            self.files_index.save()
+        for (file_path, stat, compressed), entry in zip(log_files_stats, entries):
+            if entry is not None:
+                logical_size = entry.logical_size
+            else:
+                logical_size = None if compressed else stat.st_size
+            log_files.append(
+                LogFileInfo(
+                    path=file_path,
+                    size=self.convert_unit(stat.st_size),
+                    line_count=entry.line_count if entry is not None else None,
+                    logical_size=self.convert_unit(logical_size) if logical_size is not None else None,
+                    compressed=compressed,
+                    truncated=entry is not None and entry.truncated,
+                )
+            )
+            total_size += stat.st_size
+            total_logical_size += logical_size or 0
 
         return LogFilesSummary(
             files=log_files,
             total_size=self.convert_unit(total_size),
-            usage_ratio=round(total_size / shutil.disk_usage(self.directory)[0], 2)
+            usage_ratio=round(total_size / shutil.disk_usage(self.directory)[0], 2),
+            total_logical_size=self.convert_unit(total_logical_size),
         )
 
     @staticmethod
     def extract_date(filename: str) -> datetime.datetime | None:
-        match = re.search(r"\d{8}", filename)
-        if match:
-            try:
-                return datetime.datetime.strptime(match.group(), "%Y-%m-%d")
-            except ValueError:
-                return None
-        return None
+        """
+        Extracts the day of a log file from its name (`YYYY-MM-DD.log`, or `YYYY-MM-DD.N.log[.gz|.xz]`
+        for rotated segments), None if the name does not contain a valid date.
+        """
+        return extract_log_date(filename)[0]
 
-    def clean_logs(self) -> None:
-        if self.enable_monitoring_logs:
-            self.logger.info("=== Logs Cleaning Info ===")
+    def clean_logs(
+            self, max_deletions: Optional[int] = None, verbose: bool = True, dry_run: bool = False
+    ) -> RetentionReport:
+        """
+        Deletes the oldest log files until the retention limits (total size, age, number of files) are met.
+        Only the results of a directory scan are used: no file is opened. The active log files are never deleted.
 
-        if self.max_log_size is None:
-            self.logger.info("Log cleanup is disabled.")
-            return
+        Args:
+            max_deletions (int, optional): Maximum number of files deleted by this call, to spread a large
+                cleanup over several calls. Defaults to None (no limit).
+            verbose (bool, optional): Log the cleanup steps even if there is nothing to delete. Defaults to True.
+            dry_run (bool, optional): Only log the files that would be deleted. Defaults to False.
 
-        log_summary = self.get_log_files_info()
-        total_size_bytes = log_summary.total_size * self.unit.factor
-
-        if total_size_bytes <= self.max_log_size:
-            self.logger.info(
-                f"Log size within limits "
-                f"({log_summary.total_size}{self.unit.value}"
-                f"/"
-                f"{self.convert_unit(self.max_log_size)}{self.unit.value})."
-            )
-            return
+        Returns:
+            RetentionReport: The deleted files (or the files that would be deleted, in dry-run mode).
+        """
+        if verbose and self.enable_monitoring_logs:
+            self.logger.info("=== Logs Cleaning Info ===")
 
-        logs_with_dates = []
-        for log in log_summary.files:
-            log_date = self.extract_date(os.path.basename(log.path))
-            if log_date:
-                logs_with_dates.append((log_date, log))
-            else:
-                self.logger.warning(f"Log file {log.path} has an invalid date format. Deleting it.")
-                try:
-                    os.remove(log.path)
-                    total_size_bytes -= log.size * self.unit.factor
-                    self.logger.info(f"Deleted log with invalid date format: {log.path} ({log.size} {self.unit.value})")
-                except Exception as e:
-                    self.logger.error(f"Failed to delete {log.path}: {str(e)}")
-
-        sorted_logs = [log for _, log in sorted(logs_with_dates, key=lambda x: x[0])]
-        self.logger.info("Starting log cleanup...")
-
-        while total_size_bytes > self.max_log_size and sorted_logs:
-            oldest_file = sorted_logs.pop(0)
+        if not self.retention_policy.is_enabled():
+            if verbose:
+                self.logger.info("Log cleanup is disabled.")
+            return RetentionReport(dry_run=dry_run)
+
+        report = plan_retention(
+            scan_log_files(self.directory),
+            self.retention_policy,
+            protected=self.get_active_files(),
+            max_deletions=max_deletions,
+        )
+        report.dry_run = dry_run
+
+        if not report.deletions:
+            if verbose:
+                self.logger.info(
+                    f"Log files within limits "
+                    f"({report.total_files} files, {self.convert_unit(report.total_size)}{self.unit.value})."
+                )
+            return report
+
+        self.logger.info("Starting log cleanup (dry run)..." if dry_run else "Starting log cleanup...")
+        deleted = []
+        for log_file, reason in report.deletions:
+            size = f"{self.convert_unit(log_file.size)} {self.unit.value}"
+            if dry_run:
+                self.logger.info(f"Would delete log: {log_file.path} ({size}, {reason} limit)")
+                deleted.append((log_file, reason))
+                continue
             try:
-                os.remove(oldest_file.path)
-                total_size_bytes -= oldest_file.size * self.unit.factor
-                self.logger.info(f"Deleted log: {oldest_file.path} ({oldest_file.size} {self.unit.value})")
+                os.remove(log_file.path)
+                deleted.append((log_file, reason))
+                self.logger.info(f"Deleted log: {log_file.path} ({size}, {reason} limit)")
+            except FileNotFoundError:
+                pass  # Already deleted (e.g. by another process)
             except Exception as e:
-                self.logger.error(f"Failed to delete {oldest_file.path}: {str(e)}")
+                self.logger.error(f"Failed to delete {log_file.path}: {str(e)}")
+        report.deletions = deleted
 
-        self.logger.info("Log cleanup completed.")
+        summary = (
+            f"{len(deleted)} files, {self.convert_unit(report.deleted_size)} {self.unit.value} "
+            f"of {report.total_files} files, {self.convert_unit(report.total_size)} {self.unit.value}"
+        )
+        if dry_run:
+            self.logger.info(f"Log cleanup dry run completed: would delete {summary}.")
+        elif report.complete:
+            self.logger.info(f"Log cleanup completed: deleted {summary}.")
+        else:
+            self.logger.info(f"Log cleanup paused after deleting {summary}, resumed at the next check.")
+        return report
+
+    # ====== Periodic Monitoring Methods ======
+    def _update_alert(self, name: str, ratio: float, threshold: float, label: str) -> None:
+        """
+        Raises an alert when a usage ratio reaches its threshold, and clears it only once the ratio
+        falls below the threshold minus the hysteresis margin, so that a ratio oscillating around
+        the threshold does not produce a flood of alerts.
+
+        Args:
+            name (str): Key of the alert.
+            ratio (float): The current usage ratio.
+            threshold (float): The alert threshold.
+            label (str): Description of the measured usage, used in the messages.
+        """
+        active = name in self._active_alerts
+        if not active and ratio >= threshold:
+            self._active_alerts.add(name)
+            self.logger.warning(f"{label} exceeded {threshold * 100:.0f}% ({ratio * 100:.2f}%)!")
+        elif active and ratio < threshold - self.alert_hysteresis:
+            self._active_alerts.discard(name)
+            self.logger.info(f"{label} back to {ratio * 100:.2f}% (alert threshold {threshold * 100:.0f}%).")
+
+    def check(self) -> None:
+        """
+        Runs one periodic check: updates the disk and log files usage alerts, then, if files monitoring
+        is enabled, deletes a bounded number of the oldest log files if a retention limit is exceeded.
+        Displaying the usage alone never deletes any file.
+        """
+        total, used, _ = shutil.disk_usage(self.directory)
+        self._update_alert("disk", used / total, self.disk_threshold, "Disk usage")
+
+        log_summary = self.get_log_files_info(count_lines=False)
+        self._update_alert("log_files", log_summary.usage_ratio, self.log_threshold, "Log files disk usage")
+
+        if self.enable_monitoring_logs:
+            self.clean_logs(max_deletions=self.max_deletions_per_check, verbose=False)
+
+    def _monitoring_loop(self) -> None:
+        """Background loop running a check every monitoring interval, sleeping in between."""
+        while not self._stop_event.wait(self.monitoring_interval):
+            try:
+                self.check()
+            except OSError as e:
+                # The directory may be missing or the disk unavailable for a while: retry at the next check
+                self.logger.error(f"Disk monitoring check failed: {e}")
+
+    def start(self) -> "DiskMonitor":
+        """
+        Starts the periodic checks in a background thread, if a monitoring interval is configured.
+
+        Returns:
+            DiskMonitor: The monitor itself, for chaining.
+        """
+        if self.monitoring_interval > 0 and self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._monitoring_loop, name="logger-disk-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the periodic checks."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
 
     def display_disk_usage(self) -> None:
         """
@@ -239,9 +393,17 @@ class DiskMonitor:
         self.logger.info("=== Log Files Info ===")
         self.logger.info(f"Number of logs: {len(log_summary.files)}")
         for log_file in log_summary.files:
-            self.logger.info(f"{log_file.path} ({log_file.size} {self.unit.value}, {log_file.line_count} lines)")
+            if log_file.compressed:
+                self.logger.info(
+                    f"{log_file.path} ({log_file.size} {self.unit.value} compressed, "
+                    f"{log_file.logical_size} {self.unit.value} logical, {log_file.line_count} lines"
+                    + (", truncated)" if log_file.truncated else ")")
+                )
+            else:
+                self.logger.info(f"{log_file.path} ({log_file.size} {self.unit.value}, {log_file.line_count} lines)")
         self.logger.info(f"Total log lines: {sum([f.line_count for f in log_summary.files])}")
         self.logger.info(f"Total log size: {log_summary.total_size} {self.unit.value}")
+        self.logger.info(f"Total logical log size: {log_summary.total_logical_size} {self.unit.value}")
         self.logger.info(f"Log storage usage: {log_summary.usage_ratio * 100:.2f}%")
 
     def display_monitoring(self) -> None:
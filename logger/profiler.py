@@ -0,0 +1,176 @@
+# ====== Code Summary ======
+# This module provides an opt-in statistical profiler attached to a `Logger`. A background thread samples
+# the stacks of every other thread with `sys._current_frames()` at a configurable rate and aggregates them
+# as collapsed stacks (`root;caller;leaf`). Every report interval (and at exit), it:
+# - logs the top-N hottest stacks of the period through the logger,
+# - writes the stacks collected since the start of the day to a flamegraph-compatible collapsed-stack file
+#   next to the dated log file (`logs/YYYY-MM-DD.<pid>.collapsed`, readable by flamegraph.pl or speedscope).
+# Only the profiler thread touches the aggregated stacks, so sampling takes no lock.
+
+# ====== Imports ======
+# Standard library imports
+from collections import Counter
+from types import CodeType, FrameType
+import threading
+import atexit
+import time
+import sys
+import os
+
+# Used to avoid circular imports and keep type hints
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logger.logger import Logger
+
+# ====== Constants ======
+MAX_STACK_DEPTH = 64  # Deeper stacks are truncated on the root side
+REPORTED_FRAMES = 4  # Frames shown (from the leaf) for each stack of the logged report
+
+
+# ====== Sampling Profiler ======
+class SamplingProfiler:
+    """
+    Background thread sampling the stacks of the other threads and reporting the hottest ones.
+    """
+
+    def __init__(
+            self,
+            logger: "Logger",
+            interval: float = 0.01,
+            report_interval: float = 60.0,
+            top_n: int = 10,
+    ):
+        """
+        Args:
+            logger (Logger): The logger receiving the reports, whose log directory receives the collapsed stacks.
+            interval (float, optional): Time in seconds between two samples. Defaults to 0.01 (100 Hz).
+            report_interval (float, optional): Time in seconds between two reports. Defaults to 60.0.
+            top_n (int, optional): Number of stacks of each report. Defaults to 10.
+        """
+        self.logger = logger
+        self.interval = interval
+        self.report_interval = report_interval
+        self.top_n = top_n
+
+        self._labels: dict[CodeType, str] = {}
+        self._period_stacks: Counter[str] = Counter()
+        self._total_stacks: Counter[str] = Counter()
+        self._period_samples = 0
+        self._collapsed_path = None
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sampling_loop, name="logger-profiler", daemon=True)
+
+    # ====== Lifecycle Methods ======
+    def start(self) -> "SamplingProfiler":
+        """
+        Starts sampling.
+
+        Returns:
+            SamplingProfiler: The profiler itself, for chaining.
+        """
+        self._thread.start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self) -> None:
+        """Stops sampling, then reports and writes the stacks collected since the last report."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        atexit.unregister(self.stop)
+
+    @property
+    def collapsed_path(self) -> str:
+        """
+        Path of the collapsed-stack file of the current day and process, next to the dated log file.
+        The process id keeps the processes sharing a log directory from overwriting each other's stacks.
+        """
+        return self.logger.config.get_log_file_path()[:-len(".log")] + f".{os.getpid()}.collapsed"
+
+    # ====== Sampling Methods ======
+    def _get_label(self, code: CodeType) -> str:
+        """Returns the label of a function in the collapsed stacks, computed once per code object."""
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = (
+                f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+        return label
+
+    def _collapse(self, frame: FrameType) -> str:
+        """Returns the collapsed stack of a frame, from the root to the leaf."""
+        labels = []
+        while frame is not None and len(labels) < MAX_STACK_DEPTH:
+            labels.append(self._get_label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+    def sample(self) -> None:
+        """Records the current stack of every thread, except the background threads of the logger."""
+        ignored = {
+            thread.ident for thread in threading.enumerate()
+            if thread.name.startswith("logger-")
+        }
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id not in ignored:
+                self._period_stacks[self._collapse(frame)] += 1
+        self._period_samples += 1
+
+    def _sampling_loop(self) -> None:
+        """Background loop sampling the stacks and reporting them every report interval."""
+        next_report_at = time.monotonic() + self.report_interval
+        period_start = time.monotonic()
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= next_report_at:
+                self.report(time.monotonic() - period_start)
+                period_start = time.monotonic()
+                next_report_at = period_start + self.report_interval
+        self.report(time.monotonic() - period_start)
+
+    # ====== Report Methods ======
+    def report(self, period: float) -> None:
+        """
+        Logs the hottest stacks of the period and writes the collapsed stacks of the day.
+
+        Args:
+            period (float): Duration in seconds of the reported period.
+        """
+        stacks, samples = self._period_stacks, self._period_samples
+        self._period_stacks, self._period_samples = Counter(), 0
+        if not samples:
+            return
+
+        if self.collapsed_path != self._collapsed_path:
+            # A new day starts a new collapsed-stack file
+            self._collapsed_path = self.collapsed_path
+            self._total_stacks = Counter()
+        self._total_stacks.update(stacks)
+
+        total = sum(stacks.values())
+        self.logger.info(
+            f"[profiler] {samples} samples over {period:.1f}s, top {min(self.top_n, len(stacks))} stacks:"
+        )
+        for rank, (stack, count) in enumerate(stacks.most_common(self.top_n), start=1):
+            frames = stack.split(";")
+            path = " <- ".join(reversed(frames[-REPORTED_FRAMES:]))
+            self.logger.info(f"[profiler] #{rank} {count / total:6.1%} ({count}) {path}")
+
+        self.write_collapsed_stacks()
+
+    def write_collapsed_stacks(self) -> None:
+        """Writes the stacks collected during the day to the collapsed-stack file (one `stack count` per line)."""
+        if self._collapsed_path is None:
+            return
+        temporary = self._collapsed_path + ".tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as collapsed_file:
+                collapsed_file.writelines(f"{stack} {count}\n" for stack, count in self._total_stacks.items())
+            os.replace(temporary, self._collapsed_path)
+        except OSError as error:
+            self.logger.warning(f"[profiler] Unable to write '{self._collapsed_path}': {error}")
@@ -0,0 +1,170 @@
+# ====== Code Summary ======
+# This module provides a `WriteQuota`, limiting the number of records and bytes a `Logger` may write per
+# second, so that a runaway loop cannot fill the disk between two monitoring checks. Each limit is an O(1)
+# token bucket refilled continuously, whose capacity is the budget of a time window (the allowed burst).
+# Once the buckets run low, records are shed by level:
+# - DEBUG records are dropped once the buckets are half empty,
+# - INFO records once they are nearly empty,
+# - WARNING and above are never dropped (they still consume the budget).
+# Dropped records are counted and reported by one periodic "N records suppressed" warning.
+# The byte cost of a record is estimated without rendering its message, so that lazy messages stay lazy
+# and the rendering stays on the writer thread in asynchronous mode.
+
+# ====== Imports ======
+# Standard library imports
+from typing import Optional
+import threading
+import logging
+import atexit
+import time
+
+# Internal project imports
+from logger.log_levels import LogLevels
+
+# ====== Constants ======
+# Share of the budget kept free for the more important levels: a record is only admitted if the
+# buckets stay above this fill ratio after paying for it. Levels not listed are always admitted.
+LEVEL_RESERVES = {
+    LogLevels.DEBUG: 0.5,
+    LogLevels.INFO: 0.1,
+}
+# Estimated size of what is not rendered yet: each %-style argument, and a lazy (non-string) message
+ARGUMENT_SIZE_ESTIMATE = 16
+LAZY_MESSAGE_SIZE_ESTIMATE = 64
+
+
+# ====== Token Bucket ======
+class TokenBucket:
+    """
+    Budget refilled at a constant rate, up to its capacity. Not thread-safe: used under the quota lock.
+    """
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, window: float):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            window (float): Duration in seconds of the budget held by a full bucket.
+        """
+        self.rate = rate
+        self.capacity = rate * window
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        """Adds the tokens earned since the last refill."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def can_take(self, cost: float, reserve: float) -> bool:
+        """Tells whether paying a cost leaves at least a given share of the capacity."""
+        return self.tokens - cost >= self.capacity * reserve
+
+    def take(self, cost: float) -> None:
+        """Pays a cost, without going below an empty bucket."""
+        self.tokens = max(0.0, self.tokens - cost)
+
+
+# ====== Write Quota ======
+class WriteQuota:
+    """
+    Record and byte budget of a `Logger`, checked once for each record before it reaches the handlers.
+    """
+
+    def __init__(
+            self,
+            logger,
+            max_records_per_second: Optional[float] = None,
+            max_bytes_per_second: Optional[float] = None,
+            window: float = 10.0,
+            summary_interval: float = 60.0,
+            line_overhead: int = 0,
+    ):
+        """
+        Args:
+            logger (Logger): The logger whose records are limited, which also reports the suppressed records.
+            max_records_per_second (float, optional): Record budget per second. Defaults to None (no limit).
+            max_bytes_per_second (float, optional): Byte budget per second. Defaults to None (no limit).
+            window (float, optional): Duration in seconds of the budget that can be spent in a burst. Defaults to 10.0.
+            summary_interval (float, optional): Minimum time in seconds between two suppressed records summaries.
+                Defaults to 60.0.
+            line_overhead (int, optional): Bytes added to each message by the formatter (date, identifier,
+                filename, level). Defaults to 0.
+        """
+        self.logger = logger
+        self.summary_interval = summary_interval
+        self.line_overhead = line_overhead
+        self.records_bucket = TokenBucket(max_records_per_second, window) if max_records_per_second else None
+        self.bytes_bucket = TokenBucket(max_bytes_per_second, window) if max_bytes_per_second else None
+        self.suppressed_records = 0  # Since the creation of the quota
+
+        self._lock = threading.Lock()
+        self._suppressed_by_level: dict[int, int] = {}
+        self._period_start = time.monotonic()
+        atexit.register(self.emit_summary)
+
+    def _get_cost(self, record) -> int:
+        """Returns the estimated size in bytes of the line written for a record, without rendering it."""
+        msg = record.msg
+        size = len(msg) if isinstance(msg, str) else LAZY_MESSAGE_SIZE_ESTIMATE
+        if record.args:
+            size += len(record.args) * ARGUMENT_SIZE_ESTIMATE
+        return size + self.line_overhead
+
+    def admit(self, record) -> bool:
+        """
+        Pays for a record if the budget allows its level, otherwise counts it as suppressed.
+
+        Args:
+            record (logging.LogRecord | CompactRecord): The record about to be handled.
+
+        Returns:
+            bool: True if the record must be handled, False if it is dropped.
+        """
+        reserve = LEVEL_RESERVES.get(record.levelno)
+        records_bucket, bytes_bucket = self.records_bucket, self.bytes_bucket
+
+        with self._lock:
+            now = time.monotonic()
+            if records_bucket is not None:
+                records_bucket.refill(now)
+            if bytes_bucket is not None:
+                bytes_bucket.refill(now)
+
+            # The record budget and the level reserve are checked before the byte cost is estimated
+            admitted = reserve is None or records_bucket is None or records_bucket.can_take(1, reserve)
+            cost = self._get_cost(record) if admitted and bytes_bucket is not None else 0
+            if admitted and reserve is not None and bytes_bucket is not None:
+                admitted = bytes_bucket.can_take(cost, reserve)
+            if admitted:
+                if records_bucket is not None:
+                    records_bucket.take(1)
+                if bytes_bucket is not None:
+                    bytes_bucket.take(cost)
+            else:
+                if not self._suppressed_by_level:
+                    self._period_start = now  # The summary period starts with the first suppressed record
+                self.suppressed_records += 1
+                self._suppressed_by_level[record.levelno] = self._suppressed_by_level.get(record.levelno, 0) + 1
+
+            summary_due = bool(self._suppressed_by_level) and now - self._period_start >= self.summary_interval
+
+        if summary_due:
+            self.emit_summary()
+        return admitted
+
+    def emit_summary(self) -> None:
+        """Logs how many records were suppressed since the previous summary, if any."""
+        with self._lock:
+            suppressed, self._suppressed_by_level = self._suppressed_by_level, {}
+            now = time.monotonic()
+            period, self._period_start = now - self._period_start, now
+        if not suppressed:
+            return
+
+        by_level = ", ".join(
+            f"{logging.getLevelName(level)}: {count}" for level, count in sorted(suppressed.items())
+        )
+        self.logger.warning(
+            f"[quota] {sum(suppressed.values())} records suppressed over the last {period:.1f}s ({by_level})"
+        )
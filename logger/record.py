@@ -0,0 +1,174 @@
+# ====== Code Summary ======
+# This module provides `CompactRecord`, a slim log record built by the `Logger` level methods instead of
+# the standard `logging.LogRecord`. A standard record carries a `__dict__` of about 20 attributes, most of
+# which (thread and process names, relative time, module...) are never used by our `Formatter`; a compact
+# record only holds what the formatter reads, in `__slots__`, which matters when records wait in the
+# asynchronous queue. `dispatch_compact_record` hands a compact record to the handlers of a logger, and
+# converts it to a standard record (once) for the handlers which could read other attributes.
+
+# ====== Imports ======
+# Standard library imports
+from typing import Any, Optional
+import logging
+import os
+
+# Internal project imports
+from logger.formatter import Formatter
+from logger.handlers import (
+    AsyncQueueHandler, BufferedFileHandler, RotatingFileHandler, CollectorHandler, CompressedFileHandler
+)
+
+# ====== Constants ======
+# Handlers whose only use of a record (besides its level) is to format it. Compared by exact type,
+# as a subclass may read any attribute of the record in an overridden `emit`.
+FORMATTING_HANDLER_TYPES = frozenset({
+    logging.StreamHandler,
+    logging.FileHandler,
+    BufferedFileHandler,
+    RotatingFileHandler,
+    CollectorHandler,
+    CompressedFileHandler,
+})
+
+
+# ====== Compact Record ======
+class CompactRecord:
+    """
+    Log record holding only the attributes used by `Formatter`. The attributes it does not store
+    (`levelname`, `msecs`, `filename`) are derived on access, using the same names as `logging.LogRecord`.
+    """
+    __slots__ = ("name", "levelno", "pathname", "lineno", "funcName", "msg", "args", "exc_info", "exc_text", "created")
+
+    stack_info = None  # Never captured by the `Logger` level methods
+
+    def __init__(
+            self,
+            name: str,
+            level: int,
+            pathname: str,
+            lineno: int,
+            func: Optional[str],
+            msg: Any,
+            args: tuple,
+            created: float,
+            exc_info=None,
+    ):
+        """
+        Args:
+            name (str): Identifier of the logger.
+            level (int): The log level.
+            pathname (str): Source file of the call site.
+            lineno (int): Line number of the call site.
+            func (str, optional): Function of the call site.
+            msg (Any): The message, rendered later by the formatter.
+            args (tuple): The %-style arguments of the message.
+            created (float): Creation time, as returned by `time.time()`.
+            exc_info (optional): Exception information, as for `logging.LogRecord`. Defaults to None.
+        """
+        self.name = name
+        self.levelno = level
+        self.pathname = pathname
+        self.lineno = lineno
+        self.funcName = func
+        self.msg = msg
+        self.args = args
+        self.exc_info = exc_info
+        self.exc_text = None
+        self.created = created
+
+    @property
+    def levelname(self) -> str:
+        return logging.getLevelName(self.levelno)
+
+    @property
+    def msecs(self) -> float:
+        return (self.created - int(self.created)) * 1000
+
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.pathname)
+
+    def getMessage(self) -> str:
+        """Returns the message with its arguments applied, as `logging.LogRecord.getMessage`."""
+        msg = str(self.msg)
+        if self.args:
+            msg = msg % self.args
+        return msg
+
+    def to_log_record(self) -> logging.LogRecord:
+        """
+        Converts the record to a standard record, built by the current log record factory.
+        The thread and process attributes are those of the converting thread.
+
+        Returns:
+            logging.LogRecord: The equivalent standard record.
+        """
+        record = logging.getLogRecordFactory()(
+            self.name, self.levelno, self.pathname, self.lineno, self.msg, self.args, self.exc_info, self.funcName
+        )
+        record.created = self.created
+        record.msecs = self.msecs
+        record.relativeCreated = (self.created - logging._startTime) * 1000
+        record.exc_text = self.exc_text
+        return record
+
+    def __repr__(self) -> str:
+        return f'<CompactRecord: {self.name}, {self.levelno}, {self.pathname}, {self.lineno}, "{self.msg}">'
+
+
+# ====== Functions ======
+def accepts_compact_records(handler: logging.Handler) -> bool:
+    """
+    Tells whether a handler can be given compact records: it must only format them with our `Formatter`
+    and have no filter. An asynchronous queue accepts them if all its output handlers do.
+
+    Args:
+        handler (logging.Handler): The handler.
+
+    Returns:
+        bool: True if the handler accepts compact records.
+    """
+    if handler.filters:
+        return False
+    if type(handler) is AsyncQueueHandler:
+        return all(accepts_compact_records(output) for output in handler.handlers)
+    return type(handler) in FORMATTING_HANDLER_TYPES and isinstance(handler.formatter, Formatter)
+
+
+def dispatch_compact_record(logger: logging.Logger, record: CompactRecord) -> None:
+    """
+    Hands a compact record to the handlers of a logger and of its ancestors, as `logging.Logger.handle`.
+    Handlers which do not accept compact records receive a standard record, converted once.
+    Loggers with filters, or without any handler to reach, go through `logging.Logger.handle`.
+
+    Args:
+        logger (logging.Logger): The logger the record was emitted on.
+        record (CompactRecord): The record.
+    """
+    if logger.disabled:
+        return
+    if logger.filters:
+        logger.handle(record.to_log_record())
+        return
+
+    standard_record = None
+    found = 0
+    current = logger
+    while current:
+        for handler in current.handlers:
+            found += 1
+            if record.levelno < handler.level:
+                continue
+            if accepts_compact_records(handler):
+                handler.handle(record)
+            else:
+                if standard_record is None:
+                    standard_record = record.to_log_record()
+                handler.handle(standard_record)
+        if not current.propagate:
+            break
+        current = current.parent
+
+    if not found:
+        # Let the standard logic use the last resort handler
+        logger.handle(record.to_log_record())
@@ -0,0 +1,203 @@
+# ====== Code Summary ======
+# This module provides the retention engine used by `DiskMonitor.clean_logs`. It decides which log files
+# to delete from the results of a single `os.scandir` pass (one stat per file, no file is opened):
+# - `RetentionPolicy`: Combined limits on the total size, the age and the number of log files.
+# - `scan_log_files`: Lists the log files (plain or compressed) with their size and date.
+# - `plan_retention`: Picks the oldest files to delete with a heap, until every limit is met,
+#   never touching the protected (active) files. The resulting `RetentionReport` can be applied
+#   or only displayed (dry run).
+# Dates come from the names written by `LoggerConfig` (`YYYY-MM-DD.log`, rotated segments
+# `YYYY-MM-DD.N.log[.gz|.xz]`), or from the modification time for other names.
+
+# ====== Imports ======
+# Standard library imports
+import os
+import re
+import heapq
+import datetime
+from typing import Optional, Iterable
+from dataclasses import dataclass, field
+
+# Internal project imports
+from logger.handlers.compression import COMPRESSED_LOG_EXTENSIONS
+
+# ====== Constants ======
+# Date of the day and optional segment number of the rotated segments
+LOG_FILENAME_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})(?:\.(\d+))?\.log")
+LOG_DATE_FORMAT = "%Y-%m-%d"
+
+
+# ====== Data Classes ======
+@dataclass
+class RetentionPolicy:
+    """
+    Limits applied to the log files of a directory. Each limit is disabled when None.
+    """
+    max_total_size: Optional[float] = None  # In bytes
+    max_age: Optional[datetime.timedelta] = None
+    max_files: Optional[int] = None
+
+    def is_enabled(self) -> bool:
+        """Check if at least one limit is set."""
+        return self.max_total_size is not None or self.max_age is not None or self.max_files is not None
+
+
+@dataclass
+class LogFileEntry:
+    """
+    A log file as seen by the retention engine.
+    """
+    path: str
+    size: int
+    date: datetime.datetime
+    segment: int  # 0 for the file of the day, N for its rotated segment `.N`
+    mtime: float
+
+    @property
+    def age_key(self) -> tuple:
+        """Sort key from the oldest to the newest file. The file of the day is newer than its segments."""
+        return self.date, self.segment or float("inf"), self.mtime
+
+
+@dataclass
+class RetentionReport:
+    """
+    Files selected for deletion by `plan_retention`, each with the limit it violates ("age", "size" or "count").
+    """
+    deletions: list[tuple[LogFileEntry, str]] = field(default_factory=list)
+    total_size: int = 0
+    total_files: int = 0
+    complete: bool = True  # False if `max_deletions` stopped the selection before every limit was met
+    dry_run: bool = False
+
+    @property
+    def deleted_size(self) -> int:
+        """Total size in bytes of the selected files."""
+        return sum(entry.size for entry, _ in self.deletions)
+
+
+# ====== Functions ======
+def is_log_file(filename: str) -> bool:
+    """
+    Checks whether a file is a log file, plain or compressed.
+    """
+    return filename.endswith(".log") or filename.endswith(COMPRESSED_LOG_EXTENSIONS)
+
+
+def extract_log_date(filename: str) -> tuple[Optional[datetime.datetime], int]:
+    """
+    Extracts the day and the segment number from the name of a log file.
+
+    Args:
+        filename (str): Name of the log file (e.g. "2025-01-31.log" or "2025-01-31.2.log.gz").
+
+    Returns:
+        tuple[datetime.datetime | None, int]: The day (None if the name does not contain a valid date)
+            and the segment number (0 for the file of the day).
+    """
+    match = LOG_FILENAME_PATTERN.search(filename)
+    if match:
+        try:
+            return datetime.datetime.strptime(match.group(1), LOG_DATE_FORMAT), int(match.group(2) or 0)
+        except ValueError:
+            pass
+    return None, 0
+
+
+def scan_log_files(directory: str) -> list[LogFileEntry]:
+    """
+    Lists the log files of a directory and of its subdirectories with `os.scandir`.
+
+    Args:
+        directory (str): The log directory.
+
+    Returns:
+        list[LogFileEntry]: The log files, dated by their name or, failing that, by their modification time.
+    """
+    log_files = []
+    directories = [directory]
+    while directories:
+        try:
+            scanner = os.scandir(directories.pop())
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                        continue
+                    if not is_log_file(entry.name):
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Deleted or rotated away since the directory was listed
+
+                date, segment = extract_log_date(entry.name)
+                log_files.append(LogFileEntry(
+                    path=entry.path,
+                    size=stat.st_size,
+                    date=date or datetime.datetime.fromtimestamp(stat.st_mtime),
+                    segment=segment,
+                    mtime=stat.st_mtime,
+                ))
+    return log_files
+
+
+def plan_retention(
+        log_files: list[LogFileEntry],
+        policy: RetentionPolicy,
+        protected: Iterable[str] = (),
+        now: Optional[datetime.datetime] = None,
+        max_deletions: Optional[int] = None,
+) -> RetentionReport:
+    """
+    Selects the oldest log files to delete until the total size, age and count limits are met.
+    The files are put in a heap (built in linear time), so only the selected files are popped in order.
+
+    Args:
+        log_files (list[LogFileEntry]): The log files of the directory.
+        policy (RetentionPolicy): The limits to enforce.
+        protected (Iterable[str], optional): Paths of the files that must never be deleted (active files).
+            They still count towards the limits.
+        now (datetime.datetime, optional): Reference time of the age limit. Defaults to the current time.
+        max_deletions (int, optional): Maximum number of selected files. Defaults to None (no limit).
+
+    Returns:
+        RetentionReport: The selected files, from the oldest to the newest.
+    """
+    protected = {os.path.abspath(path) for path in protected}
+    report = RetentionReport(total_size=sum(f.size for f in log_files), total_files=len(log_files))
+    oldest_allowed = None
+    if policy.max_age is not None:
+        # Whole days are kept: the files of the day reached by `max_age` are not deleted yet
+        oldest_day = ((now or datetime.datetime.now()) - policy.max_age).date()
+        oldest_allowed = datetime.datetime.combine(oldest_day, datetime.time.min)
+
+    heap = [
+        (log_file.age_key, index) for index, log_file in enumerate(log_files)
+        if os.path.abspath(log_file.path) not in protected
+    ]
+    heapq.heapify(heap)
+
+    remaining_size, remaining_files = report.total_size, report.total_files
+    while heap:
+        log_file = log_files[heap[0][1]]
+        if oldest_allowed is not None and log_file.date < oldest_allowed:
+            reason = "age"
+        elif policy.max_total_size is not None and remaining_size > policy.max_total_size:
+            reason = "size"
+        elif policy.max_files is not None and remaining_files > policy.max_files:
+            reason = "count"
+        else:
+            break  # The oldest remaining file is kept, so are all the newer ones
+
+        if max_deletions is not None and len(report.deletions) >= max_deletions:
+            report.complete = False
+            break
+        heapq.heappop(heap)
+        report.deletions.append((log_file, reason))
+        remaining_size -= log_file.size
+        remaining_files -= 1
+
+    return report
@@ -0,0 +1,158 @@
+# ====== Code Summary ======
+# This module provides samplers limiting the number of records written by the `log` and `time_tracker`
+# decorators on very hot functions. A sampler is asked once per call, before anything is built, and
+# returns the weight of the call: 0 to skip it, otherwise the number of calls the emitted line stands for.
+# The weight is appended to the emitted line (`[sample weight=N]`) so that `LogAnalyser` can scale counts back up.
+# - `FixedRateSampler`: Emits 1 call out of N.
+# - `ProbabilisticSampler`: Emits each call with a given probability.
+# - `AdaptiveSampler`: Caps the emitted calls per second, raising the sampling ratio under load.
+
+# ====== Imports ======
+# Standard library imports
+from abc import ABC, abstractmethod
+import itertools
+import threading
+import random
+import math
+import time
+
+
+# ====== Functions ======
+def format_sample_weight(weight: float) -> str:
+    """
+    Returns the suffix recording the sampling weight of an emitted line, empty for unsampled lines.
+
+    Args:
+        weight (float): The number of calls the line stands for.
+
+    Returns:
+        str: The suffix appended to the log message.
+    """
+    return "" if weight == 1 else f" [sample weight={weight:g}]"
+
+
+# ====== Samplers ======
+class Sampler(ABC):
+    """
+    Base class of the samplers. Each decorated function gets its own sampler, created by `spawn`.
+    """
+
+    @abstractmethod
+    def sample(self) -> float:
+        """
+        Decides whether the current call is emitted.
+
+        Returns:
+            float: 0 to skip the call, otherwise the number of calls the emitted line stands for.
+        """
+
+    @abstractmethod
+    def spawn(self) -> "Sampler":
+        """Returns a new sampler with the same settings and a fresh state."""
+
+
+class FixedRateSampler(Sampler):
+    """
+    Emits the first call, then one call out of every `rate` calls.
+    """
+
+    def __init__(self, rate: int):
+        """
+        Args:
+            rate (int): Number of calls per emitted call (1 emits every call).
+
+        Raises:
+            ValueError: If the rate is lower than 1.
+        """
+        if rate < 1:
+            raise ValueError(f"The sampling rate must be at least 1, got {rate}")
+        self.rate = rate
+        self._counter = itertools.count()  # `next` is atomic, no lock is needed
+
+    def sample(self) -> float:
+        return self.rate if next(self._counter) % self.rate == 0 else 0
+
+    def spawn(self) -> "FixedRateSampler":
+        return FixedRateSampler(self.rate)
+
+
+class ProbabilisticSampler(Sampler):
+    """
+    Emits each call independently with a given probability.
+    """
+
+    def __init__(self, probability: float):
+        """
+        Args:
+            probability (float): Probability of emitting a call, in ]0, 1].
+
+        Raises:
+            ValueError: If the probability is not in ]0, 1].
+        """
+        if not 0 < probability <= 1:
+            raise ValueError(f"The sampling probability must be in ]0, 1], got {probability}")
+        self.probability = probability
+        self._weight = 1 / probability
+
+    def sample(self) -> float:
+        return self._weight if random.random() < self.probability else 0
+
+    def spawn(self) -> "ProbabilisticSampler":
+        return ProbabilisticSampler(self.probability)
+
+
+class AdaptiveSampler(Sampler):
+    """
+    Caps the number of emitted calls per second. The sampling ratio of each window is derived from the
+    call rate of the previous one (1 out of N calls), and the cap is enforced within the window to absorb
+    sudden bursts. The weight of an emitted call is the number of calls since the previous emitted one.
+    """
+
+    def __init__(self, max_per_second: int, window: float = 1.0):
+        """
+        Args:
+            max_per_second (int): Maximum number of emitted calls per second.
+            window (float, optional): Duration in seconds of the windows used to measure the call rate. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the maximum is lower than 1.
+        """
+        if max_per_second < 1:
+            raise ValueError(f"The maximum number of calls per second must be at least 1, got {max_per_second}")
+        self.max_per_second = max_per_second
+        self.window = window
+        self._max_per_window = max(1, round(max_per_second * window))
+        self._lock = threading.Lock()
+        self._window_end = time.monotonic() + window
+        self._ratio = 1
+        self._calls = 0
+        self._emitted = 0
+        self._skipped = 0
+
+    @property
+    def ratio(self) -> int:
+        """Current sampling ratio: one call out of `ratio` is emitted."""
+        return self._ratio
+
+    def sample(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._window_end:
+                self._ratio = max(1, math.ceil(self._calls / self._max_per_window))
+                self._window_end = now + self.window
+                self._calls = self._emitted = 0
+
+            calls = self._calls
+            self._calls += 1
+            if calls % self._ratio or self._emitted >= self._max_per_window:
+                self._skipped += 1
+                return 0
+
+            # The emitted call stands for every call skipped since the previous one, including
+            # those skipped by the cap, so that the weights add up to the real number of calls
+            weight, self._skipped = self._skipped + 1, 0
+            self._emitted += 1
+            return weight
+
+    def spawn(self) -> "AdaptiveSampler":
+        return AdaptiveSampler(self.max_per_second, self.window)
@@ -0,0 +1,304 @@
+# ====== Code Summary ======
+# This module aggregates the execution times measured by `time_tracker(aggregate=True)` in memory,
+# instead of writing one log line per call:
+# - `LatencyHistogram`: count/total/min/max and a log-bucketed histogram giving p50/p90/p99/p999.
+# - `FunctionTimingStats`: Per-function statistics, recorded in per-thread histograms (each with its own
+#   uncontended lock) and merged when a summary is emitted.
+# - `TimingAggregator`: Background thread emitting a compact summary line of each function through its
+#   logger on a configurable interval, and once more at exit.
+
+# ====== Imports ======
+# Standard library imports
+from typing import Optional
+import traceback
+import threading
+import atexit
+import math
+import time
+import sys
+
+# Used to avoid circular imports and keep type hints
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logger.logger import Logger
+
+# ====== Constants ======
+# Each power of two is split into SUB_BUCKETS buckets: percentiles are accurate to about 3%
+SUB_BUCKETS = 16
+MIN_DURATION = 1e-9  # Durations are clamped to 1ns so that they all have a bucket
+SUMMARY_PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("p999", 0.999))
+
+
+# ====== Functions ======
+def format_duration(seconds: float) -> str:
+    """
+    Formats a duration with a unit adapted to its magnitude.
+
+    Args:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The formatted duration (e.g. "850ns", "12.3µs", "4.56ms", "1.234s").
+    """
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.0f}ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+# ====== Latency Histogram ======
+class LatencyHistogram:
+    """
+    Histogram of durations with logarithmic buckets, along with their count, total, minimum and maximum.
+    It is not thread-safe: each thread records into its own histogram, and histograms are merged.
+    """
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets: dict[int, int] = {}
+
+    @staticmethod
+    def _get_bucket(value: float) -> int:
+        """Returns the index of the bucket of a duration."""
+        mantissa, exponent = math.frexp(value if value > MIN_DURATION else MIN_DURATION)
+        return exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+    @staticmethod
+    def _get_bucket_value(index: int) -> float:
+        """Returns the middle of the range of durations of a bucket."""
+        exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub_bucket + 0.5) / (2 * SUB_BUCKETS), exponent)
+
+    def add(self, value: float) -> None:
+        """
+        Records a duration.
+
+        Args:
+            value (float): The duration in seconds.
+        """
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        index = self._get_bucket(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Adds the durations recorded by another histogram.
+
+        Args:
+            other (LatencyHistogram): The histogram to merge into this one.
+        """
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded durations, 0 if there is none."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Returns an approximation of a percentile of the recorded durations.
+
+        Args:
+            fraction (float): The percentile, between 0 and 1 (e.g. 0.99 for p99).
+
+        Returns:
+            float: The estimated duration in seconds, 0 if no duration was recorded.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(fraction * self.count))
+        cumulated = 0
+        for index in sorted(self.buckets):
+            cumulated += self.buckets[index]
+            if cumulated >= rank:
+                return min(max(self._get_bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> str:
+        """Returns a compact, single-line description of the recorded durations."""
+        percentiles = " ".join(
+            f"{name}={format_duration(self.percentile(fraction))}" for name, fraction in SUMMARY_PERCENTILES
+        )
+        return (
+            f"calls={self.count} min={format_duration(self.min)} mean={format_duration(self.mean)} "
+            f"max={format_duration(self.max)} {percentiles}"
+        )
+
+
+# ====== Function Timing Stats ======
+class _ThreadHistogram:
+    """Histogram written by a single thread, and read by the aggregator when merging."""
+    __slots__ = ("thread", "lock", "histogram")
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.lock = threading.Lock()  # Only contended while the aggregator collects the histogram
+        self.histogram = LatencyHistogram()
+
+
+class FunctionTimingStats:
+    """
+    Execution times of one decorated function, recorded per thread and summarised periodically.
+    """
+
+    def __init__(self, name: str, interval: float):
+        """
+        Args:
+            name (str): Description of the function used in the summary lines.
+            interval (float): Time in seconds between two summaries.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        if not interval > 0:
+            raise ValueError(f"The summary interval must be positive, got {interval}")
+        self.name = name
+        self.interval = interval
+        self.logger: Optional["Logger"] = None
+        self.next_summary_at = time.monotonic() + interval
+        self._last_summary_at = time.monotonic()
+        self._local = threading.local()
+        self._thread_histograms: list[_ThreadHistogram] = []
+        self._lock = threading.Lock()
+
+    def _get_thread_histogram(self) -> _ThreadHistogram:
+        """Returns the histogram of the calling thread, creating it on its first call."""
+        thread_histogram = getattr(self._local, "histogram", None)
+        if thread_histogram is None:
+            thread_histogram = self._local.histogram = _ThreadHistogram()
+            with self._lock:
+                self._thread_histograms.append(thread_histogram)
+        return thread_histogram
+
+    def record(self, elapsed: float) -> None:
+        """
+        Records an execution time for the calling thread.
+
+        Args:
+            elapsed (float): The execution time in seconds.
+        """
+        thread_histogram = self._get_thread_histogram()
+        with thread_histogram.lock:
+            thread_histogram.histogram.add(elapsed)
+
+    def collect(self) -> LatencyHistogram:
+        """
+        Merges and resets the histograms of every thread. Histograms of finished threads are dropped.
+
+        Returns:
+            LatencyHistogram: The execution times recorded since the previous collection.
+        """
+        merged = LatencyHistogram()
+        with self._lock:
+            for thread_histogram in self._thread_histograms:
+                with thread_histogram.lock:
+                    merged.merge(thread_histogram.histogram)
+                    thread_histogram.histogram = LatencyHistogram()
+            self._thread_histograms = [
+                thread_histogram for thread_histogram in self._thread_histograms
+                if thread_histogram.thread.is_alive()
+            ]
+        return merged
+
+    def emit_summary(self) -> None:
+        """Logs the summary of the execution times recorded since the previous summary, if any."""
+        now = time.monotonic()
+        elapsed, self._last_summary_at = now - self._last_summary_at, now
+        self.next_summary_at = now + self.interval
+
+        histogram = self.collect()
+        if histogram.count and self.logger is not None:
+            self.logger.debug(f"{self.name} timing over {elapsed:.1f}s: {histogram.summary()}")
+
+
+# ====== Timing Aggregator ======
+class TimingAggregator:
+    """
+    Background thread emitting the summary of each registered function when its interval elapses,
+    and the summaries of every function at exit.
+    """
+
+    def __init__(self):
+        self._stats: list[FunctionTimingStats] = []
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._thread = threading.Thread(target=self._summary_loop, name="logger-timing-aggregator", daemon=True)
+        self._thread.start()
+        atexit.register(self.emit_summaries)
+
+    def register(self, stats: FunctionTimingStats) -> None:
+        """
+        Starts summarising the execution times of a function.
+
+        Args:
+            stats (FunctionTimingStats): The statistics of the function.
+        """
+        with self._lock:
+            if stats not in self._stats:
+                self._stats.append(stats)
+        self._wake_event.set()  # The new interval may end before the current wait
+
+    @staticmethod
+    def _emit_summary(stats: FunctionTimingStats) -> None:
+        """Emits a summary, reporting an error on stderr so that it never stops the other summaries."""
+        try:
+            stats.emit_summary()
+        except Exception:
+            print(f"[time_tracker] Unable to log the timing summary of {stats.name}:", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+
+    def emit_summaries(self) -> None:
+        """Emits the summary of every registered function, regardless of their interval."""
+        with self._lock:
+            stats_list = list(self._stats)
+        for stats in stats_list:
+            self._emit_summary(stats)
+
+    def _summary_loop(self) -> None:
+        """Background loop emitting the summaries whose interval elapsed."""
+        while True:
+            with self._lock:
+                stats_list = list(self._stats)
+            next_summary_at = min((stats.next_summary_at for stats in stats_list), default=None)
+            self._wake_event.wait(
+                timeout=None if next_summary_at is None else max(0.0, next_summary_at - time.monotonic())
+            )
+            self._wake_event.clear()
+
+            now = time.monotonic()
+            for stats in stats_list:
+                if now >= stats.next_summary_at:
+                    self._emit_summary(stats)
+
+
+# ====== Shared Instance ======
+_aggregator: TimingAggregator | None = None
+_aggregator_lock = threading.Lock()
+
+
+def get_timing_aggregator() -> TimingAggregator:
+    """Returns the aggregator shared by every aggregating `time_tracker`, starting it on first use."""
+    global _aggregator
+    with _aggregator_lock:
+        if _aggregator is None:
+            _aggregator = TimingAggregator()
+        return _aggregator
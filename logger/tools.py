@@ -1,14 +1,21 @@
 # ====== Code Summary ======
 # This module provides utility functions for logging and function metadata retrieval.
 # - `center_and_limit`: Centers or truncates text with trailing dots.
+# - `FunctionMetadata`: Module, class and signature of a decorated function, computed once.
+# - `FunctionCallMessage`: Deferred description of a function call, rendered when the record is emitted.
 # - `get_function_metadata`: Generates a metadata string for function calls.
 # - `get_logger_from_decorator_param`: Resolves a logger instance from various input types.
+# - `DecoratorLoggerResolver`: Resolves the logger of a decorator once, and caches it for later calls.
+# - `BoundedCache`: Size-bounded LRU cache with hit/miss counters.
 
 # ====== Imports ======
 # Standard library imports
+from collections import OrderedDict, namedtuple
 from functools import lru_cache
-from typing import Callable, Union, Any
+from typing import Callable, Union, Any, Hashable
+import threading
 import inspect
+import weakref
 
 # Used to avoid circular imports and keep type hints
 from typing import TYPE_CHECKING
@@ -17,6 +24,71 @@ if TYPE_CHECKING:
     from logger.logger import Logger
 
 
+# ====== Type Hints ======
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+# ====== Caches ======
+class BoundedCache:
+    """
+    Least-recently-used cache with a fixed maximum size and hit/miss counters,
+    used to size caches on hot logging paths.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of entries kept. Defaults to 1024.
+        """
+        self.maxsize = max(1, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key and records a hit or a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any, optional): Value returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or `default` if the key is not cached.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+        """
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Returns the cache statistics, in the same shape as `functools.lru_cache`."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Removes every entry and resets the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+# ====== Functions ======
 @lru_cache(maxsize=100)
 def center_and_limit(text: str, width: int, trailing_dots: int = 2):
     """
@@ -38,6 +110,98 @@ def center_and_limit(text: str, width: int, trailing_dots: int = 2):
     )
 
 
+class FunctionMetadata:
+    """
+    Description of a decorated function (module, class, name and signature), computed once
+    when the function is decorated and reused to render each of its calls.
+    """
+    __slots__ = ("func", "signature", "prefix")
+
+    def __init__(self, func: Callable):
+        """
+        Args:
+            func (Callable): The function being described.
+        """
+        self.func = func
+        try:
+            self.signature = inspect.signature(func)
+        except (TypeError, ValueError):  # Some builtins do not expose their signature
+            self.signature = None
+
+        module_name = (getattr(func, "__module__", None) or "?").split(".")[-1]  # Shortened module name
+        qualname_parts = getattr(func, "__qualname__", func.__name__).split(".")
+        class_name = (
+            qualname_parts[-2] if len(qualname_parts) > 1 and qualname_parts[-2] != "<locals>" else None
+        )
+        self.prefix = f"[{module_name}] {class_name + '.' if class_name else ''}{func.__name__}"
+
+    def render(self, args: tuple, kwargs: dict, max_params_length: int = 15) -> str:
+        """
+        Renders a call of the function with its parameter values, optionally truncating long values.
+
+        Args:
+            args (tuple): Positional arguments passed to the function.
+            kwargs (dict): Keyword arguments passed to the function.
+            max_params_length (int, optional): Maximum length for each argument's string representation.
+                Negative values disable the truncation. Defaults to 15.
+
+        Returns:
+            str: A formatted string containing function metadata.
+        """
+        if self.signature is None:
+            arguments = {**{f"arg{index}": value for index, value in enumerate(args)}, **kwargs}
+        else:
+            try:
+                bound_args = self.signature.bind(*args, **kwargs)
+            except TypeError:  # The call itself failed for the same reason
+                arguments = {**{f"arg{index}": value for index, value in enumerate(args)}, **kwargs}
+            else:
+                bound_args.apply_defaults()
+                arguments = bound_args.arguments
+
+        def truncate(value: Any) -> str:
+            """Truncate string representation of a value if it exceeds max_length."""
+            value_str = repr(value)
+            return value_str if len(value_str) <= max_params_length else value_str[:max_params_length - 3] + '...'
+
+        # Don't truncate if max_params_length is negative
+        if max_params_length < 0:
+            params_info = ", ".join(f"{k}={v}" for k, v in arguments.items())
+        else:
+            params_info = ", ".join(f"{k}={truncate(v)}" for k, v in arguments.items())
+
+        return f"{self.prefix}({params_info})"
+
+
+class FunctionCallMessage:
+    """
+    Log message describing a function call, rendered only when a handler emits the record.
+    """
+    __slots__ = ("metadata", "args", "kwargs", "suffix")
+
+    def __init__(self, metadata: FunctionMetadata, args: tuple, kwargs: dict, suffix: str = ""):
+        """
+        Args:
+            metadata (FunctionMetadata): Description of the called function.
+            args (tuple): Positional arguments passed to the function.
+            kwargs (dict): Keyword arguments passed to the function.
+            suffix (str, optional): Text appended after the call description. Defaults to "".
+        """
+        self.metadata = metadata
+        self.args = args
+        self.kwargs = kwargs
+        self.suffix = suffix
+
+    def __str__(self) -> str:
+        return self.metadata.render(self.args, self.kwargs) + self.suffix
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_function_metadata(func: Callable) -> FunctionMetadata:
+    """Returns the metadata of a function, computed on its first use."""
+    return FunctionMetadata(func)
+
+
 def get_function_metadata(func: Callable, args, kwargs, max_params_length: int = 15) -> str:
     """
     Generate a concise string containing function/method metadata, including module, class (if applicable),
@@ -47,31 +211,12 @@ def get_function_metadata(func: Callable, args, kwargs, max_params_length: int =
         func (Callable): The function being described.
         args (tuple): Positional arguments passed to the function.
         kwargs (dict): Keyword arguments passed to the function.
-        max_params_length (int, optional): Maximum length for each argument's string representation. Defaults to 50.
+        max_params_length (int, optional): Maximum length for each argument's string representation. Defaults to 15.
 
     Returns:
         str: A formatted string containing function metadata.
     """
-    frame = inspect.currentframe().f_back.f_back
-    module_name = frame.f_globals["__name__"].split(".")[-1]  # Shortened module name
-    class_name = args[0].__class__.__name__ if args and hasattr(args[0], "__class__") else None
-
-    # Retrieve parameter names and values
-    bound_args = inspect.signature(func).bind(*args, **kwargs)
-    bound_args.apply_defaults()
-
-    def truncate(value: Any) -> str:
-        """Truncate string representation of a value if it exceeds max_length."""
-        value_str = repr(value)
-        return value_str if len(value_str) <= max_params_length else value_str[:max_params_length - 3] + '...'
-
-    # Don't truncate if max_params_length is negative
-    if max_params_length < 0:
-        params_info = ", ".join(f"{k}={v}" for k, v in bound_args.arguments.items())
-    else:
-        params_info = ", ".join(f"{k}={truncate(v)}" for k, v in bound_args.arguments.items())
-
-    return f"[{module_name}] {class_name + '.' if class_name else ''}{func.__name__}({params_info})"
+    return _get_cached_function_metadata(func).render(args, kwargs, max_params_length)
 
 
 def get_logger_from_decorator_param(param_logger: Union["Logger", str, Callable], args) -> Union["Logger", None]:
@@ -91,13 +236,90 @@ def get_logger_from_decorator_param(param_logger: Union["Logger", str, Callable]
     if isinstance(param_logger, Logger):
         return param_logger
     if isinstance(param_logger, str):
-        return Logger(identifier=param_logger, follow_logger_manager_rules=True)
+        return get_or_create_logger(param_logger)
     if param_logger is not None:
         instance = args[0]  # First argument of a bound method is typically `self`
         return param_logger(instance)
     return None
 
 
+def get_or_create_logger(identifier: str) -> "Logger":
+    """
+    Returns the registered logger with a given identifier, creating it (following the LoggerManager rules)
+    if there is none.
+
+    Args:
+        identifier (str): The logger identifier.
+
+    Returns:
+        Logger: The logger with this identifier.
+    """
+    from logger.logger import Logger
+    from logger.logger_manager import LoggerManager
+
+    logger_instance = LoggerManager.get_logger(identifier)
+    if logger_instance is None:
+        logger_instance = Logger(identifier=identifier, follow_logger_manager_rules=True)
+    return logger_instance
+
+
+class DecoratorLoggerResolver:
+    """
+    Resolves the logger of a decorator, caching the result so that the decorated calls do not pay for it:
+    - Logger: used as is.
+    - str: looked up (or created) once, on the first call.
+    - Callable: called once per instance (first positional argument), then cached for that instance.
+      The cache is keyed by identity, so that instances comparing equal do not share a logger, and an
+      entry is removed when its instance is garbage collected.
+    """
+
+    def __init__(self, param_logger: Union["Logger", str, Callable, None]):
+        """
+        Args:
+            param_logger (Logger | str | Callable | None): The logger parameter passed to the decorator.
+        """
+        from logger.logger import Logger
+
+        self.param_logger = param_logger
+        self._logger = param_logger if isinstance(param_logger, Logger) else None
+        self._lock = threading.Lock()
+        self._instance_loggers: dict[int, "Logger"] = {}  # Keyed by `id(instance)`
+
+    def __call__(self, args: tuple) -> Union["Logger", None]:
+        """
+        Returns the logger of a decorated call.
+
+        Args:
+            args (tuple): Positional arguments passed to the decorated function.
+
+        Returns:
+            Logger | None: The resolved logger, or None if no logger parameter was given.
+        """
+        if self._logger is not None:
+            return self._logger
+
+        if isinstance(self.param_logger, str):
+            with self._lock:
+                if self._logger is None:
+                    self._logger = get_or_create_logger(self.param_logger)
+            return self._logger
+
+        if self.param_logger is not None:
+            instance = args[0]  # First argument of a bound method is typically `self`
+            logger_instance = self._instance_loggers.get(id(instance))
+            if logger_instance is None:
+                logger_instance = self.param_logger(instance)
+                try:
+                    # Removes the entry before the identifier of the instance can be reused
+                    weakref.finalize(instance, self._instance_loggers.pop, id(instance), None)
+                except TypeError:
+                    # Instances which are not weakly referenceable are resolved on every call
+                    return logger_instance
+                self._instance_loggers[id(instance)] = logger_instance
+            return logger_instance
+        return None
+
+
 def unpack_dict(d: dict) -> dict:
     """
     Unpack all nested dictionaries into a single dictionary (non-recursive keys).
@@ -0,0 +1,244 @@
+# ====== Code Summary ======
+# This module traces nested `time_tracker(trace=True)` calls as spans. The current span is kept in a
+# `contextvars.ContextVar`, so each thread and each asyncio task has its own span stack without any lock:
+# a span started in a task (or a thread started with a copied context) becomes a child of the span that
+# was current where it was created.
+# - `Span`: One traced call, with its id, parent id, depth, inclusive and exclusive durations.
+# - `start_span` / `finish_span`: Push and pop spans of the current context.
+# - `ChromeTraceExporter`: Appends the finished spans to a Chrome trace-event JSON file
+#   (readable by chrome://tracing, Perfetto or speedscope). Spans are written in batches by a background
+#   thread, so that the traced calls never wait for (or fail because of) the trace file.
+
+# ====== Imports ======
+# Standard library imports
+from contextvars import ContextVar, Token
+from typing import Optional
+import itertools
+import threading
+import collections
+import atexit
+import json
+import time
+import sys
+import os
+
+# ====== Globals ======
+_current_span: ContextVar[Optional["Span"]] = ContextVar("logger_current_span", default=None)
+_span_ids = itertools.count(1)  # `next` is atomic, no lock is needed
+_exporter: Optional["ChromeTraceExporter"] = None
+
+
+# ====== Span ======
+class Span:
+    """
+    One traced call. Children add their inclusive duration to their parent when they finish,
+    which gives the exclusive duration of the parent.
+    """
+    __slots__ = (
+        "span_id", "parent", "parent_id", "depth", "name", "start", "end",
+        "children_durations", "lane", "token",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"]):
+        """
+        Args:
+            name (str): Name of the traced call.
+            parent (Span | None): The span current when this one started.
+        """
+        self.span_id = next(_span_ids)
+        self.parent = parent
+        self.parent_id = None if parent is None else parent.span_id
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.name = name
+        self.lane = _get_lane()
+        self.children_durations: list[float] = []  # `append` is atomic, children may run in other threads
+        self.token: Optional[Token] = None
+        self.end = None
+        self.start = time.perf_counter()
+
+    @property
+    def inclusive(self) -> float:
+        """Duration of the call, children included, in seconds."""
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def exclusive(self) -> float:
+        """Duration of the call minus the duration of its children, in seconds."""
+        # Children running concurrently (e.g. gathered tasks) may add up to more than the parent
+        return max(0.0, self.inclusive - sum(self.children_durations))
+
+    def describe(self) -> str:
+        """Returns the description of the span appended to the log message."""
+        return (
+            f" [span={self.span_id} parent={self.parent_id or '-'} depth={self.depth} "
+            f"inclusive={self.inclusive:.6f}s exclusive={self.exclusive:.6f}s]"
+        )
+
+
+# ====== Functions ======
+def _get_lane() -> int:
+    """
+    Returns the identifier of the row of the trace viewer where the current code runs:
+    the asyncio task if there is one, otherwise the thread.
+    """
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None and asyncio._get_running_loop() is not None:
+        task = asyncio.current_task()
+        if task is not None:
+            return id(task)
+    return threading.get_ident()
+
+
+def get_current_span() -> Optional[Span]:
+    """Returns the innermost span of the current thread or task, if any."""
+    return _current_span.get()
+
+
+def start_span(name: str, activate: bool = True) -> Span:
+    """
+    Starts a span as a child of the current span.
+
+    Args:
+        name (str): Name of the traced call.
+        activate (bool, optional): Make it the current span until it finishes. Generators must not
+            activate their span, as they share the context of their consumer. Defaults to True.
+
+    Returns:
+        Span: The started span.
+    """
+    span = Span(name, _current_span.get())
+    if activate:
+        span.token = _current_span.set(span)
+    return span
+
+
+def finish_span(span: Span) -> None:
+    """
+    Finishes a span: restores the previous current span, adds its duration to its parent and exports it.
+    Must be called in the context where the span was started.
+
+    Args:
+        span (Span): The span to finish.
+    """
+    span.end = time.perf_counter()
+    if span.token is not None:
+        _current_span.reset(span.token)
+        span.token = None
+    if span.parent is not None:
+        span.parent.children_durations.append(span.inclusive)
+        span.parent = None  # Finished spans do not keep their ancestors alive
+
+    if _exporter is not None:
+        _exporter.export(span)
+
+
+def set_trace_exporter(exporter: Optional["ChromeTraceExporter"]) -> None:
+    """
+    Sets the exporter receiving every finished span (None to stop exporting).
+
+    Args:
+        exporter (ChromeTraceExporter | None): The exporter.
+    """
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.close()
+
+
+# ====== Chrome Trace Exporter ======
+class ChromeTraceExporter:
+    """
+    Writes finished spans as complete events ("ph": "X") of the Chrome trace-event JSON array format.
+    Spans are buffered and written by a background thread every flush interval, or as soon as a batch is
+    full. The closing bracket of the array is optional in this format, so that the file can be appended to
+    by later runs. Write errors are reported on stderr and the spans of the failed batch are dropped.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, batch_size: int = 10000):
+        """
+        Args:
+            path (str): Path of the trace file (e.g. "logs/2025-01-01.trace.json").
+            flush_interval (float, optional): Maximum time in seconds a span stays buffered. Defaults to 1.0.
+            batch_size (int, optional): Number of buffered spans waking up the writer. Defaults to 10000.
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dropped_spans = 0  # Spans lost to write errors
+
+        self._pending = collections.deque()  # `append` and `popleft` are atomic
+        self._lock = threading.Lock()  # Serializes the writes
+        self._pid = os.getpid()
+        self._last_error: Optional[str] = None  # Reported once until a write succeeds
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name="logger-trace-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def export(self, span: Span) -> None:
+        """
+        Buffers a finished span for the writer thread. Never blocks on nor raises from the trace file.
+
+        Args:
+            span (Span): The finished span.
+        """
+        self._pending.append({
+            "name": span.name,
+            "cat": "time_tracker",
+            "ph": "X",
+            "ts": round(span.start * 1e6, 3),  # Microseconds, as expected by the trace viewers
+            "dur": round(span.inclusive * 1e6, 3),
+            "pid": self._pid,
+            "tid": span.lane,
+            "args": {
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "depth": span.depth,
+                "exclusive_us": round(span.exclusive * 1e6, 3),
+            },
+        })
+        if len(self._pending) >= self.batch_size:
+            self._wake_event.set()
+
+    def _write_loop(self) -> None:
+        """Background loop writing the buffered spans every flush interval, or when a batch is full."""
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.flush_interval)
+            self._wake_event.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered spans to the trace file, reporting a write error on stderr instead of raising."""
+        with self._lock:
+            lines = []
+            while self._pending:
+                lines.append(json.dumps(self._pending.popleft(), separators=(",", ":")) + ",\n")
+            if not lines:
+                return
+
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as trace_file:
+                    if trace_file.tell() == 0:
+                        trace_file.write("[\n")
+                    trace_file.writelines(lines)
+                self._last_error = None
+            except OSError as error:
+                self.dropped_spans += len(lines)
+                message = f"[trace] Unable to write '{self.path}': {error}"
+                if message != self._last_error:
+                    self._last_error = message
+                    print(f"{message} (spans are dropped until it succeeds)", file=sys.stderr)
+
+    def close(self) -> None:
+        """Stops the writer thread and writes the remaining spans. Safe to call several times."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+        self.flush()
+        atexit.unregister(self.close)